@@ -10,6 +10,7 @@ from config import Config
 from models import db
 from models.user import User
 from models.case import Case, Hearing, CaseTimeline
+from models.case_sequence import CaseNumberSequence
 from models.document import Document
 from models.task import Task
 from models.case_note import CaseNote
@@ -17,6 +18,14 @@ from models.notification import Notification
 from models.message import Message
 from models.courtroom import Courtroom
 from models.otp import OTPCode
+from models.rollup import CaseRollup, HearingRollup, PendencySnapshot, RollupBuild
+from models.tombstone import Tombstone
+from models.change_event import ChangeEvent
+from models.job import Job
+from utils.cache import register_cache_invalidation
+from utils.events import register_event_listeners
+from utils.rollups import register_rollup_listeners
+from utils.tombstones import register_tombstone_listeners
 
 
 def create_app():
@@ -25,6 +34,10 @@ def create_app():
 
     # ── Initialize Extensions ──────────────────────────────────────
     db.init_app(app)
+    register_rollup_listeners()
+    register_cache_invalidation()
+    register_tombstone_listeners()
+    register_event_listeners()
     CORS(app, origins=Config.CORS_ORIGINS, supports_credentials=True)
     jwt = JWTManager(app)
     mail = Mail(app)
@@ -44,6 +57,10 @@ def create_app():
     from routes.messages import messages_bp
     from routes.courtrooms import courtrooms_bp
     from routes.analytics import analytics_bp
+    from routes.dashboard import dashboard_bp
+    from routes.sync import sync_bp
+    from routes.events import events_bp
+    from routes.jobs import jobs_bp
 
     # Pass mail instance to notifications module
     init_mail(mail)
@@ -58,6 +75,10 @@ def create_app():
     app.register_blueprint(messages_bp)
     app.register_blueprint(courtrooms_bp)
     app.register_blueprint(analytics_bp)
+    app.register_blueprint(dashboard_bp)
+    app.register_blueprint(sync_bp)
+    app.register_blueprint(events_bp)
+    app.register_blueprint(jobs_bp)
 
     # ── Health Check ───────────────────────────────────────────────
     @app.route("/api/health", methods=["GET"])
@@ -0,0 +1,19 @@
+"""
+Rebuild pendency_snapshots for the last ten years from case filing dates and
+the status changes recorded on the case timeline.
+Run:  python backfill_pendency.py
+"""
+
+from app import create_app
+from utils.pendency import backfill_snapshots
+
+
+def main():
+    app = create_app()
+    with app.app_context():
+        rows = backfill_snapshots()
+        print(f"Backfilled {rows} pendency snapshot rows.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+"""
+Benchmark the analytics endpoints on the SQL query path against the
+columnar NumPy engine, on a synthetic load of BENCH_CASES cases.
+Run:  BENCH_CASES=1000000 python bench_analytics.py
+Synthetic rows are tagged BENCH- / "Bench Advocate" and deleted at the end.
+"""
+
+import os
+import random
+import time
+from datetime import date, timedelta
+
+from flask_jwt_extended import create_access_token
+
+from app import create_app
+from models import db
+from models.case import Case, Hearing
+from models.user import User
+
+BENCH_CASES = int(os.getenv("BENCH_CASES", 1_000_000))
+HEARINGS_PER_CASE = 2
+ADVOCATES = 200
+BATCH_SIZE = 10000
+REPEAT = 5
+
+CASE_TYPES = ["Civil", "Criminal", "Family", "Consumer", "Writ", "MACT"]
+STATUSES = ["filed", "under_review", "hearing_scheduled", "in_progress", "judgment_reserved", "closed", "dismissed"]
+ENDPOINTS = [
+    "dashboard",
+    "cases-trend",
+    "cases-by-type",
+    "daily-hearings",
+    "pendency",
+    "all-advocates",
+    "advocate-performance",
+]
+
+
+def auth_header(token):
+    return {"Authorization": f"Bearer {token}"}
+
+
+def seed_synthetic(rng):
+    advocates = [User(name=f"Bench Advocate {index}", role="advocate") for index in range(ADVOCATES)]
+    db.session.add_all(advocates)
+    db.session.commit()
+    advocate_ids = [advocate.id for advocate in advocates]
+
+    today = date.today()
+    for start in range(0, BENCH_CASES, BATCH_SIZE):
+        rows = [
+            {
+                "case_number": f"BENCH-{index}",
+                "title": "Bench case",
+                "case_type": rng.choice(CASE_TYPES),
+                "status": rng.choice(STATUSES),
+                "petitioner": "Bench Petitioner",
+                "respondent": "Bench Respondent",
+                "advocate_id": rng.choice(advocate_ids),
+                "filing_date": today - timedelta(days=rng.randint(0, 3 * 365)),
+            }
+            for index in range(start, min(start + BATCH_SIZE, BENCH_CASES))
+        ]
+        db.session.execute(Case.__table__.insert(), rows)
+        db.session.commit()
+
+    last_id = 0
+    while True:
+        case_ids = [
+            case_id
+            for (case_id,) in db.session.query(Case.id)
+            .filter(Case.id > last_id, Case.case_number.like("BENCH-%"))
+            .order_by(Case.id.asc())
+            .limit(BATCH_SIZE)
+        ]
+        if not case_ids:
+            break
+        rows = [
+            {
+                "case_id": case_id,
+                "date": today + timedelta(days=rng.randint(-180, 60)),
+                "type": "Arguments",
+            }
+            for case_id in case_ids
+            for _ in range(HEARINGS_PER_CASE)
+        ]
+        db.session.execute(Hearing.__table__.insert(), rows)
+        db.session.commit()
+        last_id = case_ids[-1]
+
+    return advocate_ids
+
+
+def remove_synthetic():
+    bench_cases = db.session.query(Case.id).filter(Case.case_number.like("BENCH-%"))
+    Hearing.query.filter(Hearing.case_id.in_(bench_cases.scalar_subquery())).delete(synchronize_session=False)
+    Case.query.filter(Case.case_number.like("BENCH-%")).delete(synchronize_session=False)
+    User.query.filter(User.name.like("Bench Advocate %")).delete(synchronize_session=False)
+    db.session.commit()
+
+
+def canonical(value):
+    """Order-insensitive form of a JSON body; the backends may list groups differently."""
+    if isinstance(value, dict):
+        return {key: canonical(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return sorted((canonical(item) for item in value), key=repr)
+    return value
+
+
+def time_endpoint(client, path, headers):
+    timings = []
+    for _ in range(REPEAT):
+        started = time.perf_counter()
+        response = client.get(path, headers=headers)
+        timings.append(time.perf_counter() - started)
+        assert response.status_code == 200, (path, response.status_code)
+    return min(timings) * 1000, response.get_json()
+
+
+def main():
+    app = create_app()
+    app.config["ANALYTICS_CACHE_TTL"] = 0
+    client = app.test_client()
+
+    with app.app_context():
+        court = User.query.filter_by(role="court").first()
+        if not court:
+            print("Need at least one court user; run seed.py first.")
+            return
+
+        try:
+            print(f"Seeding {BENCH_CASES} synthetic cases...")
+            started = time.perf_counter()
+            advocate_ids = seed_synthetic(random.Random(42))
+            print(f"  seeded in {time.perf_counter() - started:.1f}s")
+
+            headers = {
+                "court": auth_header(create_access_token(identity=str(court.id))),
+                "advocate": auth_header(create_access_token(identity=str(advocate_ids[0]))),
+            }
+
+            from utils.columnar import columnar_engine
+
+            started = time.perf_counter()
+            columnar_engine()
+            print(f"  columnar snapshot loaded in {time.perf_counter() - started:.1f}s\n")
+
+            print(f"{'endpoint':<24}{'sql ms':>10}{'columnar ms':>14}{'speedup':>10}  match")
+            for endpoint in ENDPOINTS:
+                path = f"/api/analytics/{endpoint}"
+                role = "advocate" if endpoint == "advocate-performance" else "court"
+                results = {}
+                for backend in ("sql", "columnar"):
+                    app.config["ANALYTICS_BACKEND"] = backend
+                    results[backend] = time_endpoint(client, path, headers[role])
+                (sql_ms, sql_body), (columnar_ms, columnar_body) = results["sql"], results["columnar"]
+                speedup = sql_ms / columnar_ms if columnar_ms else float("inf")
+                print(f"{endpoint:<24}{sql_ms:>10.1f}{columnar_ms:>14.1f}{speedup:>9.1f}x  {canonical(sql_body) == canonical(columnar_body)}")
+        finally:
+            print("\nRemoving synthetic rows...")
+            db.session.rollback()
+            remove_synthetic()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Benchmark the case report PDF writer on synthetic cases with long timelines.
+Run:  BENCH_REPORTS=50 BENCH_TIMELINE=1000 python bench_pdf.py
+Cases are built in memory only; nothing is read from or written to the database.
+"""
+
+import os
+import random
+import time
+from datetime import date, datetime, timedelta
+
+import app  # noqa: F401  imports every model, so the relationships resolve
+from models.case import Case, CaseTimeline, Hearing
+from models.document import Document
+from models.user import User
+from utils.exporters import build_case_report_lines, generate_simple_pdf
+
+BENCH_REPORTS = int(os.getenv("BENCH_REPORTS", 50))
+BENCH_TIMELINE = int(os.getenv("BENCH_TIMELINE", 1000))
+HEARINGS_PER_CASE = 40
+DOCUMENTS_PER_CASE = 25
+
+EVENTS = ["Case Filed", "Hearing Scheduled", "Hearing Updated", "Case Status Updated", "Document Uploaded"]
+WORDS = (
+    "the petitioner submitted affidavit respondent counsel sought adjournment court directed filing of "
+    "written statement within four weeks interim order extended notice issued returnable list for arguments"
+).split()
+
+
+def sentence(rng, low, high):
+    return " ".join(rng.choice(WORDS) for _ in range(rng.randint(low, high))).capitalize() + "."
+
+
+def synthetic_case(rng, index):
+    advocate = User(name=f"Bench Advocate {index}", email=f"bench{index}@example.com", role="advocate")
+    start = date(2020, 1, 1) + timedelta(days=rng.randint(0, 900))
+    case = Case(
+        id=index,
+        case_number=f"BENCH/{index}/2024",
+        title=f"Bench Petitioner {index} v. State",
+        description=" ".join(sentence(rng, 8, 20) for _ in range(6)),
+        case_type=rng.choice(["Civil", "Criminal", "Writ"]),
+        status="in_progress",
+        priority="medium",
+        petitioner=f"Bench Petitioner {index}",
+        respondent="State",
+        filing_date=start,
+        advocate=advocate,
+    )
+    case.hearings = [
+        Hearing(
+            date=start + timedelta(days=30 * number),
+            type="Arguments",
+            status="completed",
+            location=f"Court Room {rng.randint(1, 12)}",
+            start_time=datetime.combine(start + timedelta(days=30 * number), datetime.min.time()),
+            notes=sentence(rng, 5, 30),
+        )
+        for number in range(HEARINGS_PER_CASE)
+    ]
+    case.documents = [
+        Document(
+            title=f"Exhibit {number}",
+            file_type="pdf",
+            file_size="1.2 MB",
+            verified=number % 2 == 0,
+            uploader=advocate,
+            uploaded_at=datetime.combine(start, datetime.min.time()),
+        )
+        for number in range(DOCUMENTS_PER_CASE)
+    ]
+    case.timeline = [
+        CaseTimeline(
+            date=start + timedelta(days=number),
+            event=rng.choice(EVENTS),
+            description=sentence(rng, 4, 40),
+        )
+        for number in range(BENCH_TIMELINE)
+    ]
+    return case
+
+
+def main():
+    rng = random.Random(42)
+    print(f"Building {BENCH_REPORTS} cases with {BENCH_TIMELINE}-entry timelines...")
+    reports = [
+        (f"Case Report - {case.case_number}", build_case_report_lines(case))
+        for case in (synthetic_case(rng, index) for index in range(1, BENCH_REPORTS + 1))
+    ]
+
+    results = {}
+    for label, compress in (("flate", True), ("plain", False)):
+        started = time.perf_counter()
+        sizes = [len(generate_simple_pdf(title, lines, compress=compress)) for title, lines in reports]
+        elapsed = time.perf_counter() - started
+        results[label] = (sum(sizes) / len(sizes), elapsed)
+
+    print(f"\n{'streams':<10}{'avg KB':>10}{'ms/report':>12}{'reports/s':>12}")
+    for label, (average_size, elapsed) in results.items():
+        print(
+            f"{label:<10}{average_size / 1024:>10.1f}{elapsed * 1000 / BENCH_REPORTS:>12.1f}"
+            f"{BENCH_REPORTS / elapsed:>12.1f}"
+        )
+    print(f"\nCompression shrinks reports {results['plain'][0] / results['flate'][0]:.1f}x.")
+
+
+if __name__ == "__main__":
+    main()
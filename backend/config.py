@@ -26,5 +26,46 @@ class Config:
     UPLOAD_FOLDER = os.path.join(os.path.dirname(__file__), "uploads")
     MAX_CONTENT_LENGTH = 50 * 1024 * 1024  # 50 MB
 
+    # ── Analytics ───────────────────────────────────────────────────
+    # Where court-wide aggregates come from: "rollups" reads the rollup tables
+    # (see rebuild_rollups.py), "sql" scans cases and hearings, and "columnar"
+    # uses the in-memory NumPy snapshot in utils/columnar.py.
+    ANALYTICS_BACKEND = os.getenv("ANALYTICS_BACKEND", "rollups").lower()
+    # Seconds a cached analytics response is served before recomputing (0 disables).
+    ANALYTICS_CACHE_TTL = int(os.getenv("ANALYTICS_CACHE_TTL", 10))
+
+    # ── Case reports ────────────────────────────────────────────────
+    # Rendered PDF reports are kept here (one per case, replaced when the case
+    # changes) so every worker can serve them without re-rendering.
+    REPORT_CACHE_DIR = os.getenv("REPORT_CACHE_DIR", os.path.join(os.path.dirname(__file__), "report_cache"))
+    # Processes rendering bulk report bundles (0 = one per CPU core).
+    REPORT_WORKERS = int(os.getenv("REPORT_WORKERS", 0))
+    # Most cases one bulk report request may bundle.
+    BULK_REPORT_LIMIT = int(os.getenv("BULK_REPORT_LIMIT", 1000))
+
+    # ── Background jobs (run_jobs.py) ───────────────────────────────
+    # Worker processes started by run_jobs.py.
+    JOB_WORKERS = int(os.getenv("JOB_WORKERS", 2))
+    # Seconds an idle worker waits before looking for queued jobs again.
+    JOB_POLL_INTERVAL = float(os.getenv("JOB_POLL_INTERVAL", 1.0))
+    # Seconds between a running job's heartbeats; a job silent for
+    # JOB_STALE_AFTER is assumed to have lost its worker and is queued again.
+    JOB_HEARTBEAT = int(os.getenv("JOB_HEARTBEAT", 15))
+    JOB_STALE_AFTER = timedelta(seconds=int(os.getenv("JOB_STALE_AFTER", 120)))
+    # Job output files, one directory per job id.
+    JOB_RESULTS_DIR = os.getenv("JOB_RESULTS_DIR", os.path.join(os.path.dirname(__file__), "job_results"))
+
+    # ── Dashboard ───────────────────────────────────────────────────
+    # Threads (each with its own DB connection) used to build bootstrap sections.
+    DASHBOARD_BOOTSTRAP_WORKERS = int(os.getenv("DASHBOARD_BOOTSTRAP_WORKERS", 4))
+
+    # ── Live events (/api/events) ───────────────────────────────────
+    # Changes buffered per open stream before the client is told to resync.
+    EVENTS_QUEUE_SIZE = int(os.getenv("EVENTS_QUEUE_SIZE", 256))
+    # Seconds between each worker's polls of the change_events table.
+    EVENTS_POLL_INTERVAL = float(os.getenv("EVENTS_POLL_INTERVAL", 0.5))
+    # Seconds between keep-alive comments on an idle stream.
+    EVENTS_HEARTBEAT = int(os.getenv("EVENTS_HEARTBEAT", 15))
+
     # ── CORS ────────────────────────────────────────────────────────
     CORS_ORIGINS = os.getenv("CORS_ORIGINS", "http://localhost:5173").split(",")
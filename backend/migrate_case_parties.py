@@ -0,0 +1,80 @@
+"""
+Link existing cases to the citizen account behind their petitioner.
+Run:  python migrate_case_parties.py
+"""
+
+from sqlalchemy import inspect, text
+
+from app import create_app
+from models import db
+from models.case import Case
+from models.user import User, normalize_name
+
+BATCH_SIZE = 1000
+
+
+def ensure_schema():
+    insp = inspect(db.engine)
+    columns = {col["name"] for col in insp.get_columns("cases")}
+    if "petitioner_user_id" not in columns:
+        print("Adding cases.petitioner_user_id...")
+        db.session.execute(text("ALTER TABLE cases ADD COLUMN petitioner_user_id INT NULL"))
+        db.session.execute(
+            text(
+                "ALTER TABLE cases ADD CONSTRAINT fk_cases_petitioner_user "
+                "FOREIGN KEY (petitioner_user_id) REFERENCES users(id) ON DELETE SET NULL"
+            )
+        )
+
+    indexes = {index["name"] for index in insp.get_indexes("cases")}
+    if "ix_cases_petitioner_user_created_at_id" not in indexes:
+        print("Adding index on (petitioner_user_id, created_at, id)...")
+        db.session.execute(
+            text("CREATE INDEX ix_cases_petitioner_user_created_at_id ON cases (petitioner_user_id, created_at, id)")
+        )
+    db.session.commit()
+
+
+def backfill_case_parties(batch_size=BATCH_SIZE):
+    """Fill petitioner_user_id for unlinked cases in primary-key batches."""
+    citizens = {}
+    for user_id, name in db.session.query(User.id, User.name).filter(User.role == "public"):
+        citizens.setdefault(normalize_name(name), user_id)
+
+    linked = 0
+    last_id = 0
+    while True:
+        rows = (
+            db.session.query(Case.id, Case.petitioner)
+            .filter(Case.id > last_id, Case.petitioner_user_id.is_(None))
+            .order_by(Case.id.asc())
+            .limit(batch_size)
+            .all()
+        )
+        if not rows:
+            break
+
+        updates = [
+            {"id": case_id, "petitioner_user_id": citizens[normalize_name(petitioner)]}
+            for case_id, petitioner in rows
+            if normalize_name(petitioner) in citizens
+        ]
+        if updates:
+            db.session.bulk_update_mappings(Case, updates)
+            db.session.commit()
+            linked += len(updates)
+        last_id = rows[-1].id
+
+    return linked
+
+
+def main():
+    app = create_app()
+    with app.app_context():
+        ensure_schema()
+        linked = backfill_case_parties()
+        print(f"Linked {linked} cases to citizen accounts.")
+
+
+if __name__ == "__main__":
+    main()
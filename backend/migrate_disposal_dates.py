@@ -0,0 +1,92 @@
+"""
+Add cases.disposal_date and fill it for closed and dismissed cases from
+their "Case Status Updated" timeline entries.
+Run:  python migrate_disposal_dates.py
+"""
+
+from sqlalchemy import func, inspect, text
+
+from app import create_app
+from models import db
+from models.case import DISPOSED_STATUSES, Case, CaseTimeline
+
+BATCH_SIZE = 1000
+
+
+def ensure_schema():
+    insp = inspect(db.engine)
+    columns = {col["name"] for col in insp.get_columns("cases")}
+    if "disposal_date" not in columns:
+        print("Adding cases.disposal_date...")
+        db.session.execute(text("ALTER TABLE cases ADD COLUMN disposal_date DATE NULL"))
+
+    indexes = {index["name"] for index in insp.get_indexes("cases")}
+    if "ix_cases_disposal_date" not in indexes:
+        print("Adding index on disposal_date...")
+        db.session.execute(text("CREATE INDEX ix_cases_disposal_date ON cases (disposal_date)"))
+    db.session.commit()
+
+
+def status_label(status):
+    return status.replace("_", " ").title()
+
+
+def backfill_disposal_dates(batch_size=BATCH_SIZE):
+    """Use the latest status change into the case's current status, else its latest timeline entry."""
+    filled = 0
+    last_id = 0
+    while True:
+        rows = (
+            db.session.query(Case.id, Case.status, Case.filing_date)
+            .filter(
+                Case.id > last_id,
+                Case.status.in_(DISPOSED_STATUSES),
+                Case.disposal_date.is_(None),
+            )
+            .order_by(Case.id.asc())
+            .limit(batch_size)
+            .all()
+        )
+        if not rows:
+            break
+
+        case_ids = [case_id for case_id, _, _ in rows]
+        status_changes = {}
+        for case_id, description, event_date in db.session.query(
+            CaseTimeline.case_id, CaseTimeline.description, CaseTimeline.date
+        ).filter(
+            CaseTimeline.case_id.in_(case_ids),
+            CaseTimeline.event == "Case Status Updated",
+        ):
+            status_changes.setdefault(case_id, []).append((description or "", event_date))
+        latest_entries = dict(
+            db.session.query(CaseTimeline.case_id, func.max(CaseTimeline.date))
+            .filter(CaseTimeline.case_id.in_(case_ids))
+            .group_by(CaseTimeline.case_id)
+        )
+
+        updates = []
+        for case_id, status, filing_date in rows:
+            suffix = f"to {status_label(status)}."
+            matches = [event_date for description, event_date in status_changes.get(case_id, []) if description.endswith(suffix)]
+            disposal_date = max(matches) if matches else latest_entries.get(case_id) or filing_date
+            updates.append({"id": case_id, "disposal_date": disposal_date})
+
+        db.session.bulk_update_mappings(Case, updates)
+        db.session.commit()
+        filled += len(updates)
+        last_id = rows[-1].id
+
+    return filled
+
+
+def main():
+    app = create_app()
+    with app.app_context():
+        ensure_schema()
+        filled = backfill_disposal_dates()
+        print(f"Filled disposal dates for {filled} cases.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+Add the updated_at change-tracking column (and its index) to existing tables.
+Run:  python migrate_updated_at.py
+"""
+
+from sqlalchemy import inspect, text
+
+from app import create_app
+from models import db
+
+# table -> (index name, indexed columns); courtrooms is too small to need one
+TRACKED_TABLES = {
+    "cases": ("ix_cases_updated_at", "updated_at"),
+    "hearings": ("ix_hearings_updated_at", "updated_at"),
+    "documents": ("ix_documents_updated_at", "updated_at"),
+    "tasks": ("ix_tasks_user_updated_at", "user_id, updated_at"),
+    "case_notes": ("ix_case_notes_user_updated_at", "user_id, updated_at"),
+    "notifications": ("ix_notifications_user_updated_at", "user_id, updated_at"),
+    "courtrooms": (None, None),
+}
+
+
+def ensure_updated_at(table_name, index_name, index_columns):
+    insp = inspect(db.engine)
+    columns = {col["name"] for col in insp.get_columns(table_name)}
+    if "updated_at" not in columns:
+        print(f"Adding {table_name}.updated_at...")
+        db.session.execute(
+            text(
+                f"ALTER TABLE {table_name} ADD COLUMN updated_at DATETIME "
+                "DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP"
+            )
+        )
+
+    indexes = {index["name"] for index in insp.get_indexes(table_name)}
+    if index_name and index_name not in indexes:
+        print(f"Adding index {index_name}...")
+        db.session.execute(text(f"CREATE INDEX {index_name} ON {table_name} ({index_columns})"))
+    db.session.commit()
+
+
+def main():
+    app = create_app()
+    with app.app_context():
+        for table_name, (index_name, index_columns) in TRACKED_TABLES.items():
+            ensure_updated_at(table_name, index_name, index_columns)
+        print("updated_at columns are in place.")
+
+
+if __name__ == "__main__":
+    main()
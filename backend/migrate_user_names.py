@@ -0,0 +1,66 @@
+"""
+Populate users.name_normalized for accounts created before the column existed.
+Run:  python migrate_user_names.py
+"""
+
+from sqlalchemy import inspect, text
+
+from app import create_app
+from models import db
+from models.user import User, normalize_name
+
+BATCH_SIZE = 1000
+
+
+def ensure_schema():
+    insp = inspect(db.engine)
+    columns = {col["name"] for col in insp.get_columns("users")}
+    if "name_normalized" not in columns:
+        print("Adding users.name_normalized...")
+        db.session.execute(text("ALTER TABLE users ADD COLUMN name_normalized VARCHAR(150) NULL"))
+
+    indexes = {index["name"] for index in insp.get_indexes("users")}
+    if "ix_users_role_name_normalized" not in indexes:
+        print("Adding index on (role, name_normalized)...")
+        db.session.execute(text("CREATE INDEX ix_users_role_name_normalized ON users (role, name_normalized)"))
+    db.session.commit()
+
+
+def backfill_user_names(batch_size=BATCH_SIZE):
+    updated = 0
+    last_id = 0
+    while True:
+        rows = (
+            db.session.query(User.id, User.name, User.name_normalized)
+            .filter(User.id > last_id)
+            .order_by(User.id.asc())
+            .limit(batch_size)
+            .all()
+        )
+        if not rows:
+            break
+
+        updates = [
+            {"id": user_id, "name_normalized": normalize_name(name)}
+            for user_id, name, current in rows
+            if current != normalize_name(name)
+        ]
+        if updates:
+            db.session.bulk_update_mappings(User, updates)
+            db.session.commit()
+            updated += len(updates)
+        last_id = rows[-1].id
+
+    return updated
+
+
+def main():
+    app = create_app()
+    with app.app_context():
+        ensure_schema()
+        updated = backfill_user_names()
+        print(f"Normalized {updated} user names.")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,42 @@
+from datetime import date
+
+from sqlalchemy.orm import joinedload, selectinload, validates
+
 from models import db
+from models.fields import SparseField, column_field, iso, plain_fields
+from models.user import User
+
+DISPOSED_STATUSES = ("closed", "dismissed")
+
+
+def case_detail_options():
+    """Loader options that fetch a case's full detail graph in four round trips.
+
+    The case and its advocate come back in one joined SELECT; hearings,
+    timeline and documents (with uploaders joined) each follow as a single
+    IN-list SELECT, no matter how many rows they hold.
+    """
+    from models.document import Document
+
+    return (
+        joinedload(Case.advocate),
+        selectinload(Case.hearings),
+        selectinload(Case.timeline),
+        selectinload(Case.documents).joinedload(Document.uploader),
+    )
 
 
 class Case(db.Model):
     __tablename__ = "cases"
+    __table_args__ = (
+        db.Index("ix_cases_created_at_id", "created_at", "id"),
+        db.Index("ix_cases_advocate_created_at_id", "advocate_id", "created_at", "id"),
+        db.Index("ix_cases_filing_date_status", "filing_date", "status"),
+        db.Index("ix_cases_petitioner_user_created_at_id", "petitioner_user_id", "created_at", "id"),
+        db.Index("ix_cases_updated_at", "updated_at"),
+        db.Index("ix_cases_disposal_date", "disposal_date"),
+        db.Index("ft_cases_search", "case_number", "title", "petitioner", "respondent", "case_type", mysql_prefix="FULLTEXT"),
+    )
 
     id = db.Column(db.Integer, primary_key=True, autoincrement=True)
     case_number = db.Column(db.String(50), unique=True, nullable=False)
@@ -16,40 +50,44 @@ class Case(db.Model):
     priority = db.Column(db.String(10), default="medium")  # high, medium, low
     petitioner = db.Column(db.String(200), nullable=False)
     respondent = db.Column(db.String(200), nullable=False)
+    petitioner_user_id = db.Column(db.Integer, db.ForeignKey("users.id"), nullable=True)  # citizen account behind petitioner
     advocate_id = db.Column(db.Integer, db.ForeignKey("users.id"), nullable=True)
     judge = db.Column(db.String(200), nullable=True)
     courtroom_id = db.Column(db.Integer, db.ForeignKey("courtrooms.id"), nullable=True)
     court_room_name = db.Column(db.String(100), nullable=True)
     next_hearing = db.Column(db.DateTime, nullable=True)
     filing_date = db.Column(db.Date, nullable=False)
+    disposal_date = db.Column(db.Date, nullable=True)  # set when the case is closed or dismissed
     created_at = db.Column(db.DateTime, server_default=db.func.now())
+    updated_at = db.Column(db.DateTime, server_default=db.func.now(), onupdate=db.func.now())
 
     # Relationships
-    hearings = db.relationship("Hearing", backref="case", lazy=True, cascade="all, delete-orphan")
-    timeline = db.relationship("CaseTimeline", backref="case", lazy=True, cascade="all, delete-orphan")
-    documents = db.relationship("Document", backref="case", lazy=True, cascade="all, delete-orphan")
+    hearings = db.relationship(
+        "Hearing", backref="case", lazy=True, cascade="all, delete-orphan",
+        order_by="[Hearing.date, Hearing.start_time, Hearing.id]",
+    )
+    timeline = db.relationship(
+        "CaseTimeline", backref="case", lazy=True, cascade="all, delete-orphan",
+        order_by="[CaseTimeline.date, CaseTimeline.created_at, CaseTimeline.id]",
+    )
+    documents = db.relationship(
+        "Document", backref="case", lazy=True, cascade="all, delete-orphan",
+        order_by="[Document.uploaded_at.desc(), Document.id.desc()]",
+    )
     tasks = db.relationship("Task", backref="case", lazy=True, cascade="all, delete-orphan")
     notes = db.relationship("CaseNote", backref="case", lazy=True, cascade="all, delete-orphan")
 
-    def to_dict(self, include_details=False):
-        data = {
-            "id": f"CASE-{self.filing_date.year}-{self.id:03d}" if self.filing_date else str(self.id),
-            "databaseId": self.id,
-            "caseNumber": self.case_number,
-            "title": self.title,
-            "description": self.description,
-            "caseType": self.case_type,
-            "status": self.status,
-            "priority": self.priority,
-            "petitioner": self.petitioner,
-            "respondent": self.respondent,
-            "advocateId": self.advocate_id,
-            "judge": self.judge,
-            "courtroomId": self.courtroom_id,
-            "courtRoom": self.court_room_name,
-            "nextHearing": self.next_hearing.isoformat() if self.next_hearing else None,
-            "filingDate": self.filing_date.isoformat() if self.filing_date else None,
-        }
+    @validates("status")
+    def _track_disposal_date(self, key, value):
+        if value in DISPOSED_STATUSES:
+            if self.disposal_date is None:
+                self.disposal_date = date.today()
+        else:
+            self.disposal_date = None
+        return value
+
+    def to_dict(self, include_details=False, detail_limit=None):
+        data = plain_fields(self, CASE_FIELDS)
         if self.advocate:
             data["advocate"] = {
                 "id": self.advocate.id,
@@ -57,14 +95,69 @@ class Case(db.Model):
                 "email": self.advocate.email,
             }
         if include_details:
-            data["hearings"] = [h.to_dict() for h in sorted(self.hearings, key=lambda item: ((item.date or 0), (item.start_time or 0)))]
-            data["timeline"] = [t.to_dict() for t in sorted(self.timeline, key=lambda item: (item.date or 0, item.created_at or 0))]
-            data["documents"] = [d.to_dict() for d in sorted(self.documents, key=lambda item: item.uploaded_at or 0, reverse=True)]
+            if detail_limit:
+                from models.document import Document
+
+                hearings = Hearing.for_case(self.id, limit=detail_limit)
+                timeline = CaseTimeline.for_case(self.id, limit=detail_limit)
+                documents = Document.for_case(self.id, limit=detail_limit)
+            else:
+                hearings, timeline, documents = self.hearings, self.timeline, self.documents
+            data["hearings"] = [h.to_dict() for h in hearings]
+            data["timeline"] = [t.to_dict() for t in timeline]
+            data["documents"] = [d.to_dict() for d in documents]
         return data
 
 
+def case_display_id(case_id, filing_date):
+    return f"CASE-{filing_date.year}-{case_id:03d}" if filing_date else str(case_id)
+
+
+_advocate = User.__table__.alias("advocate")
+
+# Serialized case keys, in to_dict order; ``?fields=`` may name any of them.
+CASE_FIELDS = {
+    "id": SparseField((Case.id, Case.filing_date), lambda row: case_display_id(row.id, row.filing_date)),
+    "databaseId": column_field(Case.id),
+    "caseNumber": column_field(Case.case_number),
+    "title": column_field(Case.title),
+    "description": column_field(Case.description),
+    "caseType": column_field(Case.case_type),
+    "status": column_field(Case.status),
+    "priority": column_field(Case.priority),
+    "petitioner": column_field(Case.petitioner),
+    "respondent": column_field(Case.respondent),
+    "petitionerUserId": column_field(Case.petitioner_user_id),
+    "advocateId": column_field(Case.advocate_id),
+    "judge": column_field(Case.judge),
+    "courtroomId": column_field(Case.courtroom_id),
+    "courtRoom": column_field(Case.court_room_name),
+    "nextHearing": column_field(Case.next_hearing, iso),
+    "filingDate": column_field(Case.filing_date, iso),
+    "disposalDate": column_field(Case.disposal_date, iso),
+    "advocate": SparseField(
+        (
+            _advocate.c.id.label("advocate_ref"),
+            _advocate.c.name.label("advocate_name"),
+            _advocate.c.email.label("advocate_email"),
+        ),
+        lambda row: (
+            {"id": row.advocate_ref, "name": row.advocate_name, "email": row.advocate_email}
+            if row.advocate_ref
+            else None
+        ),
+        lambda query: query.outerjoin(_advocate, Case.advocate_id == _advocate.c.id),
+    ),
+}
+
+
 class Hearing(db.Model):
     __tablename__ = "hearings"
+    __table_args__ = (
+        db.Index("ix_hearings_case_date_start", "case_id", "date", "start_time"),
+        db.Index("ix_hearings_date_status", "date", "status"),
+        db.Index("ix_hearings_updated_at", "updated_at"),
+    )
 
     id = db.Column(db.Integer, primary_key=True, autoincrement=True)
     case_id = db.Column(db.Integer, db.ForeignKey("cases.id"), nullable=False)
@@ -75,20 +168,22 @@ class Hearing(db.Model):
     location = db.Column(db.String(200), nullable=True)
     start_time = db.Column(db.DateTime, nullable=True)
     end_time = db.Column(db.DateTime, nullable=True)
+    updated_at = db.Column(db.DateTime, server_default=db.func.now(), onupdate=db.func.now())
 
     def to_dict(self):
-        return {
-            "id": self.id,
-            "caseId": self.case_id,
-            "date": self.date.isoformat() if self.date else None,
-            "type": self.type,
-            "status": self.status,
-            "notes": self.notes or "",
-            "location": self.location,
-            "court": self.location,
-            "startTime": self.start_time.isoformat() if self.start_time else None,
-            "endTime": self.end_time.isoformat() if self.end_time else None,
-        }
+        return plain_fields(self, HEARING_FIELDS)
+
+    @staticmethod
+    def for_case(case_id, limit=None):
+        """Hearings in schedule order; with ``limit``, only the latest ``limit``."""
+        if not limit:
+            return Hearing.query.filter_by(case_id=case_id).order_by(
+                Hearing.date.asc(), Hearing.start_time.asc(), Hearing.id.asc()
+            ).all()
+        latest = Hearing.query.filter_by(case_id=case_id).order_by(
+            Hearing.date.desc(), Hearing.start_time.desc(), Hearing.id.desc()
+        ).limit(limit).all()
+        return latest[::-1]
 
     def to_calendar_event(self):
         case = self.case
@@ -103,8 +198,23 @@ class Hearing(db.Model):
         }
 
 
+HEARING_FIELDS = {
+    "id": column_field(Hearing.id),
+    "caseId": column_field(Hearing.case_id),
+    "date": column_field(Hearing.date, iso),
+    "type": column_field(Hearing.type),
+    "status": column_field(Hearing.status),
+    "notes": column_field(Hearing.notes, lambda notes: notes or ""),
+    "location": column_field(Hearing.location),
+    "court": column_field(Hearing.location),
+    "startTime": column_field(Hearing.start_time, iso),
+    "endTime": column_field(Hearing.end_time, iso),
+}
+
+
 class CaseTimeline(db.Model):
     __tablename__ = "case_timeline"
+    __table_args__ = (db.Index("ix_case_timeline_case_date_created", "case_id", "date", "created_at"),)
 
     id = db.Column(db.Integer, primary_key=True, autoincrement=True)
     case_id = db.Column(db.Integer, db.ForeignKey("cases.id"), nullable=False)
@@ -119,3 +229,15 @@ class CaseTimeline(db.Model):
             "event": self.event,
             "description": self.description or "",
         }
+
+    @staticmethod
+    def for_case(case_id, limit=None):
+        """Timeline in chronological order; with ``limit``, only the latest ``limit``."""
+        if not limit:
+            return CaseTimeline.query.filter_by(case_id=case_id).order_by(
+                CaseTimeline.date.asc(), CaseTimeline.created_at.asc(), CaseTimeline.id.asc()
+            ).all()
+        latest = CaseTimeline.query.filter_by(case_id=case_id).order_by(
+            CaseTimeline.date.desc(), CaseTimeline.created_at.desc(), CaseTimeline.id.desc()
+        ).limit(limit).all()
+        return latest[::-1]
@@ -3,6 +3,7 @@ from models import db
 
 class CaseNote(db.Model):
     __tablename__ = "case_notes"
+    __table_args__ = (db.Index("ix_case_notes_user_updated_at", "user_id", "updated_at"),)
 
     id = db.Column(db.Integer, primary_key=True, autoincrement=True)
     case_id = db.Column(db.Integer, db.ForeignKey("cases.id"), nullable=False)
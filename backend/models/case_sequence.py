@@ -0,0 +1,61 @@
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+from models import db
+
+
+class CaseNumberSequence(db.Model):
+    __tablename__ = "case_number_sequences"
+
+    year = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    last_value = db.Column(db.Integer, nullable=False, default=0)
+
+    @staticmethod
+    def next_value(year, prefix):
+        """Reserve the next number for ``year`` under a row lock held until commit."""
+        sequence = CaseNumberSequence._locked(year, prefix)
+        sequence.last_value += 1
+        db.session.flush()
+        return sequence.last_value
+
+    @staticmethod
+    def advance_to(year, prefix, value):
+        """Make sure numbers generated for ``year`` come after an explicitly supplied ``value``."""
+        sequence = CaseNumberSequence._locked(year, prefix)
+        if value > sequence.last_value:
+            sequence.last_value = value
+            db.session.flush()
+
+    @staticmethod
+    def _locked(year, prefix):
+        """The row for ``year``, locked until commit, created first if it is missing.
+
+        The row is never locked while missing: on InnoDB a SELECT ... FOR UPDATE
+        that finds nothing takes a gap lock, and two workers holding it would
+        deadlock on their INSERTs. Instead the row is inserted idempotently,
+        so concurrent creators just queue on the new row's record lock.
+        """
+        if db.session.query(CaseNumberSequence.year).filter_by(year=year).scalar() is None:
+            values = {"year": year, "last_value": CaseNumberSequence._highest_issued(prefix)}
+            if db.session.get_bind().dialect.name == "mysql":
+                statement = mysql_insert(CaseNumberSequence).values(**values)
+                statement = statement.on_duplicate_key_update(year=statement.inserted.year)
+            else:
+                statement = sqlite_insert(CaseNumberSequence).values(**values).on_conflict_do_nothing()
+            db.session.execute(statement)
+        return CaseNumberSequence.query.filter_by(year=year).with_for_update().populate_existing().one()
+
+    @staticmethod
+    def _highest_issued(prefix):
+        """Start a new year after any numbers issued before the sequence existed."""
+        from models.case import Case
+
+        latest = (
+            db.session.query(Case.case_number)
+            .filter(Case.case_number.startswith(prefix, autoescape=True))
+            .order_by(db.func.length(Case.case_number).desc(), Case.case_number.desc())
+            .limit(1)
+            .scalar()
+        )
+        suffix = (latest or "")[len(prefix):]
+        return int(suffix) if suffix.isdigit() else 0
@@ -0,0 +1,37 @@
+from models import db
+
+
+class ChangeEvent(db.Model):
+    """One committed change to a case, hearing, document or notification, for /api/events.
+
+    Rows are written in the same transaction as the change and polled by every
+    worker process, so the table doubles as the broker between workers.
+    """
+
+    __tablename__ = "change_events"
+    __table_args__ = (
+        db.Index("ix_change_events_created_at", "created_at"),
+        # Newest event in a user's scope (ETags, see utils.etags.scope_version).
+        db.Index("ix_change_events_advocate_id", "advocate_id", "id"),
+        db.Index("ix_change_events_petitioner_id", "petitioner_user_id", "id"),
+        db.Index("ix_change_events_user_entity_id", "user_id", "entity", "id"),
+    )
+
+    id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+    entity = db.Column(db.String(30), nullable=False)  # cases, hearings, documents, notifications
+    entity_id = db.Column(db.Integer, nullable=False)
+    action = db.Column(db.String(20), nullable=False)  # created, updated, deleted, removed
+    case_id = db.Column(db.Integer, nullable=True)
+    user_id = db.Column(db.Integer, nullable=True)  # recipient of a notification
+    advocate_id = db.Column(db.Integer, nullable=True)
+    petitioner_user_id = db.Column(db.Integer, nullable=True)
+    created_at = db.Column(db.DateTime, server_default=db.func.now())
+
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "entity": self.entity,
+            "entityId": self.entity_id,
+            "action": self.action,
+            "caseId": self.case_id,
+        }
@@ -12,6 +12,7 @@ class Courtroom(db.Model):
     case_title = db.Column(db.String(300), nullable=True)
     start_time = db.Column(db.String(20), nullable=True)
     case_type = db.Column(db.String(50), nullable=True)
+    updated_at = db.Column(db.DateTime, server_default=db.func.now(), onupdate=db.func.now())
 
     # Relationship
     cases = db.relationship("Case", backref="courtroom", lazy=True)
@@ -1,10 +1,18 @@
 import os
 
+from sqlalchemy.orm import joinedload
+
 from models import db
+from models.fields import SparseField, column_field, iso, plain_fields
+from models.user import User
 
 
 class Document(db.Model):
     __tablename__ = "documents"
+    __table_args__ = (
+        db.Index("ix_documents_case_uploaded_at", "case_id", "uploaded_at"),
+        db.Index("ix_documents_updated_at", "updated_at"),
+    )
 
     id = db.Column(db.Integer, primary_key=True, autoincrement=True)
     case_id = db.Column(db.Integer, db.ForeignKey("cases.id"), nullable=False)
@@ -16,21 +24,43 @@ class Document(db.Model):
     file_size = db.Column(db.String(20), nullable=True)
     verified = db.Column(db.Boolean, default=False)
     uploaded_at = db.Column(db.DateTime, server_default=db.func.now())
+    updated_at = db.Column(db.DateTime, server_default=db.func.now(), onupdate=db.func.now())
+
+    @staticmethod
+    def for_case(case_id, limit=None):
+        """Documents newest first; with ``limit``, only the newest ``limit``."""
+        query = Document.query.options(joinedload(Document.uploader)).filter_by(case_id=case_id).order_by(
+            Document.uploaded_at.desc(), Document.id.desc()
+        )
+        if limit:
+            query = query.limit(limit)
+        return query.all()
 
     def to_dict(self):
-        return {
-            "id": f"EVD-{self.id:03d}",
-            "databaseId": self.id,
-            "caseId": self.case_id,
-            "title": self.title,
-            "type": self.doc_type,
-            "fileType": self.file_type,
-            "filePath": self.file_path,
-            "fileName": os.path.basename(self.file_path) if self.file_path else None,
-            "fileSize": self.file_size,
-            "size": self.file_size,
-            "verified": self.verified,
-            "status": "verified" if self.verified else "pending",
-            "uploadedBy": self.uploader.name if self.uploader else None,
-            "uploadedAt": self.uploaded_at.isoformat() if self.uploaded_at else None,
-        }
+        data = plain_fields(self, DOCUMENT_FIELDS)
+        data["uploadedBy"] = self.uploader.name if self.uploader else None
+        return data
+
+
+_uploader = User.__table__.alias("uploader")
+
+DOCUMENT_FIELDS = {
+    "id": column_field(Document.id, lambda doc_id: f"EVD-{doc_id:03d}"),
+    "databaseId": column_field(Document.id),
+    "caseId": column_field(Document.case_id),
+    "title": column_field(Document.title),
+    "type": column_field(Document.doc_type),
+    "fileType": column_field(Document.file_type),
+    "filePath": column_field(Document.file_path),
+    "fileName": column_field(Document.file_path, lambda path: os.path.basename(path) if path else None),
+    "fileSize": column_field(Document.file_size),
+    "size": column_field(Document.file_size),
+    "verified": column_field(Document.verified),
+    "status": column_field(Document.verified, lambda verified: "verified" if verified else "pending"),
+    "uploadedAt": column_field(Document.uploaded_at, iso),
+    "uploadedBy": SparseField(
+        (_uploader.c.name.label("uploader_name"),),
+        lambda row: row.uploader_name,
+        lambda query: query.outerjoin(_uploader, Document.uploaded_by == _uploader.c.id),
+    ),
+}
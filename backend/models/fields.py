@@ -0,0 +1,23 @@
+from collections import namedtuple
+
+# One serialized key: the columns it is read from, how to read it off a model
+# instance or a result row carrying those columns, and the outer join (if any)
+# that brings them into a query. See utils/fields.py for ?fields= selection.
+SparseField = namedtuple("SparseField", "columns read join", defaults=(None,))
+
+
+def iso(value):
+    return value.isoformat() if value else None
+
+
+def column_field(column, convert=None):
+    """A key that is one column, optionally passed through ``convert``."""
+    name = column.key
+    if convert is None:
+        return SparseField((column,), lambda row: getattr(row, name))
+    return SparseField((column,), lambda row: convert(getattr(row, name)))
+
+
+def plain_fields(obj, fields):
+    """The keys of ``fields`` that need no join, read off a model instance."""
+    return {key: field.read(obj) for key, field in fields.items() if field.join is None}
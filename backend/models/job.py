@@ -0,0 +1,56 @@
+import json
+
+from models import db
+
+
+class Job(db.Model):
+    """A unit of background work (bulk report, CSV export, email, analytics rebuild).
+
+    Web requests insert a queued row and return its id; run_jobs.py workers
+    claim rows, report progress on them and store the result, either as a
+    file under JOB_RESULTS_DIR or as a small JSON summary.
+    """
+
+    __tablename__ = "jobs"
+    __table_args__ = (
+        db.Index("ix_jobs_status_id", "status", "id"),
+        db.Index("ix_jobs_user_created", "user_id", "created_at"),
+    )
+
+    id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+    kind = db.Column(db.String(50), nullable=False)
+    user_id = db.Column(db.Integer, db.ForeignKey("users.id"), nullable=False)
+    params = db.Column(db.Text, nullable=True)  # JSON, as checked when the job was queued
+    status = db.Column(db.String(20), nullable=False, default="queued")  # queued, running, succeeded, failed
+    progress = db.Column(db.Integer, nullable=False, default=0)  # percent
+    message = db.Column(db.String(255), nullable=True)
+    result = db.Column(db.Text, nullable=True)  # JSON summary
+    result_name = db.Column(db.String(255), nullable=True)  # file name under JOB_RESULTS_DIR/<id>/
+    result_type = db.Column(db.String(100), nullable=True)
+    error = db.Column(db.Text, nullable=True)
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    worker = db.Column(db.String(100), nullable=True)
+    created_at = db.Column(db.DateTime, server_default=db.func.now())
+    started_at = db.Column(db.DateTime, nullable=True)
+    heartbeat_at = db.Column(db.DateTime, nullable=True)
+    finished_at = db.Column(db.DateTime, nullable=True)
+
+    def param_values(self):
+        return json.loads(self.params) if self.params else {}
+
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "kind": self.kind,
+            "status": self.status,
+            "progress": self.progress,
+            "message": self.message or "",
+            "result": json.loads(self.result) if self.result else None,
+            "resultName": self.result_name,
+            "hasFile": bool(self.result_name) and self.status == "succeeded",
+            "error": self.error,
+            "attempts": self.attempts,
+            "createdAt": self.created_at.isoformat() if self.created_at else None,
+            "startedAt": self.started_at.isoformat() if self.started_at else None,
+            "finishedAt": self.finished_at.isoformat() if self.finished_at else None,
+        }
@@ -3,6 +3,7 @@ from models import db
 
 class Notification(db.Model):
     __tablename__ = "notifications"
+    __table_args__ = (db.Index("ix_notifications_user_updated_at", "user_id", "updated_at"),)
 
     id = db.Column(db.Integer, primary_key=True, autoincrement=True)
     user_id = db.Column(db.Integer, db.ForeignKey("users.id"), nullable=False)
@@ -12,6 +13,7 @@ class Notification(db.Model):
     priority = db.Column(db.String(10), default="low")  # high, medium, low
     is_read = db.Column(db.Boolean, default=False)
     created_at = db.Column(db.DateTime, server_default=db.func.now())
+    updated_at = db.Column(db.DateTime, server_default=db.func.now(), onupdate=db.func.now())
 
     def to_dict(self):
         return {
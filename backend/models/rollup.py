@@ -0,0 +1,49 @@
+from models import db
+
+
+class CaseRollup(db.Model):
+    """Case counts per filing month, type, status and advocate (0 = unassigned)."""
+
+    __tablename__ = "case_rollups"
+
+    month = db.Column(db.Date, primary_key=True)  # first day of the filing month
+    case_type = db.Column(db.String(50), primary_key=True)
+    status = db.Column(db.String(30), primary_key=True)
+    advocate_id = db.Column(db.Integer, primary_key=True, autoincrement=False, default=0)
+    case_count = db.Column(db.Integer, nullable=False, default=0)
+
+
+class HearingRollup(db.Model):
+    """Hearing counts per date and court room ("" = no room)."""
+
+    __tablename__ = "hearing_rollups"
+
+    date = db.Column(db.Date, primary_key=True)
+    courtroom = db.Column(db.String(200), primary_key=True, default="")
+    hearing_count = db.Column(db.Integer, nullable=False, default=0)
+
+
+class RollupBuild(db.Model):
+    """Marks the rollup tables as built from the full cases and hearings tables.
+
+    Written by rebuild_rollups(); until it exists the rollups only hold
+    deltas from writes made since they were added, so analytics read the
+    base tables instead.
+    """
+
+    __tablename__ = "rollup_builds"
+
+    name = db.Column(db.String(50), primary_key=True)
+    built_at = db.Column(db.DateTime, nullable=False, server_default=db.func.now())
+
+
+class PendencySnapshot(db.Model):
+    """Case counts per day, type, court room ("" = no room) and status, as they stood at end of day."""
+
+    __tablename__ = "pendency_snapshots"
+
+    date = db.Column(db.Date, primary_key=True)
+    case_type = db.Column(db.String(50), primary_key=True)
+    courtroom = db.Column(db.String(100), primary_key=True, default="")
+    status = db.Column(db.String(30), primary_key=True)
+    case_count = db.Column(db.Integer, nullable=False, default=0)
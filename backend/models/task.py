@@ -3,6 +3,7 @@ from models import db
 
 class Task(db.Model):
     __tablename__ = "tasks"
+    __table_args__ = (db.Index("ix_tasks_user_updated_at", "user_id", "updated_at"),)
 
     id = db.Column(db.Integer, primary_key=True, autoincrement=True)
     case_id = db.Column(db.Integer, db.ForeignKey("cases.id"), nullable=False)
@@ -12,6 +13,7 @@ class Task(db.Model):
     priority = db.Column(db.String(10), default="medium")  # high, medium, low
     due_date = db.Column(db.Date, nullable=True)
     created_at = db.Column(db.DateTime, server_default=db.func.now())
+    updated_at = db.Column(db.DateTime, server_default=db.func.now(), onupdate=db.func.now())
 
     def to_dict(self):
         return {
@@ -0,0 +1,21 @@
+from models import db
+
+
+class Tombstone(db.Model):
+    """Marks a row that was deleted, or a case that left a user's scope, for /api/sync.
+
+    The scope columns are copied from the row (or its case) at the time, since
+    the row itself is gone by the time a client asks.
+    """
+
+    __tablename__ = "tombstones"
+    __table_args__ = (db.Index("ix_tombstones_deleted_at", "deleted_at"),)
+
+    id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+    entity = db.Column(db.String(30), nullable=False)  # cases, hearings, documents, tasks, notes, notifications
+    entity_id = db.Column(db.Integer, nullable=False)
+    reason = db.Column(db.String(20), nullable=False, default="deleted")  # deleted, reassigned
+    user_id = db.Column(db.Integer, nullable=True)  # owner of a task, note or notification
+    advocate_id = db.Column(db.Integer, nullable=True)
+    petitioner_user_id = db.Column(db.Integer, nullable=True)
+    deleted_at = db.Column(db.DateTime, server_default=db.func.now())
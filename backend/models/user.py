@@ -1,14 +1,21 @@
 from models import db
 from flask_bcrypt import Bcrypt
+from sqlalchemy.orm import validates
 
 bcrypt = Bcrypt()
 
 
+def normalize_name(value):
+    return " ".join(str(value or "").split()).strip().lower()
+
+
 class User(db.Model):
     __tablename__ = "users"
+    __table_args__ = (db.Index("ix_users_role_name_normalized", "role", "name_normalized"),)
 
     id = db.Column(db.Integer, primary_key=True, autoincrement=True)
     name = db.Column(db.String(150), nullable=False)
+    name_normalized = db.Column(db.String(150), nullable=True)  # lookup key kept in sync with name
     email = db.Column(db.String(150), unique=True, nullable=True)
     password_hash = db.Column(db.String(255), nullable=True)
     role = db.Column(db.Enum("public", "advocate", "court"), nullable=False)
@@ -32,7 +39,8 @@ class User(db.Model):
     created_at = db.Column(db.DateTime, server_default=db.func.now())
 
     # Relationships
-    cases = db.relationship("Case", backref="advocate", lazy=True)
+    cases = db.relationship("Case", backref="advocate", lazy=True, foreign_keys="Case.advocate_id")
+    petitioned_cases = db.relationship("Case", backref="petitioner_user", lazy=True, foreign_keys="Case.petitioner_user_id")
     documents = db.relationship("Document", backref="uploader", lazy=True)
     tasks = db.relationship("Task", backref="owner", lazy=True)
     notes = db.relationship("CaseNote", backref="author", lazy=True)
@@ -40,6 +48,11 @@ class User(db.Model):
     sent_messages = db.relationship("Message", backref="sender", lazy=True, foreign_keys="Message.sender_id")
     received_messages = db.relationship("Message", backref="receiver", lazy=True, foreign_keys="Message.receiver_id")
 
+    @validates("name")
+    def _sync_name_normalized(self, key, value):
+        self.name_normalized = normalize_name(value)
+        return value
+
     def set_password(self, password):
         self.password_hash = bcrypt.generate_password_hash(password).decode("utf-8")
 
@@ -0,0 +1,35 @@
+"""
+Delete sync tombstones older than the retention window (clients whose last
+sync token is older than that already get a full resync from /api/sync), and
+change events older than a day (a client reconnecting to /api/events after
+that long is told to resync instead of replaying), and finished background
+jobs older than a week, with their result files.
+Schedule once a day (e.g. cron: 30 0 * * *).
+Run:  python purge_tombstones.py
+"""
+
+from datetime import datetime, timedelta
+
+from app import create_app
+from routes.sync import TOMBSTONE_RETENTION
+from utils.events import purge_change_events
+from utils.jobs import purge_jobs
+from utils.tombstones import purge_tombstones
+
+EVENT_RETENTION = timedelta(days=1)
+JOB_RETENTION = timedelta(days=7)
+
+
+def main():
+    app = create_app()
+    with app.app_context():
+        deleted = purge_tombstones(datetime.now() - TOMBSTONE_RETENTION)
+        print(f"Purged {deleted} tombstones.")
+        deleted = purge_change_events(datetime.now() - EVENT_RETENTION)
+        print(f"Purged {deleted} change events.")
+        deleted = purge_jobs(datetime.now() - JOB_RETENTION)
+        print(f"Purged {deleted} finished jobs.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,21 @@
+"""
+Regenerate the analytics rollup tables from cases and hearings.
+Run once after upgrading a database that predates the rollups (analytics
+read the base tables until it has run), and after bulk imports or direct
+SQL edits that bypass the ORM.
+Run:  python rebuild_rollups.py
+"""
+
+from app import create_app
+from utils.rollups import rebuild_rollups
+
+
+def main():
+    app = create_app()
+    with app.app_context():
+        case_rows, hearing_rows = rebuild_rollups()
+        print(f"Rebuilt {case_rows} case rollup rows and {hearing_rows} hearing rollup rows.")
+
+
+if __name__ == "__main__":
+    main()
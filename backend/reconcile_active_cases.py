@@ -0,0 +1,42 @@
+"""
+Recompute users.active_cases for every advocate from the cases table.
+Case writes maintain the counter incrementally; run this periodically
+(e.g. nightly cron) to correct any drift.
+Run:  python reconcile_active_cases.py
+"""
+
+from app import create_app
+from models import db
+from models.case import Case
+from models.user import User
+from routes.cases import ACTIVE_CASE_STATUSES
+
+
+def reconcile_active_cases():
+    counts = dict(
+        db.session.query(Case.advocate_id, db.func.count(Case.id))
+        .filter(Case.advocate_id.isnot(None), Case.status.in_(list(ACTIVE_CASE_STATUSES)))
+        .group_by(Case.advocate_id)
+        .all()
+    )
+
+    updates = [
+        {"id": advocate_id, "active_cases": counts.get(advocate_id, 0)}
+        for advocate_id, active_cases in db.session.query(User.id, User.active_cases).filter(User.role == "advocate")
+        if active_cases != counts.get(advocate_id, 0)
+    ]
+    if updates:
+        db.session.bulk_update_mappings(User, updates)
+    db.session.commit()
+    return len(updates)
+
+
+def main():
+    app = create_app()
+    with app.app_context():
+        corrected = reconcile_active_cases()
+        print(f"Corrected active case counts for {corrected} advocates.")
+
+
+if __name__ == "__main__":
+    main()
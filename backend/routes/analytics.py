@@ -1,38 +1,251 @@
-from flask import Blueprint, jsonify
+from flask import Blueprint, current_app, jsonify, request
 from flask_jwt_extended import jwt_required, get_jwt_identity
-from sqlalchemy import func, extract
+from sqlalchemy import case as sql_case, func, extract
 from models import db
 from models.case import Case, Hearing
 from models.user import User
 from models.document import Document
 from models.task import Task
+from models.rollup import CaseRollup, HearingRollup
+from utils.cache import analytics_cache, cached_analytics, cached_daily
+from utils.pendency import pending_by_day, snapshots_cover
+from utils.rollups import rollups_ready
 from datetime import date, datetime, timedelta
+import math
 
 analytics_bp = Blueprint("analytics", __name__, url_prefix="/api/analytics")
 
+PENDING_STATUSES = ["filed", "under_review", "hearing_scheduled", "in_progress", "judgment_reserved"]
+DASHBOARD_PENDING_STATUSES = ["filed", "under_review", "hearing_scheduled", "in_progress"]
+DISPOSED_STATUSES = ["closed", "dismissed"]
+AGEING_BUCKETS = [("0-1", 0), ("1-3", 1), ("3-5", 3), ("5+", 5)]  # (label, minimum age in years)
+DISPOSAL_PERCENTILES = [25, 50, 75, 90]
+PENDENCY_DEFAULT_MONTHS = 12
+PENDENCY_MAX_MONTHS = 120
 
-# ── GET /api/analytics/dashboard ───────────────────────────────────
-@analytics_bp.route("/dashboard", methods=["GET"])
-@jwt_required()
-def dashboard_stats():
-    user = User.query.get(int(get_jwt_identity()))
 
+ANALYTICS_BACKENDS = ("rollups", "sql", "columnar")
+
+
+def analytics_backend():
+    backend = current_app.config.get("ANALYTICS_BACKEND", "rollups")
+    if backend not in ANALYTICS_BACKENDS:
+        raise ValueError(f"Unknown ANALYTICS_BACKEND {backend!r}")
+    return backend
+
+
+def use_rollups():
+    # Until rebuild_rollups.py has run (e.g. on a database upgraded from before
+    # the rollups existed) they hold only recent deltas, so fall back to SQL.
+    return analytics_backend() == "rollups" and rollups_ready()
+
+
+def columnar():
+    """The NumPy snapshot engine, or None when another backend is configured."""
+    if analytics_backend() != "columnar":
+        return None
+    # Imported lazily so numpy is only required when this backend is enabled.
+    from utils.columnar import columnar_engine
+
+    return columnar_engine()
+
+
+def month_starts(count, today=None):
+    """First day of each of the last ``count`` calendar months, oldest first."""
+    current = (today or date.today()).replace(day=1)
+    starts = []
+    for _ in range(count):
+        starts.append(current)
+        current = (current - timedelta(days=1)).replace(day=1)
+    return starts[::-1]
+
+
+def next_month_start(value):
+    return (value.replace(day=28) + timedelta(days=4)).replace(day=1)
+
+
+def month_key(year, month):
+    return int(year) * 100 + int(month)
+
+
+def years_before(value, years):
+    try:
+        return value.replace(year=value.year - years)
+    except ValueError:  # 29 February
+        return value.replace(year=value.year - years, day=28)
+
+
+def days_between(start_column, end_column):
+    if db.engine.dialect.name == "mysql":
+        return func.datediff(end_column, start_column)
+    return func.cast(func.julianday(end_column) - func.julianday(start_column), db.Integer)
+
+
+def percentile_from_histogram(histogram, percentile):
+    """Nearest-rank percentile over sorted ``[(value, count)]`` pairs."""
+    total = sum(count for _, count in histogram)
+    if not total:
+        return None
+    rank = max(math.ceil(percentile / 100 * total), 1)
+    seen = 0
+    for value, count in histogram:
+        seen += count
+        if seen >= rank:
+            return value
+    return histogram[-1][0]
+
+
+def filing_month_key():
+    return extract("year", Case.filing_date) * 100 + extract("month", Case.filing_date)
+
+
+def court_status_counts():
+    engine = columnar()
+    if engine:
+        return engine.status_counts()
+    if use_rollups():
+        rows = db.session.query(CaseRollup.status, func.sum(CaseRollup.case_count)).group_by(CaseRollup.status)
+    else:
+        rows = db.session.query(Case.status, func.count(Case.id)).group_by(Case.status)
+    return {status: int(count or 0) for status, count in rows}
+
+
+def hearing_counts_by_date(start, end):
+    engine = columnar()
+    if engine:
+        return engine.hearing_counts_by_date(start, end)
+    if use_rollups():
+        rows = db.session.query(HearingRollup.date, func.sum(HearingRollup.hearing_count)).filter(
+            HearingRollup.date >= start, HearingRollup.date <= end
+        ).group_by(HearingRollup.date)
+    else:
+        rows = db.session.query(Hearing.date, func.count(Hearing.id)).filter(
+            Hearing.date >= start, Hearing.date <= end
+        ).group_by(Hearing.date)
+    return {hearing_date: int(count or 0) for hearing_date, count in rows}
+
+
+def monthly_filed_and_closed(starts):
+    """{month_key: (filed, closed)} for the filing months in ``starts``."""
+    engine = columnar()
+    if engine:
+        return engine.monthly_filed_and_closed(starts)
+    if use_rollups():
+        rows = db.session.query(
+            CaseRollup.month,
+            func.sum(CaseRollup.case_count),
+            func.sum(sql_case((CaseRollup.status == "closed", CaseRollup.case_count), else_=0)),
+        ).filter(
+            CaseRollup.month >= starts[0],
+            CaseRollup.month <= starts[-1],
+        ).group_by(CaseRollup.month).all()
+        return {month_key(month.year, month.month): (int(filed or 0), int(closed or 0)) for month, filed, closed in rows}
+
+    bucket = filing_month_key()
+    rows = db.session.query(
+        bucket,
+        func.count(Case.id),
+        func.sum(sql_case((Case.status == "closed", 1), else_=0)),
+    ).filter(
+        Case.filing_date >= starts[0],
+        Case.filing_date < next_month_start(starts[-1]),
+    ).group_by(bucket).all()
+    return {int(key): (filed, int(closed or 0)) for key, filed, closed in rows}
+
+
+def pending_running_totals(starts):
+    """{month_key: active cases filed up to the end of that month}, for months with filings."""
+    engine = columnar()
+    if engine:
+        return engine.pending_running_totals(starts, PENDING_STATUSES)
+    if use_rollups():
+        rows = db.session.query(CaseRollup.month, func.sum(CaseRollup.case_count)).filter(
+            CaseRollup.status.in_(PENDING_STATUSES),
+            CaseRollup.month <= starts[-1],
+        ).group_by(CaseRollup.month).order_by(CaseRollup.month.asc())
+        totals = {}
+        running = 0
+        first_key = month_key(starts[0].year, starts[0].month)
+        for month, count in rows:
+            running += int(count or 0)
+            totals[max(month_key(month.year, month.month), first_key)] = running
+        return totals
+
+    # Cases filed before the window all land in the first bucket; a running
+    # SUM over the month buckets then gives the pending count at each month end.
+    bucket = sql_case(
+        (Case.filing_date < starts[0], month_key(starts[0].year, starts[0].month)),
+        else_=filing_month_key(),
+    )
+    rows = db.session.query(
+        bucket,
+        func.sum(func.count(Case.id)).over(order_by=bucket),
+    ).filter(
+        Case.status.in_(PENDING_STATUSES),
+        Case.filing_date < next_month_start(starts[-1]),
+    ).group_by(bucket).all()
+    return {int(key): int(total) for key, total in rows}
+
+
+def approximate_pending(starts):
+    """Pending count per month from today's statuses and filing dates (no history needed)."""
+    running_totals = pending_running_totals(starts)
+    values = []
+    pending = 0
+    for d in starts:
+        pending = running_totals.get(month_key(d.year, d.month), pending)
+        values.append(pending)
+    return values
+
+
+def pending_from_snapshots(starts):
+    """Pending count at the end of each past month from pendency_snapshots; the current month is live.
+
+    Months with no snapshot at all (the job was down for the whole month) use
+    the same approximation as an install without history, not 0.
+    """
+    by_day = pending_by_day(starts[0], starts[-1] - timedelta(days=1), PENDING_STATUSES)
+    # Latest snapshot in each month, in case the job skipped its last days.
+    latest = {}
+    for day, count in by_day.items():
+        month = day.replace(day=1)
+        if month not in latest or day > latest[month][0]:
+            latest[month] = (day, count)
+
+    approximated = None
+    values = []
+    for index, d in enumerate(starts[:-1]):
+        if d in latest:
+            values.append(latest[d][1])
+            continue
+        if approximated is None:
+            approximated = approximate_pending(starts)
+        values.append(approximated[index])
+
+    status_counts = court_status_counts()
+    values.append(sum(status_counts.get(status, 0) for status in PENDING_STATUSES))
+    return values
+
+
+def dashboard_payload(user):
+    """Headline counters for the user's role."""
     if user.role == "court":
-        total = Case.query.count()
-        pending = Case.query.filter(Case.status.in_(["filed", "under_review", "hearing_scheduled", "in_progress"])).count()
-        closed = Case.query.filter_by(status="closed").count()
-        dismissed = Case.query.filter_by(status="dismissed").count()
-        today_hearings = Hearing.query.filter_by(date=date.today()).count()
+        status_counts = court_status_counts()
+        total = sum(status_counts.values())
+        pending = sum(status_counts.get(status, 0) for status in DASHBOARD_PENDING_STATUSES)
+        closed = status_counts.get("closed", 0)
+        dismissed = status_counts.get("dismissed", 0)
+        today_hearings = hearing_counts_by_date(date.today(), date.today()).get(date.today(), 0)
         advocates_count = User.query.filter_by(role="advocate").count()
 
-        return jsonify({
+        return {
             "totalCases": total,
             "pendingCases": pending,
             "closedCases": closed,
             "dismissedCases": dismissed,
             "todayHearings": today_hearings,
             "advocatesCount": advocates_count,
-        }), 200
+        }
 
     elif user.role == "advocate":
         active = Case.query.filter_by(advocate_id=user.id).filter(
@@ -44,53 +257,57 @@ def dashboard_stats():
         pending_tasks = Task.query.filter_by(user_id=user.id, completed=False).count()
         evidence_count = Document.query.join(Case).filter(Case.advocate_id == user.id).count()
 
-        return jsonify({
+        return {
             "activeCases": active,
             "todayHearings": today_hearings,
             "pendingTasks": pending_tasks,
             "evidenceCount": evidence_count,
-        }), 200
+        }
 
     else:  # public
-        my_cases = Case.query.filter_by(petitioner=user.name).count()
+        my_cases = Case.query.filter_by(petitioner_user_id=user.id).count()
         next_hearing = Hearing.query.join(Case).filter(
-            Case.petitioner == user.name, Hearing.date >= date.today()
+            Case.petitioner_user_id == user.id, Hearing.date >= date.today()
         ).order_by(Hearing.date.asc()).first()
-        docs = Document.query.join(Case).filter(Case.petitioner == user.name).count()
+        docs = Document.query.join(Case).filter(Case.petitioner_user_id == user.id).count()
 
-        return jsonify({
+        return {
             "activeCases": my_cases,
             "nextHearing": next_hearing.to_dict() if next_hearing else None,
             "documents": docs,
-        }), 200
+        }
 
 
-# ── GET /api/analytics/cases-trend ─────────────────────────────────
-@analytics_bp.route("/cases-trend", methods=["GET"])
+# ── GET /api/analytics/dashboard ───────────────────────────────────
+@analytics_bp.route("/dashboard", methods=["GET"])
 @jwt_required()
-def cases_trend():
+@cached_analytics
+def dashboard_stats():
+    user = User.query.get(int(get_jwt_identity()))
+    return jsonify(dashboard_payload(user)), 200
+
+
+def cases_trend_payload():
+    starts = month_starts(7)
+    counts = monthly_filed_and_closed(starts)
+
     months = []
-    for i in range(6, -1, -1):
-        d = date.today().replace(day=1) - timedelta(days=i * 30)
-        month_name = d.strftime("%b")
-        filed = Case.query.filter(
-            extract("year", Case.filing_date) == d.year,
-            extract("month", Case.filing_date) == d.month,
-        ).count()
-        closed = Case.query.filter(
-            Case.status == "closed",
-            extract("year", Case.filing_date) == d.year,
-            extract("month", Case.filing_date) == d.month,
-        ).count()
-        months.append({"month": month_name, "filed": filed, "closed": closed})
+    for d in starts:
+        filed, closed = counts.get(month_key(d.year, d.month), (0, 0))
+        months.append({"month": d.strftime("%b"), "filed": filed, "closed": closed})
 
-    return jsonify(months), 200
+    return months
 
 
-# ── GET /api/analytics/cases-by-type ───────────────────────────────
-@analytics_bp.route("/cases-by-type", methods=["GET"])
+# ── GET /api/analytics/cases-trend ─────────────────────────────────
+@analytics_bp.route("/cases-trend", methods=["GET"])
 @jwt_required()
-def cases_by_type():
+@cached_analytics
+def cases_trend():
+    return jsonify(cases_trend_payload()), 200
+
+
+def cases_by_type_payload():
     type_colors = {
         "Civil": "#4f46e5",
         "Criminal": "#ef4444",
@@ -99,60 +316,90 @@ def cases_by_type():
         "Writ": "#8b5cf6",
     }
 
-    results = db.session.query(
-        Case.case_type, func.count(Case.id)
-    ).group_by(Case.case_type).all()
+    engine = columnar()
+    if engine:
+        results = engine.type_counts(DISPOSED_STATUSES)
+    elif use_rollups():
+        results = db.session.query(
+            CaseRollup.case_type,
+            func.sum(CaseRollup.case_count),
+            func.sum(sql_case((CaseRollup.status.in_(DISPOSED_STATUSES), CaseRollup.case_count), else_=0)),
+        ).group_by(CaseRollup.case_type).all()
+    else:
+        results = db.session.query(
+            Case.case_type,
+            func.count(Case.id),
+            func.sum(sql_case((Case.status.in_(DISPOSED_STATUSES), 1), else_=0)),
+        ).group_by(Case.case_type).all()
 
     data = []
-    for case_type, count in results:
+    for case_type, count, disposed in results:
+        if not count:
+            continue
         data.append({
             "name": case_type,
-            "value": count,
+            "value": int(count),
+            "disposed": int(disposed or 0),
             "color": type_colors.get(case_type, "#64748b"),
         })
 
-    return jsonify(data), 200
+    return data
 
 
-# ── GET /api/analytics/daily-hearings ──────────────────────────────
-@analytics_bp.route("/daily-hearings", methods=["GET"])
+# ── GET /api/analytics/cases-by-type ───────────────────────────────
+@analytics_bp.route("/cases-by-type", methods=["GET"])
 @jwt_required()
-def daily_hearings():
+@cached_analytics
+def cases_by_type():
+    return jsonify(cases_by_type_payload()), 200
+
+
+def daily_hearings_payload():
     days = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat"]
-    data = []
     today = date.today()
     start_of_week = today - timedelta(days=today.weekday())
+    end_of_week = start_of_week + timedelta(days=len(days) - 1)
+
+    counts = hearing_counts_by_date(start_of_week, end_of_week)
 
+    data = []
     for i, day_name in enumerate(days):
         d = start_of_week + timedelta(days=i)
-        count = Hearing.query.filter_by(date=d).count()
-        data.append({"day": day_name, "count": count})
+        data.append({"day": day_name, "count": counts.get(d, 0)})
 
-    return jsonify(data), 200
+    return data
 
 
-# ── GET /api/analytics/advocate-performance ────────────────────────
-@analytics_bp.route("/advocate-performance", methods=["GET"])
+# ── GET /api/analytics/daily-hearings ──────────────────────────────
+@analytics_bp.route("/daily-hearings", methods=["GET"])
 @jwt_required()
-def advocate_performance():
-    user = User.query.get(int(get_jwt_identity()))
-
-    total_cases = Case.query.filter_by(advocate_id=user.id).count()
-    won = Case.query.filter_by(advocate_id=user.id, status="closed").count()
-    active = Case.query.filter_by(advocate_id=user.id).filter(
-        Case.status.in_(["filed", "under_review", "hearing_scheduled", "in_progress"])
-    ).count()
+@cached_analytics
+def daily_hearings():
+    return jsonify(daily_hearings_payload()), 200
+
+
+def advocate_performance_payload(user):
+    engine = columnar()
+    if engine:
+        specializations = engine.advocate_type_stats(user.id, DASHBOARD_PENDING_STATUSES)
+    else:
+        # One grouped pass: per case type, total / won / active via conditional SUMs.
+        specializations = db.session.query(
+            Case.case_type,
+            func.count(Case.id),
+            func.sum(sql_case((Case.status == "closed", 1), else_=0)),
+            func.sum(sql_case((Case.status.in_(DASHBOARD_PENDING_STATUSES), 1), else_=0)),
+        ).filter(Case.advocate_id == user.id).group_by(Case.case_type).all()
+
+    total_cases = sum(count for _, count, _, _ in specializations)
+    won = sum(int(wins or 0) for _, _, wins, _ in specializations)
+    active = sum(int(active_count or 0) for _, _, _, active_count in specializations)
 
     win_rate = round((won / total_cases * 100), 1) if total_cases > 0 else 0
 
-    # Performance by case type
-    specializations = db.session.query(
-        Case.case_type, func.count(Case.id)
-    ).filter_by(advocate_id=user.id).group_by(Case.case_type).all()
-
     spec_data = []
-    for case_type, count in specializations:
-        wins = Case.query.filter_by(advocate_id=user.id, case_type=case_type, status="closed").count()
+    for case_type, count, wins, _ in specializations:
+        wins = int(wins or 0)
         rate = round((wins / count * 100)) if count > 0 else 0
         spec_data.append({
             "type": case_type,
@@ -161,53 +408,164 @@ def advocate_performance():
             "rate": f"{rate}%",
         })
 
-    return jsonify({
+    return {
         "totalCases": total_cases,
         "winRate": f"{win_rate}%",
         "activeCases": active,
         "specializations": spec_data,
-    }), 200
+    }
+
+
+# ── GET /api/analytics/advocate-performance ────────────────────────
+@analytics_bp.route("/advocate-performance", methods=["GET"])
+@jwt_required()
+@cached_analytics
+def advocate_performance():
+    user = User.query.get(int(get_jwt_identity()))
+    return jsonify(advocate_performance_payload(user)), 200
+
+
+def all_advocates_payload():
+    engine = columnar()
+    if engine:
+        active_counts = engine.active_by_advocate(DASHBOARD_PENDING_STATUSES)
+        advocates = [
+            (advocate_id, name, email, rating, active_counts.get(advocate_id, 0))
+            for advocate_id, name, email, rating in db.session.query(
+                User.id, User.name, User.email, User.rating
+            ).filter(User.role == "advocate").order_by(User.id.asc())
+        ]
+    else:
+        advocates = db.session.query(
+            User.id,
+            User.name,
+            User.email,
+            User.rating,
+            func.coalesce(func.sum(sql_case((Case.status.in_(DASHBOARD_PENDING_STATUSES), 1), else_=0)), 0),
+        ).outerjoin(Case, Case.advocate_id == User.id).filter(
+            User.role == "advocate"
+        ).group_by(User.id, User.name, User.email, User.rating).order_by(User.id.asc()).all()
+
+    data = []
+    for advocate_id, name, email, rating, active_cases in advocates:
+        data.append({
+            "id": advocate_id,
+            "name": name,
+            "email": email,
+            "rating": rating or 4.5,
+            "active_cases": int(active_cases),
+        })
+
+    return data
 
 
 # ── GET /api/analytics/all-advocates ───────────────────────────────
 @analytics_bp.route("/all-advocates", methods=["GET"])
 @jwt_required()
+@cached_analytics
 def all_advocates_stats():
     """List all advocates with their performance summary for court admin."""
     user = User.query.get(int(get_jwt_identity()))
     if user.role != "court":
         return jsonify({"error": "Unauthorized"}), 403
-
-    advocates = User.query.filter_by(role="advocate").all()
-    data = []
-    for adv in advocates:
-        active_cases = Case.query.filter_by(advocate_id=adv.id).filter(
-            Case.status.in_(["filed", "under_review", "hearing_scheduled", "in_progress"])
-        ).count()
-        
-        data.append({
-            "id": adv.id,
-            "name": adv.name,
-            "email": adv.email,
-            "rating": adv.rating or 4.5,
-            "active_cases": active_cases
-        })
-
-    return jsonify(data), 200
+    return jsonify(all_advocates_payload()), 200
 
 
 # ── GET /api/analytics/pendency ────────────────────────────────────
 @analytics_bp.route("/pendency", methods=["GET"])
 @jwt_required()
+@cached_analytics
 def pendency_report():
-    months = []
-    for i in range(11, -1, -1):
-        d = date.today().replace(day=1) - timedelta(days=i * 30)
-        month_name = d.strftime("%b")
-        pending = Case.query.filter(
-            Case.filing_date <= d,
-            Case.status.in_(["filed", "under_review", "hearing_scheduled", "in_progress", "judgment_reserved"]),
-        ).count()
-        months.append({"month": month_name, "pending": pending})
-
+    try:
+        month_count = int(request.args.get("months") or PENDENCY_DEFAULT_MONTHS)
+    except ValueError:
+        return jsonify({"error": "Invalid months"}), 400
+    if not 1 <= month_count <= PENDENCY_MAX_MONTHS:
+        return jsonify({"error": f"months must be between 1 and {PENDENCY_MAX_MONTHS}"}), 400
+
+    starts = month_starts(month_count)
+    if snapshots_cover(next_month_start(starts[0]) - timedelta(days=1)):
+        values = pending_from_snapshots(starts)
+    else:
+        # No history recorded yet: approximate from today's statuses.
+        values = approximate_pending(starts)
+
+    months = [
+        {"month": d.strftime("%b"), "year": d.year, "pending": pending}
+        for d, pending in zip(starts, values)
+    ]
     return jsonify(months), 200
+
+
+# ── GET /api/analytics/ageing ──────────────────────────────────────
+@analytics_bp.route("/ageing", methods=["GET"])
+@jwt_required()
+@cached_daily
+def ageing_report():
+    """Age histogram of pending cases by type and courtroom, plus time to disposal."""
+    user = User.query.get(int(get_jwt_identity()))
+    if user.role != "court":
+        return jsonify({"error": "Unauthorized"}), 403
+
+    today = date.today()
+    labels = [label for label, _ in AGEING_BUCKETS]
+    bucket = sql_case(
+        *[
+            (Case.filing_date <= years_before(today, min_years), label)
+            for label, min_years in reversed(AGEING_BUCKETS[1:])
+        ],
+        else_=AGEING_BUCKETS[0][0],
+    )
+    ageing_rows = db.session.query(
+        Case.case_type, Case.court_room_name, bucket, func.count(Case.id)
+    ).filter(
+        Case.status.in_(PENDING_STATUSES)
+    ).group_by(Case.case_type, Case.court_room_name, bucket).all()
+
+    totals = dict.fromkeys(labels, 0)
+    by_type = {}
+    by_courtroom = {}
+    for case_type, courtroom, label, count in ageing_rows:
+        totals[label] += count
+        for groups, name in ((by_type, case_type), (by_courtroom, courtroom or "Unassigned")):
+            groups.setdefault(name, dict.fromkeys(labels, 0))[label] += count
+
+    # Durations are grouped by day count, so the percentiles only need a
+    # histogram of at most a few thousand rows rather than every case.
+    duration = days_between(Case.filing_date, Case.disposal_date)
+    disposal_histogram = [
+        (int(days), count)
+        for days, count in db.session.query(duration, func.count(Case.id)).filter(
+            Case.disposal_date.is_not(None)
+        ).group_by(duration).order_by(duration.asc())
+    ]
+    disposed = sum(count for _, count in disposal_histogram)
+
+    return jsonify({
+        "asOf": today.isoformat(),
+        "buckets": labels,
+        "pending": {
+            "total": totals,
+            "byType": [{"caseType": name, "counts": counts} for name, counts in sorted(by_type.items())],
+            "byCourtroom": [{"courtroom": name, "counts": counts} for name, counts in sorted(by_courtroom.items())],
+        },
+        "disposal": {
+            "count": disposed,
+            "meanDays": round(sum(days * count for days, count in disposal_histogram) / disposed, 1) if disposed else None,
+            "medianDays": percentile_from_histogram(disposal_histogram, 50),
+            "percentiles": {
+                f"p{percentile}": percentile_from_histogram(disposal_histogram, percentile)
+                for percentile in DISPOSAL_PERCENTILES
+            },
+        },
+    }), 200
+
+
+# ── GET /api/analytics/cache-stats ─────────────────────────────────
+@analytics_bp.route("/cache-stats", methods=["GET"])
+@jwt_required()
+def cache_stats():
+    user = User.query.get(int(get_jwt_identity()))
+    if user.role != "court":
+        return jsonify({"error": "Unauthorized"}), 403
+    return jsonify(analytics_cache.stats()), 200
@@ -1,8 +1,9 @@
 from flask import Blueprint, request, jsonify
 from flask_jwt_extended import create_access_token, jwt_required, get_jwt_identity
 from models import db
-from models.user import User
+from models.user import User, normalize_name
 from models.otp import OTPCode
+from models.case import Case
 
 auth_bp = Blueprint("auth", __name__, url_prefix="/api/auth")
 
@@ -36,6 +37,13 @@ def citizen_register():
             role="public",
         )
         db.session.add(user)
+        db.session.flush()
+
+        # Link cases filed before the citizen had an account.
+        Case.query.filter(
+            Case.petitioner_user_id.is_(None),
+            db.func.lower(db.func.trim(Case.petitioner)) == normalize_name(name),
+        ).update({"petitioner_user_id": user.id}, synchronize_session=False)
         db.session.commit()
 
         return jsonify({"message": "Citizen registered successfully. Please login with OTP."}), 201
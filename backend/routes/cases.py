@@ -1,39 +1,69 @@
+import re
 from datetime import date, datetime
 
-from flask import Blueprint, Response, current_app, jsonify, request, url_for
+from flask import Blueprint, Response, current_app, jsonify, request, stream_with_context, url_for
 from flask_jwt_extended import get_jwt_identity, jwt_required
+from sqlalchemy.dialects.mysql import match
+from sqlalchemy.orm import joinedload
 
 from models import db
-from models.case import Case, CaseTimeline, Hearing
+from models.case import CASE_FIELDS, Case, CaseTimeline, Hearing, case_detail_options
+from models.case_sequence import CaseNumberSequence
 from models.courtroom import Courtroom
 from models.notification import Notification
-from models.user import User
+from models.user import User, normalize_name
 from utils.exporters import (
+    CASE_EXPORT_FIELDS,
     build_case_csv,
     build_case_report_lines,
     build_share_token,
     generate_simple_pdf,
     load_share_token,
     sanitize_filename,
+    stream_cases_csv,
 )
+from utils.etags import make_etag, not_modified, scoped_rows_version, with_etag
+from utils.fields import parse_fields, select_fields, serialize_rows
+from utils.jobs import queued_response, submit_job
+from utils.pagination import apply_keyset_page, decode_cursor, parse_page_size, split_page
+from utils.report_cache import cached_case_report
+from utils.report_pool import stream_merged_pdf, stream_report_zip
 
 cases_bp = Blueprint("cases", __name__, url_prefix="/api/cases")
 
 ACTIVE_CASE_STATUSES = {"filed", "under_review", "hearing_scheduled", "in_progress", "judgment_reserved"}
 ALLOWED_CASE_STATUSES = ACTIVE_CASE_STATUSES | {"closed", "dismissed"}
 ALLOWED_PRIORITIES = {"low", "medium", "high"}
-
-
-def normalize_name(value):
-    return " ".join(str(value or "").split()).strip().lower()
+CASE_NUMBER_PATTERN = re.compile(r"^CS/(\d{4})/(\d+)$")
+SEARCH_RESULT_LIMIT = 20
+# InnoDB never indexes tokens shorter than innodb_ft_min_token_size (default 3)
+# or words on its default stopword list, so requiring one matches nothing.
+FULLTEXT_MIN_TOKEN_SIZE = 3
+FULLTEXT_STOPWORDS = frozenset(
+    "a about an are as at be by com de en for from how i in is it la of on or "
+    "that the this to was what when where who will with und www".split()
+)
+EXPORT_BATCH_SIZE = 1000
+# Cases whose details are loaded at a time while feeding a bulk report.
+BULK_REPORT_BATCH_SIZE = 50
 
 
 def apply_case_scope(query, user):
     if user.role == "advocate":
         return query.filter_by(advocate_id=user.id)
     if user.role == "public":
-        normalized_name = normalize_name(user.name)
-        return query.filter(db.func.lower(db.func.trim(Case.petitioner)) == normalized_name)
+        return query.filter(Case.petitioner_user_id == user.id)
+    return query
+
+
+def apply_case_filters(query, args):
+    """The ?status=, ?type= and ?priority= filters shared by the list and export."""
+    if args.get("status"):
+        query = query.filter_by(status=args["status"])
+    if args.get("type"):
+        query = query.filter_by(case_type=args["type"])
+    if args.get("priority"):
+        query = query.filter_by(priority=args["priority"])
     return query
 
 
@@ -43,12 +73,32 @@ def can_access_case(user, case):
     if user.role == "advocate":
         return case.advocate_id == user.id
     if user.role == "public":
-        return normalize_name(case.petitioner) == normalize_name(user.name)
+        return case.petitioner_user_id == user.id
     return False
 
 
 def build_case_number():
-    return f"CS/{date.today().year}/{Case.query.count() + 1:04d}"
+    year = date.today().year
+    prefix = f"CS/{year}/"
+    return f"{prefix}{CaseNumberSequence.next_value(year, prefix):04d}"
+
+
+def reserve_case_number(case_number):
+    """Keep the year's sequence ahead of an explicitly supplied CS/<year>/<n> number."""
+    matched = CASE_NUMBER_PATTERN.match(case_number)
+    if matched:
+        year = int(matched.group(1))
+        CaseNumberSequence.advance_to(year, f"CS/{year}/", int(matched.group(2)))
+
+
+def build_fulltext_terms(query_text):
+    """Boolean-mode terms requiring every indexable token; short words and stopwords are dropped."""
+    tokens = re.findall(r"\w+", query_text)
+    return " ".join(
+        f"+{token}*"
+        for token in tokens
+        if len(token) >= FULLTEXT_MIN_TOKEN_SIZE and token.lower() not in FULLTEXT_STOPWORDS
+    )
 
 
 def parse_next_hearing(value):
@@ -69,8 +119,7 @@ def find_public_user_by_name(name):
     if not normalized:
         return None
 
-    public_users = User.query.filter_by(role="public").all()
-    return next((candidate for candidate in public_users if normalize_name(candidate.name) == normalized), None)
+    return User.query.filter_by(role="public", name_normalized=normalized).order_by(User.id.asc()).first()
 
 
 def find_courtroom_by_name(name):
@@ -82,27 +131,31 @@ def find_courtroom_by_name(name):
     return next((room for room in rooms if normalize_name(room.name) == normalized), None)
 
 
-def sync_advocate_active_cases(*advocate_ids):
-    valid_ids = {int(advocate_id) for advocate_id in advocate_ids if advocate_id}
-    if not valid_ids:
-        return
+def adjust_advocate_active_cases(previous=(None, None), current=(None, None)):
+    """Apply the active-case delta of one case moving from ``previous`` to ``current``.
 
-    for advocate_id in valid_ids:
-        advocate = User.query.get(advocate_id)
-        if not advocate or advocate.role != "advocate":
+    Each side is an ``(advocate_id, status)`` pair; use ``(None, None)`` for
+    a case that did not exist before or no longer exists.
+    """
+    deltas = {}
+    for (advocate_id, status), sign in ((previous, -1), (current, 1)):
+        if advocate_id and status in ACTIVE_CASE_STATUSES:
+            deltas[int(advocate_id)] = deltas.get(int(advocate_id), 0) + sign
+
+    for advocate_id, delta in deltas.items():
+        if not delta:
             continue
-        advocate.active_cases = Case.query.filter(
-            Case.advocate_id == advocate_id,
-            Case.status.in_(list(ACTIVE_CASE_STATUSES)),
-        ).count()
+        User.query.filter(User.id == advocate_id, User.role == "advocate").update(
+            {User.active_cases: db.func.coalesce(User.active_cases, 0) + delta},
+            synchronize_session=False,
+        )
 
 
 def queue_case_notification(case, title, client_message=None, advocate_message=None, priority="medium"):
-    client = find_public_user_by_name(case.petitioner)
-    if client and client_message:
+    if case.petitioner_user_id and client_message:
         db.session.add(
             Notification(
-                user_id=client.id,
+                user_id=case.petitioner_user_id,
                 type="update",
                 title=title,
                 message=client_message,
@@ -219,18 +272,23 @@ def apply_case_payload(case, data, user, is_create=False):
         status = "hearing_scheduled"
 
     if is_create:
+        explicit_number = bool(case_number)
         if not case_number:
             case_number = build_case_number()
         if Case.query.filter_by(case_number=case_number).first():
             raise ValueError("Case number already exists")
+        if explicit_number:
+            reserve_case_number(case_number)
     elif case_number and case_number != case.case_number:
         existing_case = Case.query.filter_by(case_number=case_number).first()
         if existing_case and existing_case.id != case.id:
             raise ValueError("Case number already exists")
+        reserve_case_number(case_number)
 
     return {
         "title": title,
         "petitioner": petitioner,
+        "petitioner_user_id": matched_client.id if matched_client else None,
         "respondent": respondent,
         "case_type": case_type,
         "priority": priority,
@@ -245,9 +303,100 @@ def apply_case_payload(case, data, user, is_create=False):
     }
 
 
+def case_export_query(user, filters):
+    """Rows for stream_cases_csv (the export columns, advocate name and email, and id) for cases in scope."""
+    advocate = User.__table__.alias("advocate")
+    return (
+        apply_case_filters(apply_case_scope(Case.query, user), filters)
+        .outerjoin(advocate, Case.advocate_id == advocate.c.id)
+        .with_entities(
+            Case.id,
+            *(getattr(Case, attribute) for _, attribute in CASE_EXPORT_FIELDS if hasattr(Case, attribute)),
+            advocate.c.name.label("advocate_name"),
+            advocate.c.email.label("advocate_email"),
+        )
+    )
+
+
+def bulk_report_case_ids(user, data):
+    """(ids of the cases a bulk report covers, error response) for ``caseIds`` or ``filter``.
+
+    Listed ids keep their order and must all be visible to ``user``; a filter
+    takes the list filters plus ``advocateId`` and ``hearingDate`` (cases with
+    a hearing scheduled that day, i.e. a cause list).
+    """
+    scoped = apply_case_scope(Case.query, user).with_entities(Case.id)
+    limit = current_app.config.get("BULK_REPORT_LIMIT", 1000)
+
+    if "caseIds" in data:
+        raw_ids = data.get("caseIds")
+        try:
+            if not isinstance(raw_ids, list):
+                raise ValueError
+            case_ids = list(dict.fromkeys(int(value) for value in raw_ids))
+        except (TypeError, ValueError):
+            return None, (jsonify({"error": "caseIds must be a list of case ids"}), 400)
+        if len(case_ids) > limit:
+            return None, (jsonify({"error": f"At most {limit} cases can be bundled at once"}), 400)
+        visible = {case_id for (case_id,) in scoped.filter(Case.id.in_(case_ids))}
+        missing = [str(case_id) for case_id in case_ids if case_id not in visible]
+        if missing:
+            return None, (jsonify({"error": f"Cases not found: {', '.join(missing)}"}), 404)
+    else:
+        filters = data.get("filter") or {}
+        if not isinstance(filters, dict):
+            return None, (jsonify({"error": "filter must be an object"}), 400)
+        query = apply_case_filters(scoped, filters)
+        try:
+            if filters.get("advocateId"):
+                query = query.filter(Case.advocate_id == int(filters["advocateId"]))
+            if filters.get("hearingDate"):
+                hearing_date = datetime.strptime(str(filters["hearingDate"]), "%Y-%m-%d").date()
+                query = query.filter(
+                    Case.id.in_(
+                        db.session.query(Hearing.case_id).filter(
+                            Hearing.date == hearing_date, Hearing.status == "scheduled"
+                        )
+                    )
+                )
+        except ValueError:
+            return None, (jsonify({"error": "Invalid advocateId or hearingDate (YYYY-MM-DD)"}), 400)
+        case_ids = [case_id for (case_id,) in query.order_by(Case.id.asc()).limit(limit + 1)]
+        if len(case_ids) > limit:
+            return None, (jsonify({"error": f"More than {limit} cases match; narrow the filter"}), 400)
+
+    if not case_ids:
+        return None, (jsonify({"error": "No cases match this request"}), 404)
+    return case_ids, None
+
+
+def case_report_sources(case_ids):
+    """(file name, title, report lines) per case, loading BULK_REPORT_BATCH_SIZE cases' details at a time."""
+    for start in range(0, len(case_ids), BULK_REPORT_BATCH_SIZE):
+        batch = case_ids[start:start + BULK_REPORT_BATCH_SIZE]
+        cases = {case.id: case for case in Case.query.options(*case_detail_options()).filter(Case.id.in_(batch))}
+        sources = [
+            (
+                f"{sanitize_filename(cases[case_id].case_number)}-report.pdf",
+                f"Case Report - {cases[case_id].case_number}",
+                build_case_report_lines(cases[case_id]),
+            )
+            for case_id in batch
+            if case_id in cases
+        ]
+        # The lines are plain strings; drop the batch's rows before loading the next.
+        db.session.expunge_all()
+        yield from sources
+
+
+def render_case_report(case_id):
+    case = Case.query.options(*case_detail_options()).populate_existing().filter(Case.id == case_id).one()
+    return generate_simple_pdf(f"Case Report - {case.case_number}", build_case_report_lines(case))
+
+
 def build_pdf_response(case, attachment=False):
-    title = f"Case Report - {case.case_number}"
-    payload = generate_simple_pdf(title, build_case_report_lines(case))
+    """The case's PDF report; only rendered (and its details loaded) when the cached copy is stale."""
+    payload = cached_case_report(case, lambda: render_case_report(case.id))
     filename = f"{sanitize_filename(case.case_number)}-report.pdf"
     disposition = "attachment" if attachment else "inline"
     return Response(
@@ -265,8 +414,9 @@ def build_case_details_payload(case, pdf_url=None):
     return payload
 
 
-def get_accessible_case_or_404(case_id, user):
-    case = Case.query.get(case_id)
+def get_accessible_case_or_404(case_id, user, with_details=False):
+    query = Case.query.options(*case_detail_options()) if with_details else Case.query
+    case = query.filter(Case.id == case_id).first()
     if not case:
         return None, (jsonify({"error": "Case not found"}), 404)
     if not can_access_case(user, case):
@@ -278,31 +428,58 @@ def get_accessible_case_or_404(case_id, user):
 @jwt_required()
 def list_cases():
     user = User.query.get(int(get_jwt_identity()))
-    status_filter = request.args.get("status")
-    case_type = request.args.get("type")
-    priority = request.args.get("priority")
+    paged = "limit" in request.args or "cursor" in request.args
+    try:
+        fields = parse_fields(request.args.get("fields"), CASE_FIELDS)
+        if paged:
+            limit = parse_page_size(request.args.get("limit"))
+            cursor = decode_cursor(request.args.get("cursor"))
+    except ValueError as exc:
+        return jsonify({"error": str(exc)}), 400
+
+    query = apply_case_filters(apply_case_scope(Case.query, user), request.args)
+    etag = make_etag(scoped_rows_version(user, query, Case))
+    cached = not_modified(etag)
+    if cached:
+        return cached
 
-    query = apply_case_scope(Case.query, user)
+    if fields:
+        # Pickers ask for a few keys; select only their columns, as plain rows.
+        query = select_fields(query, CASE_FIELDS, fields, Case.created_at, Case.id)
+    else:
+        query = query.options(joinedload(Case.advocate))
 
-    if status_filter:
-        query = query.filter_by(status=status_filter)
-    if case_type:
-        query = query.filter_by(case_type=case_type)
-    if priority:
-        query = query.filter_by(priority=priority)
+    if not paged:
+        cases = query.order_by(Case.created_at.desc(), Case.id.desc()).all()
+        return with_etag(jsonify(serialize_rows(cases, CASE_FIELDS, fields)), etag), 200
 
-    cases = query.order_by(Case.created_at.desc()).all()
-    return jsonify([case.to_dict() for case in cases]), 200
+    rows = apply_keyset_page(query, Case.created_at, Case.id, cursor, limit).all()
+    cases, next_cursor = split_page(rows, limit)
+    return with_etag(jsonify({"items": serialize_rows(cases, CASE_FIELDS, fields), "next": next_cursor}), etag), 200
 
 
 @cases_bp.route("/<int:case_id>", methods=["GET"])
 @jwt_required()
 def get_case(case_id):
     user = User.query.get(int(get_jwt_identity()))
-    case, error = get_accessible_case_or_404(case_id, user)
+    detail_limit = max(request.args.get("limit", 0, type=int), 0) or None
+
+    etag = None
+    owners = db.session.query(Case.advocate_id, Case.petitioner_user_id).filter(Case.id == case_id).first()
+    if owners and can_access_case(user, owners):
+        # Timeline entries are not change-tracked, so their newest id is part of the version.
+        timeline_version = db.session.query(db.func.max(CaseTimeline.id)).filter(CaseTimeline.case_id == case_id).scalar()
+        etag = make_etag(scoped_rows_version(user, Case.query.filter(Case.id == case_id), Case), timeline_version or 0)
+        cached = not_modified(etag)
+        if cached:
+            return cached
+
+    # With a limit each section is read as its own ordered, limited query,
+    # so eager-loading the full collections would be wasted work.
+    case, error = get_accessible_case_or_404(case_id, user, with_details=detail_limit is None)
     if error:
         return error
-    return jsonify(case.to_dict(include_details=True)), 200
+    return with_etag(jsonify(case.to_dict(include_details=True, detail_limit=detail_limit)), etag), 200
 
 
 @cases_bp.route("", methods=["POST"])
@@ -327,6 +504,7 @@ def create_case():
         status=payload["status"],
         priority=payload["priority"],
         petitioner=payload["petitioner"],
+        petitioner_user_id=payload["petitioner_user_id"],
         respondent=payload["respondent"],
         advocate_id=payload["advocate_id"],
         judge=payload["judge"],
@@ -363,7 +541,7 @@ def create_case():
             priority="medium",
         )
 
-    sync_advocate_active_cases(case.advocate_id)
+    adjust_advocate_active_cases(current=(case.advocate_id, case.status))
     db.session.commit()
     return jsonify({"message": "Case created", "case": case.to_dict()}), 201
 
@@ -395,6 +573,7 @@ def update_case(case_id):
     case.status = payload["status"]
     case.priority = payload["priority"]
     case.petitioner = payload["petitioner"]
+    case.petitioner_user_id = payload["petitioner_user_id"]
     case.respondent = payload["respondent"]
     case.advocate_id = payload["advocate_id"]
     case.judge = payload["judge"]
@@ -446,7 +625,7 @@ def update_case(case_id):
             priority="medium",
         )
 
-    sync_advocate_active_cases(old_advocate_id, case.advocate_id)
+    adjust_advocate_active_cases((old_advocate_id, previous_status), (case.advocate_id, case.status))
     db.session.commit()
     return jsonify({"message": "Case updated", "case": case.to_dict()}), 200
 
@@ -462,10 +641,9 @@ def delete_case(case_id):
     if not case:
         return jsonify({"error": "Case not found"}), 404
 
-    advocate_id = case.advocate_id
+    previous = (case.advocate_id, case.status)
     db.session.delete(case)
-    db.session.flush()
-    sync_advocate_active_cases(advocate_id)
+    adjust_advocate_active_cases(previous=previous)
     db.session.commit()
     return jsonify({"message": "Case deleted"}), 200
 
@@ -478,24 +656,49 @@ def search_cases():
     if not query_text:
         return jsonify([]), 200
 
-    results = apply_case_scope(Case.query, user).filter(
-        db.or_(
-            Case.case_number.ilike(f"%{query_text}%"),
-            Case.title.ilike(f"%{query_text}%"),
-            Case.petitioner.ilike(f"%{query_text}%"),
-            Case.respondent.ilike(f"%{query_text}%"),
-            Case.case_type.ilike(f"%{query_text}%"),
+    scoped_query = apply_case_scope(Case.query, user)
+    if db.engine.dialect.name != "mysql":
+        results = scoped_query.filter(
+            db.or_(
+                Case.case_number.ilike(f"%{query_text}%"),
+                Case.title.ilike(f"%{query_text}%"),
+                Case.petitioner.ilike(f"%{query_text}%"),
+                Case.respondent.ilike(f"%{query_text}%"),
+                Case.case_type.ilike(f"%{query_text}%"),
+            )
+        ).limit(SEARCH_RESULT_LIMIT).all()
+        return jsonify([case.to_dict() for case in results]), 200
+
+    # Case numbers are matched on their prefix through the unique index; their
+    # year and sequence segments (e.g. "0123" in CS/2024/0123), the title,
+    # parties and type go through the FULLTEXT index ranked by relevance.
+    results = (
+        scoped_query.filter(Case.case_number.startswith(query_text, autoescape=True))
+        .order_by(Case.case_number.asc())
+        .limit(SEARCH_RESULT_LIMIT)
+        .all()
+    )
+
+    terms = build_fulltext_terms(query_text)
+    if terms and len(results) < SEARCH_RESULT_LIMIT:
+        relevance = match(Case.case_number, Case.title, Case.petitioner, Case.respondent, Case.case_type, against=terms).in_boolean_mode()
+        seen_ids = {case.id for case in results}
+        ranked = (
+            scoped_query.filter(relevance)
+            .order_by(relevance.desc(), Case.id.desc())
+            .limit(SEARCH_RESULT_LIMIT)
+            .all()
         )
-    ).limit(20).all()
+        results.extend(case for case in ranked if case.id not in seen_ids)
 
-    return jsonify([case.to_dict() for case in results]), 200
+    return jsonify([case.to_dict() for case in results[:SEARCH_RESULT_LIMIT]]), 200
 
 
 @cases_bp.route("/qr/<case_number>", methods=["GET"])
 @jwt_required()
 def qr_lookup(case_number):
     user = User.query.get(int(get_jwt_identity()))
-    case = Case.query.filter_by(case_number=case_number).first()
+    case = Case.query.options(*case_detail_options()).filter_by(case_number=case_number).first()
     if not case:
         return jsonify({"error": "Case not found"}), 404
     if not can_access_case(user, case):
@@ -531,7 +734,7 @@ def case_report_links(case_id):
 @jwt_required()
 def export_case_csv(case_id):
     user = User.query.get(int(get_jwt_identity()))
-    case, error = get_accessible_case_or_404(case_id, user)
+    case, error = get_accessible_case_or_404(case_id, user, with_details=True)
     if error:
         return error
 
@@ -543,6 +746,25 @@ def export_case_csv(case_id):
     )
 
 
+@cases_bp.route("/export.csv", methods=["GET"])
+@jwt_required()
+def export_cases_csv():
+    """Every case in the caller's scope (narrowed by the list filters), one row each.
+
+    Rows come off a server-side cursor in EXPORT_BATCH_SIZE batches and leave
+    as fixed-size chunks, so memory stays flat however many cases match.
+    """
+    user = User.query.get(int(get_jwt_identity()))
+    query = case_export_query(user, request.args).order_by(Case.id.asc()).yield_per(EXPORT_BATCH_SIZE)
+
+    filename = f"cases-{date.today().isoformat()}.csv"
+    return Response(
+        stream_with_context(stream_cases_csv(query)),
+        mimetype="text/csv",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"', "X-Accel-Buffering": "no"},
+    )
+
+
 @cases_bp.route("/<int:case_id>/report.pdf", methods=["GET"])
 @jwt_required()
 def export_case_pdf(case_id):
@@ -553,13 +775,46 @@ def export_case_pdf(case_id):
     return build_pdf_response(case)
 
 
+@cases_bp.route("/reports", methods=["POST"])
+@jwt_required()
+def bulk_case_reports():
+    """Reports for many cases as one merged PDF (``format: "pdf"``) or a ZIP of PDFs (``"zip"``).
+
+    Reports are rendered across the report process pool and streamed in
+    order as they finish, so a 500-case bundle uses every core and is never
+    held in memory whole. With ``async: true`` the bundle is built by a
+    background job instead, and the response is the queued job.
+    """
+    user = User.query.get(int(get_jwt_identity()))
+    data = request.get_json() or {}
+    output = str(data.get("format") or "pdf").lower()
+    if output not in {"pdf", "zip"}:
+        return jsonify({"error": "format must be pdf or zip"}), 400
+
+    if data.get("async"):
+        job, error = submit_job("case_reports", user, data)
+        return error or queued_response(job)
+
+    case_ids, error = bulk_report_case_ids(user, data)
+    if error:
+        return error
+
+    stream = stream_merged_pdf if output == "pdf" else stream_report_zip
+    filename = f"case-reports-{date.today().isoformat()}.{output}"
+    return Response(
+        stream_with_context(stream(case_report_sources(case_ids))),
+        mimetype="application/pdf" if output == "pdf" else "application/zip",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"', "X-Accel-Buffering": "no"},
+    )
+
+
 @cases_bp.route("/shared/report/<token>.pdf", methods=["GET"])
 def shared_case_pdf(token):
     payload = load_share_token(current_app.config["JWT_SECRET_KEY"], token)
     if not payload:
         return jsonify({"error": "Invalid share link"}), 404
 
-    case = Case.query.get(payload.get("case_id"))
+    case = Case.query.filter(Case.id == payload.get("case_id")).first()
     if not case or case.case_number != payload.get("case_number"):
         return jsonify({"error": "Case not found"}), 404
     return build_pdf_response(case)
@@ -571,7 +826,7 @@ def shared_case_details(token):
     if not payload:
         return jsonify({"error": "Invalid share link"}), 404
 
-    case = Case.query.get(payload.get("case_id"))
+    case = Case.query.options(*case_detail_options()).filter(Case.id == payload.get("case_id")).first()
     if not case or case.case_number != payload.get("case_number"):
         return jsonify({"error": "Case not found"}), 404
 
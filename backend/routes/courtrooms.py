@@ -7,6 +7,7 @@ from models import db
 from models.case import Hearing
 from models.courtroom import Courtroom
 from models.user import User
+from utils.etags import make_etag, not_modified, query_version, with_etag
 
 courtrooms_bp = Blueprint("courtrooms", __name__, url_prefix="/api/courtrooms")
 
@@ -42,8 +43,13 @@ def list_courtrooms():
     if status_filter:
         query = query.filter_by(status=status_filter)
 
+    etag = make_etag(query_version(query, Courtroom))
+    cached = not_modified(etag)
+    if cached:
+        return cached
+
     rooms = query.order_by(Courtroom.id.asc()).all()
-    return jsonify([room.to_dict() for room in rooms]), 200
+    return with_etag(jsonify([room.to_dict() for room in rooms]), etag), 200
 
 
 @courtrooms_bp.route("/availability", methods=["GET"])
@@ -0,0 +1,192 @@
+import threading
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+from flask import Blueprint, current_app, jsonify, request
+from flask_jwt_extended import get_jwt_identity, jwt_required
+from sqlalchemy import func, select
+from sqlalchemy.orm import joinedload
+
+from models import db
+from models.case import Case, Hearing
+from models.courtroom import Courtroom
+from models.document import Document
+from models.notification import Notification
+from models.task import Task
+from models.user import User
+from routes.analytics import (
+    all_advocates_payload,
+    cases_by_type_payload,
+    cases_trend_payload,
+    daily_hearings_payload,
+    dashboard_payload,
+)
+from routes.cases import ACTIVE_CASE_STATUSES, apply_case_scope
+from routes.documents import scoped_document_query
+from routes.hearings import scoped_hearing_query
+from routes.sync import encode_sync_token
+from utils.cache import cache_scope, cached_value
+from utils.pagination import apply_keyset_page, split_page
+
+dashboard_bp = Blueprint("dashboard", __name__, url_prefix="/api/dashboard")
+
+# What section builders may read about the caller. A plain tuple rather than
+# the User row, so worker threads never touch the request thread's session.
+Identity = namedtuple("Identity", ["id", "role"])
+
+DASHBOARD_CASE_LIMIT = 20
+
+
+def case_page(user):
+    """The newest DASHBOARD_CASE_LIMIT cases in scope, shaped like GET /api/cases?limit=.
+
+    ``next`` continues through /api/cases?cursor=, so the dashboard never
+    pulls the whole table.
+    """
+    query = apply_case_scope(Case.query.options(joinedload(Case.advocate)), user)
+    rows = apply_keyset_page(query, Case.created_at, Case.id, None, DASHBOARD_CASE_LIMIT).all()
+    cases, next_cursor = split_page(rows, DASHBOARD_CASE_LIMIT)
+    return {"items": [case.to_dict() for case in cases], "next": next_cursor}
+
+
+def case_counts(user):
+    """Cases in scope, in total and still active, for the dashboard's stat cards."""
+    rows = apply_case_scope(Case.query, user).with_entities(Case.status, func.count(Case.id)).group_by(Case.status)
+    counts = {status: count for status, count in rows}
+    return {
+        "total": sum(counts.values()),
+        "active": sum(count for status, count in counts.items() if status in ACTIVE_CASE_STATUSES),
+    }
+
+
+def task_list(user):
+    return [task.to_dict() for task in Task.query.filter_by(user_id=user.id).order_by(Task.due_date.asc())]
+
+
+def document_list(user):
+    return [document.to_dict() for document in scoped_document_query(user).order_by(Document.uploaded_at.desc())]
+
+
+def hearing_list(user):
+    query = scoped_hearing_query(user).order_by(Hearing.date.desc(), Hearing.start_time.desc())
+    return [hearing.to_dict() for hearing in query]
+
+
+def calendar_list(user):
+    query = scoped_hearing_query(user).order_by(Hearing.date.asc(), Hearing.start_time.asc())
+    return [hearing.to_calendar_event() for hearing in query]
+
+
+def notification_list(user):
+    query = Notification.query.filter_by(user_id=user.id).order_by(Notification.created_at.desc())
+    return [notification.to_dict() for notification in query]
+
+
+def courtroom_list(user):
+    return [room.to_dict() for room in Courtroom.query.order_by(Courtroom.id.asc())]
+
+
+def analytics_section(name, build, per_user=False):
+    """Wrap an analytics payload so it shares the analytics response cache."""
+
+    def section(user):
+        compute = (lambda: build(user)) if per_user else build
+        return cached_value(("dashboard", name, *cache_scope(user)), compute)
+
+    return section
+
+
+# Section name -> builder, per role; each mirrors the list endpoint the
+# dashboard used to call on its own.
+ROLE_SECTIONS = {
+    "court": {
+        "cases": case_page,
+        "stats": analytics_section("stats", dashboard_payload, per_user=True),
+        "casesTrend": analytics_section("casesTrend", cases_trend_payload),
+        "casesByType": analytics_section("casesByType", cases_by_type_payload),
+        "dailyHearings": analytics_section("dailyHearings", daily_hearings_payload),
+        "advocates": analytics_section("advocates", all_advocates_payload),
+        "courtrooms": courtroom_list,
+    },
+    "advocate": {
+        "cases": case_page,
+        "caseCounts": case_counts,
+        "tasks": task_list,
+        "documents": document_list,
+        "calendar": calendar_list,
+        "notifications": notification_list,
+    },
+    "public": {
+        "cases": case_page,
+        "caseCounts": case_counts,
+        "hearings": hearing_list,
+        "notifications": notification_list,
+    },
+}
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def bootstrap_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=current_app.config.get("DASHBOARD_BOOTSTRAP_WORKERS", 4),
+                thread_name_prefix="dashboard-bootstrap",
+            )
+    return _executor
+
+
+def build_section(app, build, identity):
+    # Each worker gets its own app context, and with it its own session and
+    # database connection.
+    with app.app_context():
+        return build(identity)
+
+
+def requested_sections(user):
+    available = ROLE_SECTIONS.get(user.role, {})
+    raw_value = str(request.args.get("sections") or "").strip()
+    if not raw_value:
+        return available
+
+    names = [name.strip() for name in raw_value.split(",") if name.strip()]
+    unknown = [name for name in names if name not in available]
+    if unknown:
+        raise ValueError(f"Unknown dashboard section(s): {', '.join(unknown)}")
+    return {name: available[name] for name in names}
+
+
+# ── GET /api/dashboard/bootstrap ───────────────────────────────────
+@dashboard_bp.route("/bootstrap", methods=["GET"])
+@jwt_required()
+def bootstrap():
+    """Everything a role's dashboard renders, in one response.
+
+    ``?sections=cases,tasks`` limits the response to the named sections.
+    ``syncToken`` is taken before any section is read, so passing it to
+    /api/sync?since= returns every change the sections may have missed.
+    """
+    user = User.query.get(int(get_jwt_identity()))
+    if not user:
+        return jsonify({"error": "User not found"}), 404
+
+    try:
+        sections = requested_sections(user)
+    except ValueError as exc:
+        return jsonify({"error": str(exc)}), 400
+
+    identity = Identity(user.id, user.role)
+    sync_token = encode_sync_token(db.session.execute(select(func.now())).scalar())
+    if len(sections) <= 1:
+        payload = {name: build(identity) for name, build in sections.items()}
+    else:
+        app = current_app._get_current_object()
+        futures = {
+            name: bootstrap_executor().submit(build_section, app, build, identity)
+            for name, build in sections.items()
+        }
+        payload = {name: future.result() for name, future in futures.items()}
+    return jsonify({**payload, "syncToken": sync_token}), 200
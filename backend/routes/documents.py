@@ -7,9 +7,11 @@ from werkzeug.utils import secure_filename
 
 from models import db
 from models.case import Case, CaseTimeline
-from models.document import Document
+from models.document import DOCUMENT_FIELDS, Document
 from models.notification import Notification
 from models.user import User
+from utils.etags import make_etag, not_modified, scoped_rows_version, with_etag
+from utils.fields import parse_fields, select_fields, serialize_rows
 from utils.exporters import sanitize_filename
 
 documents_bp = Blueprint("documents", __name__, url_prefix="/api/documents")
@@ -17,10 +19,6 @@ documents_bp = Blueprint("documents", __name__, url_prefix="/api/documents")
 ALLOWED_EXTENSIONS = {"pdf", "jpg", "jpeg", "png", "gif", "mp4", "doc", "docx", "xls", "xlsx"}
 
 
-def normalize_name(value):
-    return " ".join(str(value or "").split()).strip().lower()
-
-
 def allowed_file(filename):
     return "." in filename and filename.rsplit(".", 1)[1].lower() in ALLOWED_EXTENSIONS
 
@@ -31,7 +29,7 @@ def can_access_case(user, case):
     if user.role == "advocate":
         return case.advocate_id == user.id
     if user.role == "public":
-        return normalize_name(case.petitioner) == normalize_name(user.name)
+        return case.petitioner_user_id == user.id
     return False
 
 
@@ -66,18 +64,10 @@ def format_file_size(path):
 
 
 def queue_document_notifications(case, title, client_message, advocate_message, priority="medium"):
-    client = next(
-        (
-            public_user
-            for public_user in User.query.filter_by(role="public").all()
-            if normalize_name(public_user.name) == normalize_name(case.petitioner)
-        ),
-        None,
-    )
-    if client and client_message:
+    if case.petitioner_user_id and client_message:
         db.session.add(
             Notification(
-                user_id=client.id,
+                user_id=case.petitioner_user_id,
                 type="document",
                 title=title,
                 message=client_message,
@@ -108,19 +98,28 @@ def add_timeline_entry(case_id, title, description):
     )
 
 
+def scoped_document_query(user):
+    """Documents on the cases ``user`` can see."""
+    query = Document.query.join(Case)
+    if user.role == "advocate":
+        query = query.filter(Case.advocate_id == user.id)
+    elif user.role == "public":
+        query = query.filter(Case.petitioner_user_id == user.id)
+    return query
+
+
 @documents_bp.route("", methods=["GET"])
 @jwt_required()
 def list_documents():
     user = User.query.get(int(get_jwt_identity()))
     case_id = request.args.get("case_id", type=int)
     status_filter = request.args.get("status")
+    try:
+        fields = parse_fields(request.args.get("fields"), DOCUMENT_FIELDS)
+    except ValueError as exc:
+        return jsonify({"error": str(exc)}), 400
 
-    query = Document.query.join(Case)
-    if user.role == "advocate":
-        query = query.filter(Case.advocate_id == user.id)
-    elif user.role == "public":
-        query = query.filter(db.func.lower(db.func.trim(Case.petitioner)) == normalize_name(user.name))
-
+    query = scoped_document_query(user)
     if case_id:
         query = query.filter(Document.case_id == case_id)
     if status_filter == "verified":
@@ -128,8 +127,15 @@ def list_documents():
     elif status_filter == "pending":
         query = query.filter(Document.verified.is_(False))
 
+    etag = make_etag(scoped_rows_version(user, query, Document))
+    cached = not_modified(etag)
+    if cached:
+        return cached
+
+    if fields:
+        query = select_fields(query, DOCUMENT_FIELDS, fields)
     docs = query.order_by(Document.uploaded_at.desc()).all()
-    return jsonify([document.to_dict() for document in docs]), 200
+    return with_etag(jsonify(serialize_rows(docs, DOCUMENT_FIELDS, fields)), etag), 200
 
 
 @documents_bp.route("", methods=["POST"])
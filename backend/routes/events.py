@@ -0,0 +1,58 @@
+from flask import Blueprint, Response, current_app, jsonify, request
+from flask_jwt_extended import get_jwt_identity, jwt_required
+
+from models.user import User
+from utils.events import event_hub, format_sse, missed_changes
+
+events_bp = Blueprint("events", __name__, url_prefix="/api/events")
+
+
+def event_stream(hub, subscription, replayed, overflowed, heartbeat):
+    replayed_ids = {change.id for change in replayed}
+    try:
+        yield "retry: 5000\n\n"
+        for change in replayed:
+            yield format_sse("change", change.payload, change.id)
+        while True:
+            if overflowed:
+                # Changes were dropped; the client refetches through /api/sync.
+                yield format_sse("resync", {})
+            changes, overflowed = subscription.drain(heartbeat)
+            fresh = [change for change in changes if change.id not in replayed_ids]
+            for change in fresh:
+                yield format_sse("change", change.payload, change.id)
+            if not fresh and not overflowed:
+                # Also how a closed connection is noticed: the write fails.
+                yield ": keep-alive\n\n"
+    finally:
+        hub.unsubscribe(subscription)
+
+
+# ── GET /api/events (Server-Sent Events) ───────────────────────────
+@events_bp.route("", methods=["GET"])
+@jwt_required(locations=["headers", "query_string"])
+def stream_events():
+    """Push a ``change`` event for every case, hearing, document and notification
+    change the caller can see, scoped like the list endpoints.
+
+    EventSource cannot set headers, so the token may also be passed as
+    ``?jwt=``. A reconnecting client's ``Last-Event-ID`` replays what it
+    missed; a ``resync`` event means changes were dropped and it should call
+    /api/sync instead.
+    """
+    user = User.query.get(int(get_jwt_identity()))
+    last_event_id = request.headers.get("Last-Event-ID") or request.args.get("last_event_id")
+    if last_event_id and not str(last_event_id).isdigit():
+        return jsonify({"error": "Invalid Last-Event-ID"}), 400
+
+    app = current_app._get_current_object()
+    hub = event_hub(app)
+    # Subscribe before reading the backlog so nothing falls between the two.
+    subscription = hub.subscribe(user.id, user.role, app.config["EVENTS_QUEUE_SIZE"])
+    replayed, overflowed = missed_changes(user, int(last_event_id)) if last_event_id else ([], False)
+
+    return Response(
+        event_stream(hub, subscription, replayed, overflowed, app.config["EVENTS_HEARTBEAT"]),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -4,10 +4,12 @@ from flask import Blueprint, jsonify, request
 from flask_jwt_extended import get_jwt_identity, jwt_required
 
 from models import db
-from models.case import Case, CaseTimeline, Hearing
+from models.case import HEARING_FIELDS, Case, CaseTimeline, Hearing
 from models.courtroom import Courtroom
 from models.notification import Notification
 from models.user import User
+from utils.etags import make_etag, not_modified, scoped_rows_version, with_etag
+from utils.fields import parse_fields, select_fields, serialize_rows
 
 hearings_bp = Blueprint("hearings", __name__, url_prefix="/api/hearings")
 
@@ -22,7 +24,7 @@ def can_access_case(user, case):
     if user.role == "advocate":
         return case.advocate_id == user.id
     if user.role == "public":
-        return normalize_name(case.petitioner) == normalize_name(user.name)
+        return case.petitioner_user_id == user.id
     return False
 
 
@@ -103,18 +105,10 @@ def sync_case_schedule(case):
 
 
 def queue_hearing_notifications(case, title, client_message, advocate_message):
-    client = next(
-        (
-            public_user
-            for public_user in User.query.filter_by(role="public").all()
-            if normalize_name(public_user.name) == normalize_name(case.petitioner)
-        ),
-        None,
-    )
-    if client:
+    if case.petitioner_user_id:
         db.session.add(
             Notification(
-                user_id=client.id,
+                user_id=case.petitioner_user_id,
                 type="hearing",
                 title=title,
                 message=client_message,
@@ -145,22 +139,40 @@ def add_timeline_entry(case_id, event, description):
     )
 
 
+def scoped_hearing_query(user):
+    """Hearings on the cases ``user`` can see."""
+    query = Hearing.query.join(Case)
+    if user.role == "advocate":
+        query = query.filter(Case.advocate_id == user.id)
+    elif user.role == "public":
+        query = query.filter(Case.petitioner_user_id == user.id)
+    return query
+
+
 @hearings_bp.route("", methods=["GET"])
 @jwt_required()
 def list_hearings():
     user = User.query.get(int(get_jwt_identity()))
     case_id = request.args.get("case_id", type=int)
+    try:
+        fields = parse_fields(request.args.get("fields"), HEARING_FIELDS)
+    except ValueError as exc:
+        return jsonify({"error": str(exc)}), 400
 
-    query = Hearing.query.join(Case)
     if case_id:
-        query = query.filter(Hearing.case_id == case_id)
-    elif user.role == "advocate":
-        query = query.filter(Case.advocate_id == user.id)
-    elif user.role == "public":
-        query = query.filter(db.func.lower(db.func.trim(Case.petitioner)) == normalize_name(user.name))
+        query = Hearing.query.join(Case).filter(Hearing.case_id == case_id)
+    else:
+        query = scoped_hearing_query(user)
 
+    etag = make_etag(scoped_rows_version(user, query, Hearing))
+    cached = not_modified(etag)
+    if cached:
+        return cached
+
+    if fields:
+        query = select_fields(query, HEARING_FIELDS, fields)
     hearings = query.order_by(Hearing.date.desc(), Hearing.start_time.desc()).all()
-    return jsonify([hearing.to_dict() for hearing in hearings]), 200
+    return with_etag(jsonify(serialize_rows(hearings, HEARING_FIELDS, fields)), etag), 200
 
 
 @hearings_bp.route("", methods=["POST"])
@@ -305,12 +317,11 @@ def delete_hearing(hearing_id):
 @jwt_required()
 def calendar_events():
     user = User.query.get(int(get_jwt_identity()))
-
-    query = Hearing.query.join(Case)
-    if user.role == "advocate":
-        query = query.filter(Case.advocate_id == user.id)
-    elif user.role == "public":
-        query = query.filter(db.func.lower(db.func.trim(Case.petitioner)) == normalize_name(user.name))
+    query = scoped_hearing_query(user)
+    etag = make_etag(scoped_rows_version(user, query, Hearing))
+    cached = not_modified(etag)
+    if cached:
+        return cached
 
     hearings = query.order_by(Hearing.date.asc(), Hearing.start_time.asc()).all()
-    return jsonify([hearing.to_calendar_event() for hearing in hearings]), 200
+    return with_etag(jsonify([hearing.to_calendar_event() for hearing in hearings]), etag), 200
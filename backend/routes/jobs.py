@@ -0,0 +1,81 @@
+import os
+
+from flask import Blueprint, jsonify, request, send_file
+from flask_jwt_extended import get_jwt_identity, jwt_required
+
+import utils.job_types  # noqa: F401  registers the job handlers
+from models.job import Job
+from models.user import User
+from utils.jobs import JOB_TYPES, job_result_path, queued_response, submit_job
+
+jobs_bp = Blueprint("jobs", __name__, url_prefix="/api/jobs")
+
+RECENT_JOBS_LIMIT = 50
+
+
+def get_own_job_or_404(job_id, user):
+    job = Job.query.get(job_id)
+    # Other users' jobs are reported as missing rather than forbidden.
+    if not job or job.user_id != user.id:
+        return None, (jsonify({"error": "Job not found"}), 404)
+    return job, None
+
+
+# ── POST /api/jobs ─────────────────────────────────────────────────
+@jobs_bp.route("", methods=["POST"])
+@jwt_required()
+def create_job():
+    """Queue a ``kind`` job with ``params``; poll GET /api/jobs/<id> for its progress."""
+    user = User.query.get(int(get_jwt_identity()))
+    data = request.get_json() or {}
+    params = data.get("params") or {}
+    if not isinstance(params, dict):
+        return jsonify({"error": "params must be an object"}), 400
+
+    job, error = submit_job(str(data.get("kind") or ""), user, params)
+    return error or queued_response(job)
+
+
+# ── GET /api/jobs ──────────────────────────────────────────────────
+@jobs_bp.route("", methods=["GET"])
+@jwt_required()
+def list_jobs():
+    user_id = int(get_jwt_identity())
+    jobs = Job.query.filter_by(user_id=user_id).order_by(Job.id.desc()).limit(RECENT_JOBS_LIMIT)
+    return jsonify([job.to_dict() for job in jobs]), 200
+
+
+# ── GET /api/jobs/kinds ────────────────────────────────────────────
+@jobs_bp.route("/kinds", methods=["GET"])
+@jwt_required()
+def list_job_kinds():
+    user = User.query.get(int(get_jwt_identity()))
+    return jsonify(sorted(kind for kind, spec in JOB_TYPES.items() if user.role in spec.roles)), 200
+
+
+# ── GET /api/jobs/<id> ─────────────────────────────────────────────
+@jobs_bp.route("/<int:job_id>", methods=["GET"])
+@jwt_required()
+def get_job(job_id):
+    user = User.query.get(int(get_jwt_identity()))
+    job, error = get_own_job_or_404(job_id, user)
+    if error:
+        return error
+    return jsonify(job.to_dict()), 200
+
+
+# ── GET /api/jobs/<id>/result ──────────────────────────────────────
+@jobs_bp.route("/<int:job_id>/result", methods=["GET"])
+@jwt_required()
+def download_job_result(job_id):
+    user = User.query.get(int(get_jwt_identity()))
+    job, error = get_own_job_or_404(job_id, user)
+    if error:
+        return error
+    if job.status != "succeeded" or not job.result_name:
+        return jsonify({"error": "This job has no file to download"}), 404
+
+    path = job_result_path(job)
+    if not os.path.exists(path):
+        return jsonify({"error": "Stored result not found"}), 404
+    return send_file(path, mimetype=job.result_type, as_attachment=True, download_name=job.result_name)
@@ -2,6 +2,7 @@ from flask import Blueprint, request, jsonify
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from models import db
 from models.case_note import CaseNote
+from utils.etags import make_etag, not_modified, query_version, with_etag
 
 notes_bp = Blueprint("notes", __name__, url_prefix="/api/notes")
 
@@ -17,8 +18,13 @@ def list_notes():
     if case_id:
         query = query.filter_by(case_id=case_id)
 
+    etag = make_etag(query_version(query, CaseNote))
+    cached = not_modified(etag)
+    if cached:
+        return cached
+
     notes = query.order_by(CaseNote.updated_at.desc()).all()
-    return jsonify([n.to_dict() for n in notes]), 200
+    return with_etag(jsonify([n.to_dict() for n in notes]), etag), 200
 
 
 # ── POST /api/notes ────────────────────────────────────────────────
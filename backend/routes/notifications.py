@@ -3,6 +3,9 @@ from flask_jwt_extended import jwt_required, get_jwt_identity
 from flask_mail import Message as MailMessage
 from models import db
 from models.notification import Notification
+from models.user import User
+from utils.etags import make_etag, not_modified, query_version, with_etag
+from utils.jobs import queued_response, submit_job
 
 notifications_bp = Blueprint("notifications", __name__, url_prefix="/api/notifications")
 
@@ -20,10 +23,14 @@ def init_mail(mail_instance):
 @jwt_required()
 def list_notifications():
     user_id = int(get_jwt_identity())
-    notifs = Notification.query.filter_by(user_id=user_id).order_by(
-        Notification.created_at.desc()
-    ).all()
-    return jsonify([n.to_dict() for n in notifs]), 200
+    query = Notification.query.filter_by(user_id=user_id)
+    etag = make_etag(query_version(query, Notification))
+    cached = not_modified(etag)
+    if cached:
+        return cached
+
+    notifs = query.order_by(Notification.created_at.desc()).all()
+    return with_etag(jsonify([n.to_dict() for n in notifs]), etag), 200
 
 
 # ── PUT /api/notifications/<id>/read ───────────────────────────────
@@ -62,11 +69,15 @@ def delete_notification(notif_id):
 @notifications_bp.route("/send-email", methods=["POST"])
 @jwt_required()
 def send_email_notification():
-    """Send an email notification using Flask-Mail."""
+    """Send an email notification using Flask-Mail; with ``async: true``, from a background job."""
     data = request.get_json()
     if not data.get("to") or not data.get("subject") or not data.get("body"):
         return jsonify({"error": "to, subject, and body are required"}), 400
 
+    if data.get("async"):
+        job, error = submit_job("send_email", User.query.get(int(get_jwt_identity())), data)
+        return error or queued_response(job)
+
     if mail is None:
         return jsonify({"error": "Mail service not configured"}), 503
 
@@ -0,0 +1,121 @@
+import base64
+import json
+from datetime import datetime, timedelta
+
+from flask import Blueprint, jsonify, request
+from flask_jwt_extended import get_jwt_identity, jwt_required
+from sqlalchemy import func, or_, select
+from sqlalchemy.orm import joinedload
+
+from models import db
+from models.case import Case, Hearing
+from models.case_note import CaseNote
+from models.document import Document
+from models.notification import Notification
+from models.task import Task
+from models.tombstone import Tombstone
+from models.user import User
+from routes.cases import apply_case_scope
+from routes.documents import scoped_document_query
+from routes.hearings import scoped_hearing_query
+
+sync_bp = Blueprint("sync", __name__, url_prefix="/api/sync")
+
+# Rows are re-sent for this long after the token's timestamp, so a write whose
+# transaction committed a moment after the previous sync is not missed.
+SYNC_OVERLAP = timedelta(seconds=5)
+# Tombstones older than this may be purged; older tokens get a full resync.
+TOMBSTONE_RETENTION = timedelta(days=30)
+
+CASE_ENTITIES = ("cases", "hearings", "documents")
+
+
+def encode_sync_token(timestamp):
+    payload = json.dumps({"t": timestamp.isoformat()}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_sync_token(token):
+    raw_value = str(token or "").strip()
+    if not raw_value:
+        return None
+
+    try:
+        padded = raw_value + "=" * (-len(raw_value) % 4)
+        return datetime.fromisoformat(json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))["t"])
+    except (ValueError, TypeError, KeyError) as exc:
+        raise ValueError("Invalid sync token") from exc
+
+
+# Entity name -> (model, scoped query for the user). Each mirrors its list endpoint.
+SYNCED_ENTITIES = {
+    "cases": (Case, lambda user: apply_case_scope(Case.query.options(joinedload(Case.advocate)), user)),
+    "hearings": (Hearing, scoped_hearing_query),
+    "documents": (Document, scoped_document_query),
+    "tasks": (Task, lambda user: Task.query.filter_by(user_id=user.id)),
+    "notes": (CaseNote, lambda user: CaseNote.query.filter_by(user_id=user.id)),
+    "notifications": (Notification, lambda user: Notification.query.filter_by(user_id=user.id)),
+}
+
+
+def tombstone_scope(user):
+    """Tombstones the user would have seen the row for."""
+    own_rows = (Tombstone.entity.notin_(CASE_ENTITIES)) & (Tombstone.user_id == user.id)
+    if user.role == "court":
+        case_rows = Tombstone.entity.in_(CASE_ENTITIES) & (Tombstone.reason == "deleted")
+    elif user.role == "advocate":
+        case_rows = Tombstone.entity.in_(CASE_ENTITIES) & (Tombstone.advocate_id == user.id)
+    else:
+        case_rows = Tombstone.entity.in_(CASE_ENTITIES) & (Tombstone.petitioner_user_id == user.id)
+    return or_(own_rows, case_rows)
+
+
+# ── GET /api/sync?since=<token> ────────────────────────────────────
+@sync_bp.route("", methods=["GET"])
+@jwt_required()
+def sync_changes():
+    """Rows created, changed or deleted in the caller's scope since ``since``.
+
+    Without a token (or with one older than the tombstone retention) every
+    row in scope is returned and ``full`` is true. The response's ``token``
+    is passed back as ``since`` on the next call.
+    """
+    user = User.query.get(int(get_jwt_identity()))
+    try:
+        since = decode_sync_token(request.args.get("since"))
+    except ValueError as exc:
+        return jsonify({"error": str(exc)}), 400
+
+    now = db.session.execute(select(func.now())).scalar()
+    full = since is None or since < now - TOMBSTONE_RETENTION
+    changed_after = None if full else since - SYNC_OVERLAP
+
+    changes = {}
+    changed_ids = {}
+    for name, (model, scoped_query) in SYNCED_ENTITIES.items():
+        query = scoped_query(user)
+        if changed_after is not None:
+            query = query.filter(model.updated_at >= changed_after)
+        rows = query.order_by(model.id.asc()).all()
+        if rows:
+            # Primary keys, not the serialized ids: not every to_dict() exposes databaseId.
+            changed_ids[name] = {row.id for row in rows}
+            changes[name] = [row.to_dict() for row in rows]
+
+    deleted = {}
+    if changed_after is not None:
+        tombstones = db.session.query(Tombstone.entity, Tombstone.entity_id).filter(
+            Tombstone.deleted_at >= changed_after,
+            tombstone_scope(user),
+        ).distinct()
+        for entity, entity_id in tombstones:
+            # Reassigned back into scope after the tombstone: the row wins.
+            if entity_id not in changed_ids.get(entity, ()):
+                deleted.setdefault(entity, []).append(entity_id)
+
+    return jsonify({
+        "token": encode_sync_token(now),
+        "full": full,
+        "changes": changes,
+        "deleted": {entity: sorted(ids) for entity, ids in deleted.items()},
+    }), 200
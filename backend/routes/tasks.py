@@ -2,6 +2,7 @@ from flask import Blueprint, request, jsonify
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from models import db
 from models.task import Task
+from utils.etags import make_etag, not_modified, query_version, with_etag
 from datetime import datetime
 
 tasks_bp = Blueprint("tasks", __name__, url_prefix="/api/tasks")
@@ -18,8 +19,13 @@ def list_tasks():
     if case_id:
         query = query.filter_by(case_id=case_id)
 
+    etag = make_etag(query_version(query, Task))
+    cached = not_modified(etag)
+    if cached:
+        return cached
+
     tasks = query.order_by(Task.due_date.asc()).all()
-    return jsonify([t.to_dict() for t in tasks]), 200
+    return with_etag(jsonify([t.to_dict() for t in tasks]), etag), 200
 
 
 # ── POST /api/tasks ────────────────────────────────────────────────
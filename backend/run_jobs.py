@@ -0,0 +1,45 @@
+"""
+Run the background job workers: bulk case reports, CSV exports, emails and
+analytics rebuilds queued through /api/jobs (or an endpoint's async flag).
+Run:  JOB_WORKERS=4 python run_jobs.py
+Each worker is its own process; more machines can run this against the same
+database, since workers claim jobs with a conditional update.
+"""
+
+import multiprocessing
+import signal
+import threading
+
+from app import create_app
+from config import Config
+from utils.jobs import work
+
+
+def run_worker():
+    app = create_app()
+    stop = threading.Event()
+    # Finish the current job, then exit.
+    signal.signal(signal.SIGTERM, lambda signum, frame: stop.set())
+    signal.signal(signal.SIGINT, lambda signum, frame: stop.set())
+    work(app, stop)
+
+
+def main():
+    workers = [
+        multiprocessing.Process(target=run_worker, name=f"job-worker-{index}")
+        for index in range(Config.JOB_WORKERS)
+    ]
+    for worker in workers:
+        worker.start()
+    print(f"Started {len(workers)} job workers; Ctrl+C stops them after their current jobs.")
+
+    try:
+        for worker in workers:
+            worker.join()
+    except KeyboardInterrupt:
+        for worker in workers:
+            worker.join()
+
+
+if __name__ == "__main__":
+    main()
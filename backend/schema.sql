@@ -15,6 +15,7 @@ USE legal_case_db;
 CREATE TABLE IF NOT EXISTS users (
   id              INT AUTO_INCREMENT PRIMARY KEY,
   name            VARCHAR(150) NOT NULL,
+  name_normalized VARCHAR(150),
   email           VARCHAR(150) UNIQUE,
   password_hash   VARCHAR(255),
   role            ENUM('public', 'advocate', 'court') NOT NULL,
@@ -35,7 +36,8 @@ CREATE TABLE IF NOT EXISTS users (
   admin_id        VARCHAR(50) UNIQUE,
   court_name      VARCHAR(200),
 
-  created_at      DATETIME DEFAULT CURRENT_TIMESTAMP
+  created_at      DATETIME DEFAULT CURRENT_TIMESTAMP,
+  INDEX ix_users_role_name_normalized (role, name_normalized)
 ) ENGINE=InnoDB;
 
 -- ── OTP Codes (for Citizen Aadhaar login) ────────────────────
@@ -57,7 +59,8 @@ CREATE TABLE IF NOT EXISTS courtrooms (
   current_case  VARCHAR(50),
   case_title    VARCHAR(300),
   start_time    VARCHAR(20),
-  case_type     VARCHAR(50)
+  case_type     VARCHAR(50),
+  updated_at    DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
 ) ENGINE=InnoDB;
 
 -- ── Cases ────────────────────────────────────────────────────
@@ -71,17 +74,34 @@ CREATE TABLE IF NOT EXISTS cases (
   priority        VARCHAR(10) DEFAULT 'medium',
   petitioner      VARCHAR(200) NOT NULL,
   respondent      VARCHAR(200) NOT NULL,
+  petitioner_user_id INT,
   advocate_id     INT,
   judge           VARCHAR(200),
   courtroom_id    INT,
   court_room_name VARCHAR(100),
   next_hearing    DATETIME,
   filing_date     DATE NOT NULL,
+  disposal_date   DATE,
   created_at      DATETIME DEFAULT CURRENT_TIMESTAMP,
+  updated_at      DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+  INDEX ix_cases_created_at_id (created_at, id),
+  INDEX ix_cases_advocate_created_at_id (advocate_id, created_at, id),
+  INDEX ix_cases_filing_date_status (filing_date, status),
+  INDEX ix_cases_petitioner_user_created_at_id (petitioner_user_id, created_at, id),
+  INDEX ix_cases_updated_at (updated_at),
+  INDEX ix_cases_disposal_date (disposal_date),
+  FULLTEXT INDEX ft_cases_search (case_number, title, petitioner, respondent, case_type),
   FOREIGN KEY (advocate_id) REFERENCES users(id) ON DELETE SET NULL,
+  FOREIGN KEY (petitioner_user_id) REFERENCES users(id) ON DELETE SET NULL,
   FOREIGN KEY (courtroom_id) REFERENCES courtrooms(id) ON DELETE SET NULL
 ) ENGINE=InnoDB;
 
+-- ── Case Number Sequences (one row per filing year) ──────────
+CREATE TABLE IF NOT EXISTS case_number_sequences (
+  year        INT PRIMARY KEY,
+  last_value  INT NOT NULL DEFAULT 0
+) ENGINE=InnoDB;
+
 -- ── Hearings ─────────────────────────────────────────────────
 CREATE TABLE IF NOT EXISTS hearings (
   id          INT AUTO_INCREMENT PRIMARY KEY,
@@ -93,6 +113,10 @@ CREATE TABLE IF NOT EXISTS hearings (
   location    VARCHAR(200),
   start_time  DATETIME,
   end_time    DATETIME,
+  updated_at  DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+  INDEX ix_hearings_case_date_start (case_id, date, start_time),
+  INDEX ix_hearings_date_status (date, status),
+  INDEX ix_hearings_updated_at (updated_at),
   FOREIGN KEY (case_id) REFERENCES cases(id) ON DELETE CASCADE
 ) ENGINE=InnoDB;
 
@@ -104,6 +128,7 @@ CREATE TABLE IF NOT EXISTS case_timeline (
   event       VARCHAR(200) NOT NULL,
   description VARCHAR(500),
   created_at  DATETIME DEFAULT CURRENT_TIMESTAMP,
+  INDEX ix_case_timeline_case_date_created (case_id, date, created_at),
   FOREIGN KEY (case_id) REFERENCES cases(id) ON DELETE CASCADE
 ) ENGINE=InnoDB;
 
@@ -119,6 +144,9 @@ CREATE TABLE IF NOT EXISTS documents (
   file_size    VARCHAR(20),
   verified     BOOLEAN DEFAULT FALSE,
   uploaded_at  DATETIME DEFAULT CURRENT_TIMESTAMP,
+  updated_at   DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+  INDEX ix_documents_case_uploaded_at (case_id, uploaded_at),
+  INDEX ix_documents_updated_at (updated_at),
   FOREIGN KEY (case_id)     REFERENCES cases(id) ON DELETE CASCADE,
   FOREIGN KEY (uploaded_by) REFERENCES users(id) ON DELETE CASCADE
 ) ENGINE=InnoDB;
@@ -133,6 +161,8 @@ CREATE TABLE IF NOT EXISTS tasks (
   priority    VARCHAR(10) DEFAULT 'medium',
   due_date    DATE,
   created_at  DATETIME DEFAULT CURRENT_TIMESTAMP,
+  updated_at  DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+  INDEX ix_tasks_user_updated_at (user_id, updated_at),
   FOREIGN KEY (case_id) REFERENCES cases(id) ON DELETE CASCADE,
   FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE
 ) ENGINE=InnoDB;
@@ -145,6 +175,7 @@ CREATE TABLE IF NOT EXISTS case_notes (
   content     TEXT NOT NULL,
   created_at  DATETIME DEFAULT CURRENT_TIMESTAMP,
   updated_at  DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+  INDEX ix_case_notes_user_updated_at (user_id, updated_at),
   FOREIGN KEY (case_id) REFERENCES cases(id) ON DELETE CASCADE,
   FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE
 ) ENGINE=InnoDB;
@@ -159,6 +190,8 @@ CREATE TABLE IF NOT EXISTS notifications (
   priority    VARCHAR(10) DEFAULT 'low',
   is_read     BOOLEAN DEFAULT FALSE,
   created_at  DATETIME DEFAULT CURRENT_TIMESTAMP,
+  updated_at  DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+  INDEX ix_notifications_user_updated_at (user_id, updated_at),
   FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE
 ) ENGINE=InnoDB;
 
@@ -174,4 +207,91 @@ CREATE TABLE IF NOT EXISTS messages (
   FOREIGN KEY (receiver_id) REFERENCES users(id) ON DELETE CASCADE
 ) ENGINE=InnoDB;
 
+-- ── Analytics Rollups (maintained on every case / hearing write) ──
+CREATE TABLE IF NOT EXISTS case_rollups (
+  month        DATE NOT NULL,
+  case_type    VARCHAR(50) NOT NULL,
+  status       VARCHAR(30) NOT NULL,
+  advocate_id  INT NOT NULL DEFAULT 0,
+  case_count   INT NOT NULL DEFAULT 0,
+  PRIMARY KEY (month, case_type, status, advocate_id)
+) ENGINE=InnoDB;
+
+CREATE TABLE IF NOT EXISTS hearing_rollups (
+  date           DATE NOT NULL,
+  courtroom      VARCHAR(200) NOT NULL DEFAULT '',
+  hearing_count  INT NOT NULL DEFAULT 0,
+  PRIMARY KEY (date, courtroom)
+) ENGINE=InnoDB;
+
+-- Written by rebuild_rollups.py; analytics read the rollups only once it exists.
+CREATE TABLE IF NOT EXISTS rollup_builds (
+  name      VARCHAR(50) PRIMARY KEY,
+  built_at  DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP
+) ENGINE=InnoDB;
+
+-- ── Daily pendency history (written by snapshot_pendency.py) ──
+CREATE TABLE IF NOT EXISTS pendency_snapshots (
+  date         DATE NOT NULL,
+  case_type    VARCHAR(50) NOT NULL,
+  courtroom    VARCHAR(100) NOT NULL DEFAULT '',
+  status       VARCHAR(30) NOT NULL,
+  case_count   INT NOT NULL DEFAULT 0,
+  PRIMARY KEY (date, case_type, courtroom, status)
+) ENGINE=InnoDB;
+
+-- ── Sync tombstones (deleted rows, read by /api/sync) ──
+CREATE TABLE IF NOT EXISTS tombstones (
+  id                  INT AUTO_INCREMENT PRIMARY KEY,
+  entity              VARCHAR(30) NOT NULL,
+  entity_id           INT NOT NULL,
+  reason              VARCHAR(20) NOT NULL DEFAULT 'deleted',
+  user_id             INT,
+  advocate_id         INT,
+  petitioner_user_id  INT,
+  deleted_at          DATETIME DEFAULT CURRENT_TIMESTAMP,
+  INDEX ix_tombstones_deleted_at (deleted_at)
+) ENGINE=InnoDB;
+
+-- ── Change events (pushed to /api/events, polled by every worker) ──
+CREATE TABLE IF NOT EXISTS change_events (
+  id                  INT AUTO_INCREMENT PRIMARY KEY,
+  entity              VARCHAR(30) NOT NULL,
+  entity_id           INT NOT NULL,
+  action              VARCHAR(20) NOT NULL,
+  case_id             INT,
+  user_id             INT,
+  advocate_id         INT,
+  petitioner_user_id  INT,
+  created_at          DATETIME DEFAULT CURRENT_TIMESTAMP,
+  INDEX ix_change_events_created_at (created_at),
+  INDEX ix_change_events_advocate_id (advocate_id, id),
+  INDEX ix_change_events_petitioner_id (petitioner_user_id, id),
+  INDEX ix_change_events_user_entity_id (user_id, entity, id)
+) ENGINE=InnoDB;
+
+-- ── Background jobs (queued by /api/jobs, run by run_jobs.py) ──
+CREATE TABLE IF NOT EXISTS jobs (
+  id                  INT AUTO_INCREMENT PRIMARY KEY,
+  kind                VARCHAR(50) NOT NULL,
+  user_id             INT NOT NULL,
+  params              TEXT,
+  status              VARCHAR(20) NOT NULL DEFAULT 'queued',
+  progress            INT NOT NULL DEFAULT 0,
+  message             VARCHAR(255),
+  result              TEXT,
+  result_name         VARCHAR(255),
+  result_type         VARCHAR(100),
+  error               TEXT,
+  attempts            INT NOT NULL DEFAULT 0,
+  worker              VARCHAR(100),
+  created_at          DATETIME DEFAULT CURRENT_TIMESTAMP,
+  started_at          DATETIME,
+  heartbeat_at        DATETIME,
+  finished_at         DATETIME,
+  FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE,
+  INDEX ix_jobs_status_id (status, id),
+  INDEX ix_jobs_user_created (user_id, created_at)
+) ENGINE=InnoDB;
+
 SELECT 'All tables created successfully!' AS result;
@@ -14,7 +14,13 @@ from models.notification import Notification
 from models.message import Message
 from models.courtroom import Courtroom
 from models.otp import OTPCode
+from models.rollup import CaseRollup, HearingRollup, PendencySnapshot
+from models.tombstone import Tombstone
+from models.change_event import ChangeEvent
+from models.job import Job
+from utils.rollups import rebuild_rollups
 from datetime import date, datetime, timedelta
+from migrate_case_parties import backfill_case_parties
 
 
 def seed():
@@ -32,7 +38,13 @@ def seed():
         Case.query.delete()
         Courtroom.query.delete()
         OTPCode.query.delete()
+        Job.query.delete()
         User.query.delete()
+        CaseRollup.query.delete()
+        HearingRollup.query.delete()
+        PendencySnapshot.query.delete()
+        Tombstone.query.delete()
+        ChangeEvent.query.delete()
         db.session.commit()
 
         # ═════════════════════════════════════════════════════════
@@ -385,6 +397,8 @@ def seed():
         db.session.add_all(messages)
 
         db.session.commit()
+        backfill_case_parties()
+        rebuild_rollups()
         print("\n✅ Database seeded successfully!")
         print(f"   Users:         {User.query.count()}")
         print(f"   Courtrooms:    {Courtroom.query.count()}")
@@ -14,6 +14,11 @@ from models.notification import Notification
 from models.message import Message
 from models.courtroom import Courtroom
 from models.otp import OTPCode
+from models.rollup import CaseRollup, HearingRollup, PendencySnapshot
+from models.tombstone import Tombstone
+from models.change_event import ChangeEvent
+from models.job import Job
+from utils.rollups import rebuild_rollups
 from datetime import date, datetime, timedelta
 import random
 
@@ -37,7 +42,13 @@ def seed_large():
         Case.query.delete()
         Courtroom.query.delete()
         OTPCode.query.delete()
+        Job.query.delete()
         User.query.delete()
+        CaseRollup.query.delete()
+        HearingRollup.query.delete()
+        PendencySnapshot.query.delete()
+        Tombstone.query.delete()
+        ChangeEvent.query.delete()
         db.session.commit()
 
         # -------------------------------------------------------------
@@ -145,6 +156,7 @@ def seed_large():
                 status=c_status,
                 priority=random.choice(priorities),
                 petitioner=pet.name,
+                petitioner_user_id=pet.id,
                 respondent=f"Respondent #{i}",
                 advocate_id=adv.id,
                 judge=random.choice(courtrooms).judge,
@@ -248,6 +260,7 @@ def seed_large():
         admins[0].admin_id = "ADMIN001"
 
         db.session.commit()
+        rebuild_rollups()
         
         print("\n✅ MASSIVE DATABASE SEEDING COMPLETED SUCCESSFULLY!")
         print(f"   Users:         {User.query.count()}")
@@ -183,6 +183,7 @@ def seed_review_data():
                 status=status,
                 priority=priorities[i % len(priorities)],
                 petitioner=petitioner_user.name,
+                petitioner_user_id=petitioner_user.id,
                 respondent=f"Respondent {start_index + i}",
                 advocate_id=advocate_user.id,
                 judge=room.judge if room else "Justice Demo",
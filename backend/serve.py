@@ -0,0 +1,32 @@
+"""
+Serve the API with gevent, so each open /api/events stream is a greenlet
+waiting on its queue rather than an OS thread.
+Run:  python serve.py
+Several processes (e.g. gunicorn -k gevent -w 4 serve:app) share change
+events through the change_events table.
+"""
+
+from gevent import monkey
+
+monkey.patch_all()
+
+import os  # noqa: E402
+
+from gevent.pywsgi import WSGIServer  # noqa: E402
+
+from app import create_app  # noqa: E402
+
+# Report render workers re-import this script as __mp_main__; they need no
+# app, and building one there would open database connections for nothing.
+if __name__ != "__mp_main__":
+    app = create_app()
+
+
+def main():
+    port = int(os.getenv("PORT", 5000))
+    print(f"Serving on http://0.0.0.0:{port}")
+    WSGIServer(("0.0.0.0", port), app).serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,19 @@
+"""
+Record today's case counts per type, court room and status in pendency_snapshots.
+Schedule once a day, late in the evening (e.g. cron: 55 23 * * *).
+Run:  python snapshot_pendency.py
+"""
+
+from app import create_app
+from utils.pendency import write_snapshot
+
+
+def main():
+    app = create_app()
+    with app.app_context():
+        rows = write_snapshot()
+        print(f"Wrote {rows} pendency snapshot rows for today.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+import threading
+import time
+from datetime import date, datetime, timedelta
+from functools import wraps
+
+from flask import current_app, make_response, request
+from flask_jwt_extended import get_jwt_identity
+from sqlalchemy import event
+
+from models import db
+
+
+class TTLCache:
+    """Small thread-safe in-process cache with per-entry expiry and hit counters.
+
+    ``invalidate()`` bumps a generation number instead of walking the
+    entries, so stale values are simply never read again and get replaced
+    or evicted lazily. Callers read ``generation`` before computing a value
+    and pass it to ``set()``, which drops the value if an invalidation
+    landed while it was being computed.
+    """
+
+    def __init__(self, max_entries=1024):
+        self.max_entries = max_entries
+        self._entries = {}
+        self._lock = threading.Lock()
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] == self._generation and entry[1] > now:
+                self.hits += 1
+                return entry[2]
+            self.misses += 1
+            return None
+
+    @property
+    def generation(self):
+        with self._lock:
+            return self._generation
+
+    def set(self, key, value, ttl, generation):
+        with self._lock:
+            if generation != self._generation:
+                return  # computed from data an invalidation has since replaced
+            if len(self._entries) >= self.max_entries:
+                self._evict_stale()
+            if len(self._entries) >= self.max_entries:
+                self._entries.pop(next(iter(self._entries)))
+            self._entries[key] = (generation, time.monotonic() + ttl, value)
+
+    def invalidate(self):
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hitRatio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "entries": len(self._entries),
+                "generation": self._generation,
+            }
+
+    def _evict_stale(self):
+        now = time.monotonic()
+        for key in [key for key, entry in self._entries.items() if entry[0] != self._generation or entry[1] <= now]:
+            del self._entries[key]
+
+
+analytics_cache = TTLCache()
+# Day-granularity reports; not invalidated on writes, entries roll over at midnight.
+daily_cache = TTLCache(max_entries=64)
+
+
+def cache_scope(user):
+    """Court staff share one view of the court; everyone else sees their own data."""
+    if user.role == "court":
+        return (user.role, None)
+    return (user.role, user.id)
+
+
+def seconds_until_midnight(now=None):
+    now = now or datetime.now()
+    midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+    return max((midnight - now).total_seconds(), 1)
+
+
+def _serve_cached(view, args, kwargs, cache, key_parts, ttl):
+    from models.user import User
+
+    user = User.query.get(int(get_jwt_identity()))
+    if not user:
+        return view(*args, **kwargs)
+
+    key = (request.endpoint, *cache_scope(user), request.query_string, *key_parts)
+    generation = cache.generation
+    cached = cache.get(key)
+    if cached is not None:
+        body, mimetype = cached
+        return current_app.response_class(body, status=200, mimetype=mimetype)
+
+    response = make_response(view(*args, **kwargs))
+    if response.status_code == 200:
+        cache.set(key, (response.get_data(), response.mimetype), ttl, generation)
+    return response
+
+
+def cached_value(key, compute):
+    """Memoise ``compute()`` in the analytics cache under ``key`` for ANALYTICS_CACHE_TTL seconds."""
+    ttl = current_app.config.get("ANALYTICS_CACHE_TTL", 0)
+    if ttl <= 0:
+        return compute()
+    generation = analytics_cache.generation
+    value = analytics_cache.get(key)
+    if value is None:
+        value = compute()
+        analytics_cache.set(key, value, ttl, generation)
+    return value
+
+
+def cached_analytics(view):
+    """Cache successful JSON responses per (endpoint, role, scope id, query string)."""
+
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        ttl = current_app.config.get("ANALYTICS_CACHE_TTL", 0)
+        if ttl <= 0:
+            return view(*args, **kwargs)
+        return _serve_cached(view, args, kwargs, analytics_cache, (), ttl)
+
+    return wrapper
+
+
+def cached_daily(view):
+    """Cache successful JSON responses for the rest of the calendar day.
+
+    For reports that only move at day granularity, such as case ageing; the
+    date is part of the key so the first request after midnight recomputes.
+    """
+
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        if current_app.config.get("ANALYTICS_CACHE_TTL", 0) <= 0:
+            return view(*args, **kwargs)
+        return _serve_cached(view, args, kwargs, daily_cache, (date.today().isoformat(),), seconds_until_midnight())
+
+    return wrapper
+
+
+def _watched_models():
+    from models.case import Case, CaseTimeline, Hearing
+    from models.document import Document
+    from models.task import Task
+    from models.user import User
+
+    return (Case, CaseTimeline, Hearing, Document, Task, User)
+
+
+def _note_analytics_writes(session, flush_context, instances):
+    watched = _watched_models()
+    if any(isinstance(obj, watched) for obj in (*session.new, *session.dirty, *session.deleted)):
+        session.info["analytics_dirty"] = True
+
+
+def _invalidate_after_commit(session):
+    if session.info.pop("analytics_dirty", False):
+        analytics_cache.invalidate()
+
+
+def _discard_after_rollback(session, previous_transaction):
+    session.info.pop("analytics_dirty", None)
+
+
+def register_cache_invalidation():
+    """Drop cached analytics in this process whenever a case, hearing, task, document or user commit lands.
+
+    Other worker processes only see the change once their entries expire,
+    which is why the TTL is kept short.
+    """
+    if not event.contains(db.session, "before_flush", _note_analytics_writes):
+        event.listen(db.session, "before_flush", _note_analytics_writes)
+        event.listen(db.session, "after_commit", _invalidate_after_commit)
+        event.listen(db.session, "after_soft_rollback", _discard_after_rollback)
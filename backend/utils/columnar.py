@@ -0,0 +1,310 @@
+import threading
+import time
+from datetime import date, timedelta
+
+import numpy as np
+
+from models import db
+from models.case import Case, Hearing
+
+EPOCH = date(1970, 1, 1)
+NO_DAY = np.iinfo(np.int32).min
+REFRESH_INTERVAL = 5.0
+LOAD_BATCH_SIZE = 50000
+# Ids per IN (...) when loading rows the incremental refresh missed.
+RECONCILE_BATCH_SIZE = 1000
+# Changed rows are re-read this far behind the watermark so a transaction that
+# committed late with an older updated_at is still picked up.
+WATERMARK_LAG = timedelta(seconds=60)
+
+
+def to_day(value):
+    """Days since 1970-01-01 for a date/datetime, or NO_DAY for None."""
+    if value is None:
+        return NO_DAY
+    if hasattr(value, "date"):
+        value = value.date()
+    return (value - EPOCH).days
+
+
+def from_day(value):
+    return EPOCH + timedelta(days=int(value))
+
+
+def to_month(value):
+    """Months since January 1970 for a date."""
+    return (value.year - 1970) * 12 + value.month - 1
+
+
+def month_key(year, month):
+    return int(year) * 100 + int(month)
+
+
+class Vocabulary:
+    """Maps strings (statuses, case types) to small integer codes."""
+
+    def __init__(self):
+        self.codes = {}
+        self.values = []
+
+    def encode(self, value):
+        code = self.codes.get(value)
+        if code is None:
+            code = len(self.values)
+            self.codes[value] = code
+            self.values.append(value)
+        return code
+
+    def codes_for(self, values):
+        return [self.codes[value] for value in values if value in self.codes]
+
+
+class ColumnTable:
+    """Column arrays kept sorted by primary key, updated by upsert and delete.
+
+    Updates build a new ``columns`` dict and swap it in with one assignment, so
+    readers that grab ``columns`` once always see arrays of matching length.
+    """
+
+    def __init__(self, dtypes):
+        self.dtypes = dict(dtypes, id=np.int64)
+        self.columns = {name: np.empty(0, dtype=dtype) for name, dtype in self.dtypes.items()}
+
+    def __len__(self):
+        return len(self.columns["id"])
+
+    def upsert(self, rows):
+        if not len(rows["id"]):
+            return
+        rows = {name: np.asarray(values, dtype=self.dtypes[name]) for name, values in rows.items()}
+        current = self.columns
+
+        positions = np.searchsorted(current["id"], rows["id"])
+        in_bounds = positions < len(current["id"])
+        existing = np.zeros(len(rows["id"]), dtype=bool)
+        existing[in_bounds] = current["id"][positions[in_bounds]] == rows["id"][in_bounds]
+        fresh = ~existing
+
+        merged = {}
+        for name, values in current.items():
+            column = values.copy()
+            column[positions[existing]] = rows[name][existing]
+            merged[name] = np.concatenate([column, rows[name][fresh]])
+        if fresh.any():
+            order = np.argsort(merged["id"], kind="stable")
+            merged = {name: values[order] for name, values in merged.items()}
+        self.columns = merged
+
+    def retain(self, live_ids):
+        current = self.columns
+        keep = np.isin(current["id"], np.asarray(live_ids, dtype=np.int64), assume_unique=True)
+        if not keep.all():
+            self.columns = {name: values[keep] for name, values in current.items()}
+
+
+class ColumnarAnalytics:
+    """In-memory NumPy snapshot of the hot case and hearing columns.
+
+    The first refresh streams every row; later refreshes only read rows whose
+    ``updated_at`` moved past the last watermark, and reconcile the id set
+    (dropping deleted rows, loading missed ones) when the table's row count no
+    longer matches the snapshot.
+    """
+
+    def __init__(self, refresh_interval=REFRESH_INTERVAL):
+        self.refresh_interval = refresh_interval
+        self.statuses = Vocabulary()
+        self.case_types = Vocabulary()
+        self.cases = ColumnTable(
+            {
+                "filing_day": np.int32,
+                "status": np.int16,
+                "case_type": np.int16,
+                "advocate_id": np.int64,
+                "next_hearing_day": np.int32,
+            }
+        )
+        self.hearings = ColumnTable({"case_id": np.int64, "day": np.int32})
+        self._watermarks = {"cases": None, "hearings": None}
+        self._refreshed_at = 0.0
+        self._lock = threading.Lock()
+
+    # ── Loading ─────────────────────────────────────────────────────
+    def refresh(self, force=False):
+        with self._lock:
+            if not force and time.monotonic() - self._refreshed_at < self.refresh_interval:
+                return
+            self._refresh_cases()
+            self._refresh_hearings()
+            self._refreshed_at = time.monotonic()
+
+    def _changed_rows(self, query, model, table_name):
+        watermark = self._watermarks[table_name]
+        if watermark is not None:
+            # Re-reading already loaded rows is harmless; upserts are idempotent.
+            query = query.filter(model.updated_at >= watermark - WATERMARK_LAG)
+        return query.order_by(model.id.asc()).yield_per(LOAD_BATCH_SIZE)
+
+    def _case_rows(self, query):
+        rows, latest = {name: [] for name in self.cases.dtypes}, None
+        for case_id, filing_date, status, case_type, advocate_id, next_hearing, updated_at in query:
+            rows["id"].append(case_id)
+            rows["filing_day"].append(to_day(filing_date))
+            rows["status"].append(self.statuses.encode(status or "filed"))
+            rows["case_type"].append(self.case_types.encode(case_type))
+            rows["advocate_id"].append(advocate_id or 0)
+            rows["next_hearing_day"].append(to_day(next_hearing))
+            if updated_at and (latest is None or updated_at > latest):
+                latest = updated_at
+        return rows, latest
+
+    def _hearing_rows(self, query):
+        rows, latest = {name: [] for name in self.hearings.dtypes}, None
+        for hearing_id, case_id, hearing_date, updated_at in query:
+            rows["id"].append(hearing_id)
+            rows["case_id"].append(case_id)
+            rows["day"].append(to_day(hearing_date))
+            if updated_at and (latest is None or updated_at > latest):
+                latest = updated_at
+        return rows, latest
+
+    def _refresh_cases(self):
+        query = db.session.query(
+            Case.id, Case.filing_date, Case.status, Case.case_type, Case.advocate_id, Case.next_hearing, Case.updated_at
+        )
+        rows, latest = self._case_rows(self._changed_rows(query, Case, "cases"))
+        self.cases.upsert(rows)
+        self._advance_watermark("cases", latest)
+        self._reconcile(self.cases, Case, query, self._case_rows)
+
+    def _refresh_hearings(self):
+        query = db.session.query(Hearing.id, Hearing.case_id, Hearing.date, Hearing.updated_at)
+        rows, latest = self._hearing_rows(self._changed_rows(query, Hearing, "hearings"))
+        self.hearings.upsert(rows)
+        self._advance_watermark("hearings", latest)
+        self._reconcile(self.hearings, Hearing, query, self._hearing_rows)
+
+    def _advance_watermark(self, table_name, latest):
+        watermark = self._watermarks[table_name]
+        if latest is not None and (watermark is None or latest > watermark):
+            self._watermarks[table_name] = latest
+
+    def _reconcile(self, table, model, query, read_rows):
+        """Bring the snapshot's id set back in line with the table's.
+
+        Only runs when the row counts differ. Deleted rows are dropped, and
+        rows the watermark missed (e.g. inserted with an old updated_at) are
+        loaded by id, so the counts match again afterwards instead of
+        triggering a full id scan on every refresh.
+        """
+        if db.session.query(db.func.count(model.id)).scalar() == len(table):
+            return
+        live_ids = np.fromiter(
+            (row_id for (row_id,) in db.session.query(model.id).yield_per(LOAD_BATCH_SIZE)), dtype=np.int64
+        )
+        table.retain(live_ids)
+        missing = np.setdiff1d(live_ids, table.columns["id"], assume_unique=True).tolist()
+        for offset in range(0, len(missing), RECONCILE_BATCH_SIZE):
+            batch = missing[offset:offset + RECONCILE_BATCH_SIZE]
+            rows, _ = read_rows(query.filter(model.id.in_(batch)))
+            table.upsert(rows)
+
+    # ── Queries ─────────────────────────────────────────────────────
+    # Each query reads ``table.columns`` once so a concurrent refresh cannot
+    # hand it arrays from two different snapshots.
+    def _status_mask(self, columns, statuses):
+        return np.isin(columns["status"], self.statuses.codes_for(statuses))
+
+    def _counts_by_code(self, codes, vocabulary):
+        counts = np.bincount(codes, minlength=len(vocabulary.values))
+        return {value: int(counts[code]) for code, value in enumerate(vocabulary.values) if counts[code]}
+
+    def status_counts(self):
+        return self._counts_by_code(self.cases.columns["status"], self.statuses)
+
+    def type_counts(self, disposed_statuses):
+        """[(case_type, total, disposed)] for every case type in use."""
+        columns = self.cases.columns
+        types = columns["case_type"]
+        size = len(self.case_types.values)
+        totals = np.bincount(types, minlength=size)
+        disposed = np.bincount(types, weights=self._status_mask(columns, disposed_statuses), minlength=size)
+        return [
+            (case_type, int(totals[code]), int(disposed[code]))
+            for code, case_type in enumerate(self.case_types.values)
+            if totals[code]
+        ]
+
+    @staticmethod
+    def _filing_months(columns):
+        days = columns["filing_day"].astype("datetime64[D]")
+        return days.astype("datetime64[M]").astype(np.int64)
+
+    def monthly_filed_and_closed(self, starts):
+        columns = self.cases.columns
+        first, last = to_month(starts[0]), to_month(starts[-1])
+        months = self._filing_months(columns)
+        in_window = (months >= first) & (months <= last)
+        offsets = months[in_window] - first
+        size = last - first + 1
+        filed = np.bincount(offsets, minlength=size)
+        closed = np.bincount(offsets, weights=self._status_mask(columns, ["closed"])[in_window], minlength=size)
+        return {
+            month_key(d.year, d.month): (int(filed[to_month(d) - first]), int(closed[to_month(d) - first]))
+            for d in starts
+            if filed[to_month(d) - first]
+        }
+
+    def pending_running_totals(self, starts, pending_statuses):
+        columns = self.cases.columns
+        first, last = to_month(starts[0]), to_month(starts[-1])
+        months = self._filing_months(columns)
+        selected = self._status_mask(columns, pending_statuses) & (months <= last)
+        # Cases filed before the window count towards its first month.
+        offsets = np.clip(months[selected], first, None) - first
+        running = np.cumsum(np.bincount(offsets, minlength=last - first + 1))
+        return {month_key(d.year, d.month): int(running[to_month(d) - first]) for d in starts}
+
+    def hearing_counts_by_date(self, start, end):
+        first, last = to_day(start), to_day(end)
+        days = self.hearings.columns["day"]
+        offsets = days[(days >= first) & (days <= last)] - first
+        counts = np.bincount(offsets, minlength=last - first + 1)
+        return {from_day(first + offset): int(count) for offset, count in enumerate(counts) if count}
+
+    def advocate_type_stats(self, advocate_id, active_statuses):
+        """[(case_type, total, won, active)] for one advocate."""
+        columns = self.cases.columns
+        mine = columns["advocate_id"] == advocate_id
+        types = columns["case_type"][mine]
+        size = len(self.case_types.values)
+        totals = np.bincount(types, minlength=size)
+        won = np.bincount(types, weights=self._status_mask(columns, ["closed"])[mine], minlength=size)
+        active = np.bincount(types, weights=self._status_mask(columns, active_statuses)[mine], minlength=size)
+        return [
+            (case_type, int(totals[code]), int(won[code]), int(active[code]))
+            for code, case_type in enumerate(self.case_types.values)
+            if totals[code]
+        ]
+
+    def active_by_advocate(self, active_statuses):
+        """{advocate_id: cases in ``active_statuses``}, omitting advocates with none."""
+        columns = self.cases.columns
+        advocates = columns["advocate_id"]
+        active = self._status_mask(columns, active_statuses) & (advocates > 0)
+        ids, counts = np.unique(advocates[active], return_counts=True)
+        return dict(zip(ids.tolist(), counts.tolist()))
+
+
+_engine = None
+_engine_lock = threading.Lock()
+
+
+def columnar_engine():
+    """Process-wide snapshot, refreshed at most every REFRESH_INTERVAL seconds."""
+    global _engine
+    with _engine_lock:
+        if _engine is None:
+            _engine = ColumnarAnalytics()
+    _engine.refresh()
+    return _engine
@@ -0,0 +1,76 @@
+import hashlib
+from datetime import timedelta
+
+from flask import current_app, request
+from flask_jwt_extended import get_jwt_identity
+from sqlalchemy import func
+
+from models import db
+from models.change_event import ChangeEvent
+from utils.events import event_scope_parts
+
+# updated_at has one-second resolution: a stamp taken in the same second as
+# the latest write could miss another write in that second, so such a stamp
+# is not used as a validator at all.
+SETTLE_TIME = timedelta(seconds=1)
+
+
+def query_version(query, model):
+    """(latest updated_at, row count) of the rows ``query`` selects, without loading them.
+
+    Returns None while the latest write is too recent to tell apart from the next one.
+    """
+    latest, count, now = query.with_entities(
+        func.max(model.updated_at), func.count(model.id), func.now()
+    ).order_by(None).one()
+    if latest is not None and now is not None and latest >= now - SETTLE_TIME:
+        return None
+    return (latest.isoformat() if latest else None, count)
+
+
+def scope_version(user):
+    """Id of the newest change event ``user`` can see.
+
+    Moves on every case, hearing, document or notification write in the
+    user's scope, so responses that embed related rows (a hearing's case
+    title, a case's documents) change their ETag too.
+    """
+    latest = [
+        db.session.query(func.max(ChangeEvent.id)).filter(rows).scalar_subquery() for rows in event_scope_parts(user)
+    ]
+    return max((version or 0) for version in db.session.query(*latest).one())
+
+
+def scoped_rows_version(user, query, model):
+    """Validator for case, hearing or document rows in ``user``'s scope.
+
+    Every ORM write to those tables records a change event, so the newest
+    event id in scope already moves whenever such a list can change; the
+    filters are part of the ETag through the request path. Only with no
+    events in scope (rows older than the change log, or purged) does this
+    fall back to aggregating the rows with query_version().
+    """
+    return scope_version(user) or query_version(query, model)
+
+
+def make_etag(*versions):
+    """Strong ETag for this URL and caller at ``versions``, or None if any is unsettled."""
+    if any(version is None for version in versions):
+        return None
+    key = repr((request.full_path, get_jwt_identity(), versions))
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+
+def not_modified(etag):
+    """A 304 response when the client already holds ``etag``, else None."""
+    if etag is None or not request.if_none_match.contains(etag):
+        return None
+    return with_etag(current_app.response_class(status=304), etag)
+
+
+def with_etag(response, etag):
+    if etag is not None:
+        response.set_etag(etag)
+        # Per-user data: the browser may keep it, but must revalidate each time.
+        response.headers["Cache-Control"] = "private, no-cache"
+    return response
@@ -0,0 +1,312 @@
+import json
+import threading
+import time
+from collections import deque, namedtuple
+
+from sqlalchemy import event, inspect, or_
+
+from models import db
+from models.change_event import ChangeEvent
+
+BRIDGE_BATCH_SIZE = 500
+REPLAY_LIMIT = 500
+# Ids skipped by the poller are re-checked this long, in case their
+# transaction commits after a later one; rolled-back ids just expire.
+GAP_TIMEOUT = 10.0
+MAX_GAPS = 1000
+CASE_ENTITIES = ("cases", "hearings", "documents")
+AUDIENCE_FIELDS = ("case_id", "user_id", "advocate_id", "petitioner_user_id")
+
+Change = namedtuple("Change", "id entity action user_id advocate_id petitioner_user_id payload")
+
+
+def change_from_row(row):
+    return Change(
+        row.id, row.entity, row.action, row.user_id, row.advocate_id, row.petitioner_user_id, row.to_dict()
+    )
+
+
+def format_sse(event_name, data, event_id=None):
+    lines = [f"id: {event_id}"] if event_id is not None else []
+    lines += [f"event: {event_name}", f"data: {json.dumps(data, separators=(',', ':'))}"]
+    return "\n".join(lines) + "\n\n"
+
+
+# ── Recording changes ──────────────────────────────────────────────
+def _tracked_entities():
+    from models.case import Case, Hearing
+    from models.document import Document
+    from models.notification import Notification
+
+    return {Case: "cases", Hearing: "hearings", Document: "documents", Notification: "notifications"}
+
+
+def _audience(session, obj, entity):
+    from models.case import Case
+
+    if entity == "notifications":
+        return {"user_id": obj.user_id}
+    # A row added by case_id alone has no ``case`` loaded yet.
+    case = obj if entity == "cases" else (obj.case or (obj.case_id and session.get(Case, obj.case_id)))
+    if not case:
+        return {}
+    return {"case_id": case.id, "advocate_id": case.advocate_id, "petitioner_user_id": case.petitioner_user_id}
+
+
+def _previous_value(obj, attribute):
+    history = inspect(obj).attrs[attribute].history
+    return history.deleted[0] if history.deleted else None
+
+
+def _collect_events(session, flush_context, instances):
+    # Deleted rows (and a reassigned case's previous owners) must be read
+    # before the flush; new rows only get their ids during it.
+    entities = _tracked_entities()
+    pending = []
+    for obj in session.deleted:
+        entity = entities.get(type(obj))
+        if entity and obj.id is not None:
+            pending.append((entity, obj, "deleted", _audience(session, obj, entity)))
+    for obj in session.dirty:
+        entity = entities.get(type(obj))
+        if not entity or obj in session.deleted or not session.is_modified(obj, include_collections=False):
+            continue
+        pending.append((entity, obj, "updated", None))
+        if entity == "cases":
+            previous_advocate = _previous_value(obj, "advocate_id")
+            previous_petitioner = _previous_value(obj, "petitioner_user_id")
+            if previous_advocate or previous_petitioner:
+                pending.append(
+                    (entity, obj, "removed", {
+                        "case_id": obj.id,
+                        "advocate_id": previous_advocate if previous_advocate != obj.advocate_id else None,
+                        "petitioner_user_id": (
+                            previous_petitioner if previous_petitioner != obj.petitioner_user_id else None
+                        ),
+                    })
+                )
+    for obj in session.new:
+        entity = entities.get(type(obj))
+        if entity:
+            pending.append((entity, obj, "created", None))
+    session.info["change_events"] = pending
+
+
+def _write_events(session, flush_context):
+    pending = session.info.pop("change_events", None)
+    if not pending:
+        return
+    rows = [
+        {
+            "entity": entity,
+            "entity_id": obj.id,
+            "action": action,
+            **dict.fromkeys(AUDIENCE_FIELDS),
+            **(audience if audience is not None else _audience(session, obj, entity)),
+        }
+        for entity, obj, action, audience in pending
+    ]
+    session.connection().execute(ChangeEvent.__table__.insert(), rows)
+
+
+def register_event_listeners():
+    """Record a change_events row for every ORM write to cases, hearings, documents and notifications."""
+    if not event.contains(db.session, "before_flush", _collect_events):
+        event.listen(db.session, "before_flush", _collect_events)
+        event.listen(db.session, "after_flush", _write_events)
+
+
+def event_scope_parts(user):
+    """(the user's own notification events, case events in their scope) as separate filters.
+
+    Each half is served by its own index, (user_id, entity, id) and
+    (advocate_id, id) or (petitioner_user_id, id), which the OR of the two
+    can't use for a MAX(id).
+    """
+    own_rows = (ChangeEvent.user_id == user.id) & (ChangeEvent.entity == "notifications")
+    case_rows = ChangeEvent.entity.in_(CASE_ENTITIES)
+    if user.role == "court":
+        case_rows &= ChangeEvent.action != "removed"
+    elif user.role == "advocate":
+        case_rows = (ChangeEvent.advocate_id == user.id) & case_rows
+    else:
+        case_rows = (ChangeEvent.petitioner_user_id == user.id) & case_rows
+    return own_rows, case_rows
+
+
+def event_scope(user):
+    """Filter for the change events ``user`` may receive; mirrors EventHub.publish."""
+    return or_(*event_scope_parts(user))
+
+
+def missed_changes(user, last_event_id):
+    """(changes after ``last_event_id`` in scope, whether more were skipped) for a reconnecting client."""
+    rows = (
+        ChangeEvent.query.filter(ChangeEvent.id > last_event_id, event_scope(user))
+        .order_by(ChangeEvent.id.asc())
+        .limit(REPLAY_LIMIT + 1)
+        .all()
+    )
+    return [change_from_row(row) for row in rows[:REPLAY_LIMIT]], len(rows) > REPLAY_LIMIT
+
+
+def purge_change_events(before):
+    deleted = ChangeEvent.query.filter(ChangeEvent.created_at < before).delete(synchronize_session=False)
+    db.session.commit()
+    return deleted
+
+
+# ── Fan-out ────────────────────────────────────────────────────────
+class Subscription:
+    """One open event stream: a bounded queue the hub pushes into and the stream drains.
+
+    When the queue fills up its contents are dropped and the stream tells the
+    client to resync through /api/sync, so a slow reader costs a fixed amount
+    of memory.
+    """
+
+    def __init__(self, user_id, role, max_queue):
+        self.user_id = user_id
+        self.role = role
+        self.max_queue = max_queue
+        self.overflowed = False
+        self._queue = deque()
+        self._lock = threading.Lock()
+        self._ready = threading.Event()
+
+    def push(self, change):
+        with self._lock:
+            if self.overflowed:
+                return
+            if len(self._queue) >= self.max_queue:
+                self._queue.clear()
+                self.overflowed = True
+            else:
+                self._queue.append(change)
+        self._ready.set()
+
+    def drain(self, timeout):
+        """Wait up to ``timeout`` seconds, then return (queued changes, overflowed)."""
+        self._ready.wait(timeout)
+        self._ready.clear()
+        with self._lock:
+            changes, overflowed = list(self._queue), self.overflowed
+            self._queue.clear()
+            self.overflowed = False
+        return changes, overflowed
+
+
+class EventHub:
+    """Routes each change to the open streams allowed to see it.
+
+    Streams are indexed by user id (and court staff kept in one set), so a
+    change costs one lookup per audience field rather than a scan of every
+    connection. Nothing here runs per connection: streams block on their own
+    queue, and one bridge thread per process feeds ``publish``.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._court = set()
+        self._by_user = {}
+        self._bridge = None
+
+    def subscribe(self, user_id, role, max_queue):
+        subscription = Subscription(user_id, role, max_queue)
+        with self._lock:
+            self._by_user.setdefault(user_id, set()).add(subscription)
+            if role == "court":
+                self._court.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            self._court.discard(subscription)
+            streams = self._by_user.get(subscription.user_id)
+            if streams is not None:
+                streams.discard(subscription)
+                if not streams:
+                    del self._by_user[subscription.user_id]
+
+    def connection_count(self):
+        with self._lock:
+            return sum(len(streams) for streams in self._by_user.values())
+
+    def _recipients(self, change):
+        if change.entity == "notifications":
+            return set(self._by_user.get(change.user_id, ()))
+        recipients = set() if change.action == "removed" else set(self._court)
+        for role, user_id in (("advocate", change.advocate_id), ("public", change.petitioner_user_id)):
+            if user_id:
+                recipients.update(stream for stream in self._by_user.get(user_id, ()) if stream.role == role)
+        return recipients
+
+    def publish(self, change):
+        with self._lock:
+            recipients = self._recipients(change)
+        for subscription in recipients:
+            subscription.push(change)
+
+    def start_bridge(self, app):
+        with self._lock:
+            if self._bridge is None:
+                self._bridge = DatabaseBridge(app, self, app.config.get("EVENTS_POLL_INTERVAL", 0.5))
+                self._bridge.start()
+
+
+class DatabaseBridge:
+    """Carries changes between worker processes through the change_events table.
+
+    Each process runs one daemon thread that polls for rows past the last id
+    it has seen and publishes them to its own hub. A message broker's
+    subscriber could stand in for it without the hub noticing.
+    """
+
+    def __init__(self, app, hub, poll_interval):
+        self.app = app
+        self.hub = hub
+        self.poll_interval = poll_interval
+        self.last_id = 0
+        self.gaps = {}
+
+    def start(self):
+        with self.app.app_context():
+            self.last_id = db.session.query(db.func.max(ChangeEvent.id)).scalar() or 0
+        threading.Thread(target=self._run, name="event-bridge", daemon=True).start()
+
+    def _run(self):
+        while True:
+            time.sleep(self.poll_interval)
+            try:
+                with self.app.app_context():
+                    self.poll()
+            except Exception:
+                self.app.logger.exception("Event bridge poll failed")
+
+    def poll(self):
+        now = time.monotonic()
+        self.gaps = {gap: expiry for gap, expiry in self.gaps.items() if expiry > now}
+        condition = ChangeEvent.id > self.last_id
+        if self.gaps:
+            condition = or_(condition, ChangeEvent.id.in_(list(self.gaps)))
+        rows = ChangeEvent.query.filter(condition).order_by(ChangeEvent.id.asc()).limit(BRIDGE_BATCH_SIZE).all()
+
+        for row in rows:
+            if row.id in self.gaps:
+                del self.gaps[row.id]
+            elif row.id > self.last_id:
+                for missing in range(self.last_id + 1, row.id):
+                    if len(self.gaps) < MAX_GAPS:
+                        self.gaps[missing] = now + GAP_TIMEOUT
+                self.last_id = row.id
+            self.hub.publish(change_from_row(row))
+        return len(rows)
+
+
+_hub = EventHub()
+
+
+def event_hub(app):
+    """Process-wide hub; its bridge thread starts with the first subscriber."""
+    _hub.start_bridge(app)
+    return _hub
@@ -1,6 +1,7 @@
 import csv
 import re
-import textwrap
+import zlib
+from functools import lru_cache
 from io import BytesIO, StringIO
 
 from itsdangerous import BadSignature, URLSafeSerializer
@@ -11,33 +12,71 @@ def sanitize_filename(value, fallback="case-report"):
     return cleaned or fallback
 
 
+# (CSV heading, attribute) for a case, shared by the single-case and court-wide exports.
+CASE_EXPORT_FIELDS = (
+    ("Case Number", "case_number"),
+    ("Title", "title"),
+    ("Description", "description"),
+    ("Type", "case_type"),
+    ("Status", "status"),
+    ("Priority", "priority"),
+    ("Petitioner", "petitioner"),
+    ("Respondent", "respondent"),
+    ("Advocate", "advocate_name"),
+    ("Advocate Email", "advocate_email"),
+    ("Judge", "judge"),
+    ("Court Room", "court_room_name"),
+    ("Filing Date", "filing_date"),
+    ("Next Hearing", "next_hearing"),
+)
+CSV_CHUNK_SIZE = 64 * 1024
+
+
+def _csv_cell(value):
+    if value is None:
+        return ""
+    return value.isoformat() if hasattr(value, "isoformat") else value
+
+
+def case_export_values(record, advocate_name, advocate_email):
+    """Cells for CASE_EXPORT_FIELDS from a Case or a result row with the same column names."""
+    values = {"advocate_name": advocate_name or "Unassigned", "advocate_email": advocate_email}
+    return [
+        _csv_cell(values[attribute] if attribute in values else getattr(record, attribute))
+        for _, attribute in CASE_EXPORT_FIELDS
+    ]
+
+
+def stream_cases_csv(rows, chunk_size=CSV_CHUNK_SIZE):
+    """Yield a one-row-per-case CSV in chunks of about ``chunk_size`` characters.
+
+    ``rows`` carry the CASE_EXPORT_FIELDS columns (advocate name and email
+    included) and should come from a streaming query, so only one chunk and
+    one fetch batch are ever held in memory.
+    """
+    buffer = StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow([heading for heading, _ in CASE_EXPORT_FIELDS])
+    for row in rows:
+        writer.writerow(case_export_values(row, row.advocate_name, row.advocate_email))
+        if buffer.tell() >= chunk_size:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
 def build_case_csv(case):
     output = StringIO()
     writer = csv.writer(output)
     writer.writerow(["Section", "Field", "Value"])
 
-    advocate_name = case.advocate.name if getattr(case, "advocate", None) else "Unassigned"
-    advocate_email = case.advocate.email if getattr(case, "advocate", None) else ""
-
-    case_rows = [
-        ("Case", "Case Number", case.case_number),
-        ("Case", "Title", case.title),
-        ("Case", "Description", case.description or ""),
-        ("Case", "Type", case.case_type),
-        ("Case", "Status", case.status),
-        ("Case", "Priority", case.priority),
-        ("Case", "Petitioner", case.petitioner),
-        ("Case", "Respondent", case.respondent),
-        ("Case", "Advocate", advocate_name),
-        ("Case", "Advocate Email", advocate_email),
-        ("Case", "Judge", case.judge or ""),
-        ("Case", "Court Room", case.court_room_name or ""),
-        ("Case", "Filing Date", case.filing_date.isoformat() if case.filing_date else ""),
-        ("Case", "Next Hearing", case.next_hearing.isoformat() if case.next_hearing else ""),
-    ]
-    writer.writerows(case_rows)
+    advocate = getattr(case, "advocate", None)
+    values = case_export_values(case, advocate.name if advocate else None, advocate.email if advocate else None)
+    writer.writerows(("Case", heading, value) for (heading, _), value in zip(CASE_EXPORT_FIELDS, values))
 
-    hearings = sorted(case.hearings, key=lambda item: ((item.date or 0), (item.start_time or 0)))
+    hearings = case.hearings
     if hearings:
         for index, hearing in enumerate(hearings, start=1):
             writer.writerows(
@@ -54,7 +93,7 @@ def build_case_csv(case):
     else:
         writer.writerow(["Hearing", "None", "No hearings recorded"])
 
-    documents = sorted(case.documents, key=lambda item: item.uploaded_at or 0, reverse=True)
+    documents = case.documents
     if documents:
         for index, document in enumerate(documents, start=1):
             writer.writerows(
@@ -71,7 +110,7 @@ def build_case_csv(case):
     else:
         writer.writerow(["Document", "None", "No documents uploaded"])
 
-    timeline_items = sorted(case.timeline, key=lambda item: (item.date or 0, item.created_at or 0))
+    timeline_items = case.timeline
     if timeline_items:
         for index, item in enumerate(timeline_items, start=1):
             writer.writerows(
@@ -88,6 +127,7 @@ def build_case_csv(case):
 
 
 def build_case_report_lines(case):
+    """The report as logical lines; indented lines are wrapped with a hanging indent when rendered."""
     advocate_name = case.advocate.name if getattr(case, "advocate", None) else "Unassigned"
     advocate_email = case.advocate.email if getattr(case, "advocate", None) else "Not available"
 
@@ -113,136 +153,244 @@ def build_case_report_lines(case):
         "Description",
     ]
 
-    description = case.description or "No case description provided."
-    lines.extend(_wrap_paragraph(description))
+    lines.append(case.description or "No case description provided.")
     lines.append("")
 
     lines.append("Hearings")
-    hearings = sorted(case.hearings, key=lambda item: ((item.date or 0), (item.start_time or 0)))
+    hearings = case.hearings
     if hearings:
         for index, hearing in enumerate(hearings, start=1):
             lines.append(
                 f"{index}. {hearing.date.isoformat() if hearing.date else 'Unknown date'} | {hearing.type} | {hearing.status}"
             )
-            lines.extend(
-                _wrap_paragraph(
-                    f"Court room: {hearing.location or 'Not assigned'} | Start: "
-                    f"{hearing.start_time.isoformat() if hearing.start_time else 'Not set'} | Notes: {hearing.notes or 'None'}",
-                    prefix="   ",
-                )
+            lines.append(
+                f"   Court room: {hearing.location or 'Not assigned'} | Start: "
+                f"{hearing.start_time.isoformat() if hearing.start_time else 'Not set'} | Notes: {hearing.notes or 'None'}"
             )
     else:
         lines.append("No hearings recorded.")
     lines.append("")
 
     lines.append("Documents and Evidence")
-    documents = sorted(case.documents, key=lambda item: item.uploaded_at or 0, reverse=True)
+    documents = case.documents
     if documents:
         for index, document in enumerate(documents, start=1):
             lines.append(
                 f"{index}. {document.title} | {document.file_type.upper()} | "
                 f"{'Verified' if document.verified else 'Pending'}"
             )
-            lines.extend(
-                _wrap_paragraph(
-                    f"Uploaded by: {document.uploader.name if document.uploader else 'Unknown'} | "
-                    f"Size: {document.file_size or 'Unknown'} | "
-                    f"Uploaded at: {document.uploaded_at.isoformat() if document.uploaded_at else 'Unknown'}",
-                    prefix="   ",
-                )
+            lines.append(
+                f"   Uploaded by: {document.uploader.name if document.uploader else 'Unknown'} | "
+                f"Size: {document.file_size or 'Unknown'} | "
+                f"Uploaded at: {document.uploaded_at.isoformat() if document.uploaded_at else 'Unknown'}"
             )
     else:
         lines.append("No documents uploaded.")
     lines.append("")
 
     lines.append("Timeline")
-    timeline_items = sorted(case.timeline, key=lambda item: (item.date or 0, item.created_at or 0))
+    timeline_items = case.timeline
     if timeline_items:
         for index, item in enumerate(timeline_items, start=1):
             lines.append(f"{index}. {item.date.isoformat() if item.date else 'Unknown date'} | {item.event}")
-            lines.extend(_wrap_paragraph(item.description or "No description.", prefix="   "))
+            lines.append(f"   {item.description or 'No description.'}")
     else:
         lines.append("No timeline entries.")
 
     return lines
 
 
-def generate_simple_pdf(title, lines):
-    wrapped_lines = []
+# ── PDF reports ─────────────────────────────────────────────────────
+PDF_PAGE_WIDTH = 612
+PDF_PAGE_HEIGHT = 792
+PDF_MARGIN = 50
+PDF_TEXT_TOP = 770
+PDF_TITLE_SIZE = 12
+PDF_BODY_SIZE = 10
+PDF_LEADING = 16
+PDF_LINES_PER_PAGE = 46
+PDF_COMPRESSION_LEVEL = 6
+# Body text width in glyph units (1/1000 of the font size).
+PDF_LINE_LIMIT = (PDF_PAGE_WIDTH - 2 * PDF_MARGIN) * 1000 // PDF_BODY_SIZE
+
+# Helvetica advance widths for character codes 32-126 (StandardEncoding), from
+# the font's AFM metrics. Anything else is written as "?" and measured as one.
+_HELVETICA_WIDTHS = (
+    278, 278, 355, 556, 556, 889, 667, 222, 333, 333, 389, 584, 278, 333, 278, 278,
+    556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 278, 278, 584, 584, 584, 556,
+    1015, 667, 667, 722, 722, 667, 611, 778, 722, 278, 500, 667, 556, 833, 722, 778,
+    667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 278, 278, 278, 469, 556,
+    222, 556, 556, 500, 556, 556, 278, 556, 556, 222, 222, 500, 222, 833, 556, 556,
+    556, 556, 333, 500, 278, 556, 500, 722, 500, 500, 500, 334, 260, 334, 584,
+)
+_GLYPH_WIDTHS = dict(zip(map(chr, range(32, 127)), _HELVETICA_WIDTHS))
+_UNKNOWN_GLYPH_WIDTH = _GLYPH_WIDTHS["?"]
+_SPACE_WIDTH = _GLYPH_WIDTHS[" "]
+
+_PDF_ESCAPES = {code: "?" for code in (*range(32), 127)}
+_PDF_ESCAPES.update({ord("\\"): "\\\\", ord("("): "\\(", ord(")"): "\\)"})
+
+
+@lru_cache(maxsize=16384)
+def _text_width(text):
+    """Width of ``text`` in glyph units; report words repeat a lot, so results are memoised."""
+    return sum(_GLYPH_WIDTHS.get(char, _UNKNOWN_GLYPH_WIDTH) for char in text)
+
+
+def _split_long_word(word, limit):
+    pieces, start, width = [], 0, 0
+    for index, char in enumerate(word):
+        char_width = _GLYPH_WIDTHS.get(char, _UNKNOWN_GLYPH_WIDTH)
+        if width + char_width > limit and index > start:
+            pieces.append(word[start:index])
+            start, width = index, 0
+        width += char_width
+    pieces.append(word[start:])
+    return pieces
+
+
+def wrap_pdf_line(line, limit=PDF_LINE_LIMIT):
+    """Greedy word wrap of one logical line to ``limit`` glyph units.
+
+    Leading spaces are kept as a hanging indent on every wrapped line, and
+    runs of whitespace (newlines included) collapse to one space.
+    """
+    line = str(line or "")
+    text = line.lstrip(" ")
+    indent = line[:len(line) - len(text)]
+    words = text.split()
+    if not words:
+        return [""]
+
+    indent_width = _text_width(indent)
+    room = max(limit - indent_width, limit // 4)
+    wrapped, current, width = [], [], 0
+    for word in words:
+        word_width = _text_width(word)
+        if current and width + _SPACE_WIDTH + word_width > room:
+            wrapped.append(indent + " ".join(current))
+            current, width = [], 0
+        if not current and word_width > room:
+            *full, word = _split_long_word(word, room)
+            wrapped.extend(indent + piece for piece in full)
+            word_width = _text_width(word)
+        width += word_width + (_SPACE_WIDTH if current else 0)
+        current.append(word)
+    wrapped.append(indent + " ".join(current))
+    return wrapped
+
+
+def _pdf_string(text):
+    return "(" + text.translate(_PDF_ESCAPES) + ")"
+
+
+def _pdf_page_content(title, lines):
+    # "'" moves to the next line and shows a string, so each body line is one operator.
+    body = "".join(f"{_pdf_string(line)} '\n" for line in lines)
+    return (
+        f"BT\n/F1 {PDF_TITLE_SIZE} Tf\n{PDF_MARGIN} {PDF_TEXT_TOP} Td\n{PDF_LEADING} TL\n"
+        f"{_pdf_string(title)} Tj\n/F1 {PDF_BODY_SIZE} Tf\n{body}ET"
+    ).encode("ascii", errors="replace")
+
+
+def _pdf_stream_object(data, compress):
+    if compress:
+        data = zlib.compress(data, PDF_COMPRESSION_LEVEL)
+        return b"<< /Length %d /Filter /FlateDecode >>\nstream\n%s\nendstream" % (len(data), data)
+    return b"<< /Length %d >>\nstream\n%s\nendstream" % (len(data), data)
+
+
+def pdf_page_objects(title, lines, compress=True):
+    """Yield the content stream object of each page ``lines`` (any iterable) fills.
+
+    Each line is wrapped once, by measured width, and each page is encoded
+    (Flate-compressed) as soon as it fills, so only one page is held at a time.
+    """
+    page_lines = []
+    pages = 0
     for line in lines:
-        if not line:
-            wrapped_lines.append("")
-            continue
-        wrapped_lines.extend(textwrap.wrap(str(line), width=88) or [""])
-
-    if not wrapped_lines:
-        wrapped_lines = ["No content available."]
-
-    lines_per_page = 46
-    pages = [wrapped_lines[index:index + lines_per_page] for index in range(0, len(wrapped_lines), lines_per_page)]
-
-    objects = []
-    page_refs = []
-    font_object_id = 3
-    next_object_id = 4
-
-    for page_lines in pages:
-        content_stream = _build_pdf_page_content(title, page_lines)
-        content_object_id = next_object_id
-        page_object_id = next_object_id + 1
-        next_object_id += 2
-
-        page_refs.append(f"{page_object_id} 0 R")
-        objects.append(
-            (
-                content_object_id,
-                b"<< /Length %d >>\nstream\n%s\nendstream" % (len(content_stream), content_stream),
-            )
+        for wrapped in wrap_pdf_line(line):
+            page_lines.append(wrapped)
+            if len(page_lines) == PDF_LINES_PER_PAGE:
+                yield _pdf_stream_object(_pdf_page_content(title, page_lines), compress)
+                page_lines = []
+                pages += 1
+    if page_lines or not pages:
+        yield _pdf_stream_object(_pdf_page_content(title, page_lines or ["No content available."]), compress)
+
+
+class PdfWriter:
+    """Writes a Helvetica text PDF to a binary stream one page at a time.
+
+    Only byte offsets are kept for the cross-reference table, so memory does
+    not grow with the document; the page tree goes last, once the page
+    count is known.
+    """
+
+    CATALOG_ID, PAGES_ID, FONT_ID = 1, 2, 3
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.offsets = {}
+        self.position = 0
+        self.page_ids = []
+        self._write(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+        self._add(self.CATALOG_ID, b"<< /Type /Catalog /Pages %d 0 R >>" % self.PAGES_ID)
+        self._add(self.FONT_ID, b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+
+    def _write(self, data):
+        self.stream.write(data)
+        self.position += len(data)
+
+    def _add(self, object_id, body):
+        self.offsets[object_id] = self.position
+        self._write(b"%d 0 obj\n%s\nendobj\n" % (object_id, body))
+
+    def add_page(self, content_object):
+        """Append a page drawn by ``content_object`` (as yielded by pdf_page_objects)."""
+        content_id = self.FONT_ID + 1 + 2 * len(self.page_ids)
+        page_id = content_id + 1
+        self._add(content_id, content_object)
+        self._add(
+            page_id,
+            b"<< /Type /Page /Parent %d 0 R /MediaBox [0 0 %d %d] /Resources << /Font << /F1 %d 0 R >> >> "
+            b"/Contents %d 0 R >>" % (self.PAGES_ID, PDF_PAGE_WIDTH, PDF_PAGE_HEIGHT, self.FONT_ID, content_id),
         )
-        objects.append(
-            (
-                page_object_id,
-                (
-                    f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
-                    f"/Resources << /Font << /F1 {font_object_id} 0 R >> >> "
-                    f"/Contents {content_object_id} 0 R >>"
-                ).encode("latin-1"),
-            )
+        self.page_ids.append(page_id)
+
+    def close(self):
+        kids = b" ".join(b"%d 0 R" % page_id for page_id in self.page_ids)
+        self._add(self.PAGES_ID, b"<< /Type /Pages /Count %d /Kids [%s] >>" % (len(self.page_ids), kids))
+
+        xref_start = self.position
+        size = max(self.offsets) + 1
+        entries = [b"xref\n0 %d\n0000000000 65535 f \n" % size]
+        entries.extend(b"%010d 00000 n \n" % self.offsets[object_id] for object_id in range(1, size))
+        entries.append(
+            b"trailer\n<< /Size %d /Root %d 0 R >>\nstartxref\n%d\n%%%%EOF" % (size, self.CATALOG_ID, xref_start)
         )
+        self._write(b"".join(entries))
+
 
-    pages_object = f"<< /Type /Pages /Count {len(page_refs)} /Kids [{' '.join(page_refs)}] >>".encode("latin-1")
-    catalog_object = b"<< /Type /Catalog /Pages 2 0 R >>"
-    font_object = b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"
+def write_simple_pdf(stream, title, lines, compress=True):
+    """Render ``lines`` as a paged PDF straight onto the binary ``stream``."""
+    writer = PdfWriter(stream)
+    for content_object in pdf_page_objects(title, lines, compress=compress):
+        writer.add_page(content_object)
+    writer.close()
 
-    final_objects = [(1, catalog_object), (2, pages_object), (3, font_object)] + objects
-    final_objects.sort(key=lambda item: item[0])
 
+def generate_simple_pdf(title, lines, compress=True):
     buffer = BytesIO()
-    buffer.write(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
-    offsets = {0: 0}
-
-    for object_id, payload in final_objects:
-        offsets[object_id] = buffer.tell()
-        buffer.write(f"{object_id} 0 obj\n".encode("latin-1"))
-        buffer.write(payload)
-        buffer.write(b"\nendobj\n")
-
-    xref_start = buffer.tell()
-    max_object_id = max(offsets)
-    buffer.write(f"xref\n0 {max_object_id + 1}\n".encode("latin-1"))
-    buffer.write(b"0000000000 65535 f \n")
-    for object_id in range(1, max_object_id + 1):
-        buffer.write(f"{offsets[object_id]:010d} 00000 n \n".encode("latin-1"))
-
-    buffer.write(
-        (
-            f"trailer\n<< /Size {max_object_id + 1} /Root 1 0 R >>\n"
-            f"startxref\n{xref_start}\n%%EOF"
-        ).encode("latin-1")
-    )
+    write_simple_pdf(buffer, title, lines, compress=compress)
     return buffer.getvalue()
 
 
+def render_pdf_page_objects(title, lines):
+    """List form of pdf_page_objects, for rendering in a worker process."""
+    return list(pdf_page_objects(title, lines))
+
+
 def build_share_token(secret_key, case):
     serializer = URLSafeSerializer(secret_key, salt="legalcms-case-report")
     return serializer.dumps({"case_id": case.id, "case_number": case.case_number})
@@ -254,33 +402,3 @@ def load_share_token(secret_key, token):
         return serializer.loads(token)
     except BadSignature:
         return None
-
-
-def _wrap_paragraph(text, prefix=""):
-    wrapped = textwrap.wrap(str(text), width=max(24, 88 - len(prefix))) or [""]
-    return [f"{prefix}{line}" if line else prefix for line in wrapped]
-
-
-def _build_pdf_page_content(title, lines):
-    header = [
-        "BT",
-        "/F1 12 Tf",
-        "50 770 Td",
-        "16 TL",
-        f"({_escape_pdf_text(title)}) Tj",
-        "T*",
-        "/F1 10 Tf",
-    ]
-
-    body = []
-    for line in lines:
-        body.append(f"({_escape_pdf_text(line)}) Tj")
-        body.append("T*")
-
-    footer = ["ET"]
-    return "\n".join(header + body + footer).encode("latin-1", errors="ignore")
-
-
-def _escape_pdf_text(value):
-    text = (value or "").replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
-    return "".join(char if 32 <= ord(char) <= 126 else "?" for char in text)
@@ -0,0 +1,35 @@
+def parse_fields(raw_value, available):
+    """Keys named by ``?fields=a,b`` in the order given, or None for the full representation."""
+    if raw_value is None:
+        return None
+    keys = list(dict.fromkeys(key.strip() for key in raw_value.split(",") if key.strip()))
+    if not keys:
+        raise ValueError("fields must name at least one field")
+    unknown = [key for key in keys if key not in available]
+    if unknown:
+        raise ValueError(f"Unknown field(s): {', '.join(unknown)}")
+    return keys
+
+
+def select_fields(query, fields, keys, *extra_columns):
+    """``query`` narrowed to the columns behind ``keys`` (plus ``extra_columns``).
+
+    It returns plain result rows rather than model instances, so nothing is
+    hydrated or added to the identity map.
+    """
+    columns, joins = list(extra_columns), []
+    for key in keys:
+        field = fields[key]
+        columns.extend(column for column in field.columns if not any(column is seen for seen in columns))
+        if field.join is not None and field.join not in joins:
+            joins.append(field.join)
+    for join in joins:
+        query = join(query)
+    return query.with_entities(*columns)
+
+
+def serialize_rows(rows, fields, keys):
+    """Dicts of just ``keys`` from rows narrowed by select_fields, or each model's to_dict() without keys."""
+    if keys is None:
+        return [row.to_dict() for row in rows]
+    return [{key: fields[key].read(row) for key in keys} for row in rows]
@@ -0,0 +1,109 @@
+"""Background job handlers: bulk case reports, case CSV export, email and analytics rebuilds.
+
+Each handler is registered with utils.jobs.job_type; the prepare step runs in
+the request that queues the job, the handler itself in a run_jobs.py worker.
+"""
+
+from datetime import date
+
+from flask import jsonify
+from flask_mail import Message as MailMessage
+
+import routes.notifications as notifications
+from models.case import Case
+from routes.cases import EXPORT_BATCH_SIZE, bulk_report_case_ids, case_export_query, case_report_sources
+from utils.exporters import stream_cases_csv
+from utils.jobs import job_type
+from utils.pendency import backfill_snapshots
+from utils.report_pool import stream_merged_pdf, stream_report_zip
+from utils.rollups import rebuild_rollups
+
+CASE_FILTER_KEYS = ("status", "type", "priority")
+
+
+# ── Bulk case reports ──────────────────────────────────────────────
+def prepare_case_reports(user, params):
+    output = str(params.get("format") or "pdf").lower()
+    if output not in {"pdf", "zip"}:
+        return None, (jsonify({"error": "format must be pdf or zip"}), 400)
+    case_ids, error = bulk_report_case_ids(user, params)
+    if error:
+        return None, error
+    return {"caseIds": case_ids, "format": output}, None
+
+
+@job_type("case_reports", prepare=prepare_case_reports)
+def run_case_reports(context):
+    case_ids = context.params["caseIds"]
+    output = context.params["format"]
+    stream = stream_merged_pdf if output == "pdf" else stream_report_zip
+    mimetype = "application/pdf" if output == "pdf" else "application/zip"
+
+    with context.open_result(f"case-reports-{date.today().isoformat()}.{output}", mimetype) as handle:
+        # Both streams yield once per report, then once to finish the file.
+        for done, chunk in enumerate(stream(case_report_sources(case_ids)), start=1):
+            handle.write(chunk)
+            context.progress(min(done, len(case_ids)), len(case_ids), "Rendering reports")
+    return {"cases": len(case_ids)}
+
+
+# ── Case CSV export ────────────────────────────────────────────────
+def prepare_cases_csv(user, params):
+    return {key: str(params[key]) for key in CASE_FILTER_KEYS if params.get(key)}, None
+
+
+@job_type("cases_csv", prepare=prepare_cases_csv)
+def run_cases_csv(context):
+    query = case_export_query(context.user, context.params)
+    total = query.order_by(None).count()
+
+    def rows():
+        # Keyset batches rather than one streaming cursor, so progress can be
+        # committed between them.
+        last_id, done = 0, 0
+        while True:
+            batch = query.filter(Case.id > last_id).order_by(Case.id.asc()).limit(EXPORT_BATCH_SIZE).all()
+            if not batch:
+                return
+            yield from batch
+            done += len(batch)
+            last_id = batch[-1].id
+            context.progress(done, total, "Exporting cases")
+
+    with context.open_result(f"cases-{date.today().isoformat()}.csv", "text/csv") as handle:
+        for chunk in stream_cases_csv(rows()):
+            handle.write(chunk.encode("utf-8"))
+    return {"cases": total}
+
+
+# ── Email ──────────────────────────────────────────────────────────
+def prepare_send_email(user, params):
+    if not params.get("to") or not params.get("subject") or not params.get("body"):
+        return None, (jsonify({"error": "to, subject, and body are required"}), 400)
+    return {key: str(params[key]) for key in ("to", "subject", "body")}, None
+
+
+@job_type("send_email", prepare=prepare_send_email)
+def run_send_email(context):
+    if notifications.mail is None:
+        raise RuntimeError("Mail service not configured")
+    notifications.mail.send(
+        MailMessage(
+            subject=context.params["subject"],
+            recipients=[context.params["to"]],
+            body=context.params["body"],
+        )
+    )
+    return {"sentTo": context.params["to"]}
+
+
+# ── Analytics rebuilds ─────────────────────────────────────────────
+@job_type("rebuild_rollups", roles=("court",))
+def run_rebuild_rollups(context):
+    case_rows, hearing_rows = rebuild_rollups()
+    return {"caseRows": case_rows, "hearingRows": hearing_rows}
+
+
+@job_type("backfill_pendency", roles=("court",))
+def run_backfill_pendency(context):
+    return {"rows": backfill_snapshots()}
@@ -0,0 +1,311 @@
+import json
+import os
+import shutil
+import socket
+import threading
+import time
+from collections import namedtuple
+
+from flask import current_app, jsonify, url_for
+from sqlalchemy import func, update
+
+from models import db
+from models.job import Job
+from models.user import User
+
+ALL_ROLES = ("court", "advocate", "public")
+MAX_ATTEMPTS = 3
+# A worker writes progress at most this often (seconds), however fast a handler calls progress().
+PROGRESS_INTERVAL = 1.0
+# How often (seconds) an idle worker looks for jobs whose worker died.
+RECOVERY_INTERVAL = 30.0
+
+JobType = namedtuple("JobType", ["run", "prepare", "roles"])
+# kind -> JobType; handlers register themselves in utils/job_types.py.
+JOB_TYPES = {}
+
+
+def job_type(kind, prepare=None, roles=ALL_ROLES):
+    """Register the decorated ``run(context)`` as the handler for ``kind`` jobs.
+
+    ``prepare(user, params)`` runs in the request that queues the job and
+    returns (params to store, error response), so bad input is rejected up
+    front and scope is resolved as the requester. ``run`` returns a JSON-able
+    summary, or None when its output is the result file.
+    """
+
+    def register(run):
+        JOB_TYPES[kind] = JobType(run, prepare, roles)
+        return run
+
+    return register
+
+
+# ── Queueing (web side) ────────────────────────────────────────────
+def submit_job(kind, user, params):
+    """(queued Job, error response) for a ``kind`` job on behalf of ``user``."""
+    spec = JOB_TYPES.get(kind)
+    if not spec:
+        return None, (jsonify({"error": f"Unknown job kind: {kind}"}), 400)
+    if user.role not in spec.roles:
+        return None, (jsonify({"error": "You are not allowed to run this job"}), 403)
+
+    params = params or {}
+    if spec.prepare:
+        params, error = spec.prepare(user, params)
+        if error:
+            return None, error
+
+    job = Job(kind=kind, user_id=user.id, params=json.dumps(params), status="queued", message="Queued")
+    db.session.add(job)
+    db.session.commit()
+    return job, None
+
+
+def queued_response(job):
+    return (
+        jsonify({"message": "Job queued", "job": job.to_dict()}),
+        202,
+        {"Location": url_for("jobs.get_job", job_id=job.id)},
+    )
+
+
+def job_result_dir(job_id, attempt=None):
+    """Where a job's files live; each attempt writes under its own subdirectory."""
+    directory = os.path.join(current_app.config["JOB_RESULTS_DIR"], str(job_id))
+    return directory if attempt is None else os.path.join(directory, str(attempt))
+
+
+def job_result_path(job):
+    return os.path.join(job_result_dir(job.id, job.attempts), job.result_name)
+
+
+def purge_jobs(before):
+    """Delete finished jobs (and their result files) that ended before ``before``."""
+    finished = Job.query.filter(Job.status.in_(("succeeded", "failed")), Job.finished_at < before)
+    job_ids = [job_id for (job_id,) in finished.with_entities(Job.id)]
+    for job_id in job_ids:
+        shutil.rmtree(job_result_dir(job_id), ignore_errors=True)
+    deleted = finished.delete(synchronize_session=False)
+    db.session.commit()
+    return deleted
+
+
+# ── Running (worker side) ──────────────────────────────────────────
+class JobSuperseded(Exception):
+    """The job row no longer belongs to this worker's attempt (it was requeued and claimed again)."""
+
+
+def _update_job(claim, **values):
+    """Update the job ``claim`` (job id, worker, attempt) names, if that attempt still owns it.
+
+    Returns whether it did: a job requeued by requeue_stale_jobs while its
+    first worker was still alive must not be written to by that worker.
+    """
+    job_id, worker, attempt = claim
+    updated = db.session.execute(
+        update(Job)
+        .where(Job.id == job_id, Job.worker == worker, Job.attempts == attempt)
+        .values(heartbeat_at=func.now(), **values)
+    ).rowcount
+    db.session.commit()
+    return bool(updated)
+
+
+class JobContext:
+    """What a handler sees: its params and requester, progress reporting and a result file."""
+
+    def __init__(self, job):
+        self.claim = (job.id, job.worker, job.attempts)
+        self.params = job.param_values()
+        self.user = db.session.get(User, job.user_id)
+        self.directory = job_result_dir(job.id, job.attempts)
+        self.result_name = None
+        self.result_type = None
+        self._last_progress = 0.0
+
+    def progress(self, done, total, message=None):
+        """Record ``done`` of ``total`` steps; commits the session, so call it between batches.
+
+        Raises JobSuperseded if another attempt has taken the job over.
+        """
+        now = time.monotonic()
+        if now - self._last_progress < PROGRESS_INTERVAL:
+            return
+        self._last_progress = now
+        percent = min(99, done * 100 // total) if total else 0
+        if not _update_job(self.claim, progress=percent, message=message or f"{done} of {total}"):
+            raise JobSuperseded()
+
+    def open_result(self, name, mimetype):
+        """Binary file the handler writes its output to; served by GET /api/jobs/<id>/result.
+
+        It is written as ``<name>.part`` in this attempt's own directory and
+        only renamed to ``name`` once the handler returns.
+        """
+        shutil.rmtree(self.directory, ignore_errors=True)
+        os.makedirs(self.directory)
+        self.result_name, self.result_type = name, mimetype
+        return open(self._partial_path(), "wb")
+
+    def publish_result(self):
+        if self.result_name:
+            os.replace(self._partial_path(), os.path.join(self.directory, self.result_name))
+
+    def discard_result(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def _partial_path(self):
+        return os.path.join(self.directory, f"{self.result_name}.part")
+
+
+class Heartbeat:
+    """Touches a running job's heartbeat_at from a side thread, so long handler steps don't look stale."""
+
+    def __init__(self, app, claim):
+        self.app = app
+        self.claim = claim
+        self.interval = app.config.get("JOB_HEARTBEAT", 15)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=f"job-heartbeat-{claim[0]}", daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                # Its own app context, and so its own session and connection.
+                with self.app.app_context():
+                    _update_job(self.claim)
+            except Exception:
+                self.app.logger.exception("Heartbeat for job %s failed", self.claim[0])
+
+
+def claim_next_job(worker):
+    """Id of the oldest queued job, now marked running for ``worker``, or None.
+
+    The claim is a conditional UPDATE, so when two workers race for a row
+    only one of them gets it and the other moves on to the next.
+    """
+    while True:
+        job_id = db.session.query(Job.id).filter(Job.status == "queued").order_by(Job.id.asc()).limit(1).scalar()
+        if job_id is None:
+            db.session.rollback()
+            return None
+        claimed = db.session.execute(
+            update(Job)
+            .where(Job.id == job_id, Job.status == "queued")
+            .values(
+                status="running",
+                worker=worker,
+                attempts=Job.attempts + 1,
+                progress=0,
+                message="Started",
+                error=None,
+                started_at=func.now(),
+                heartbeat_at=func.now(),
+            )
+        ).rowcount
+        db.session.commit()
+        if claimed:
+            return job_id
+
+
+def run_job(job_id):
+    """Run one claimed job to completion and record how it ended; True on success.
+
+    The outcome is only recorded while this attempt still owns the row; if
+    the job was requeued and claimed again meanwhile, this attempt's result
+    file is dropped and the newer attempt's outcome stands.
+    """
+    job = db.session.get(Job, job_id)
+    spec = JOB_TYPES.get(job.kind)
+    context = JobContext(job)
+    heartbeat = Heartbeat(current_app._get_current_object(), context.claim)
+    heartbeat.start()
+    try:
+        if not spec:
+            raise LookupError(f"No handler for {job.kind} jobs")
+        summary = spec.run(context)
+        context.publish_result()
+    except JobSuperseded:
+        db.session.rollback()
+        current_app.logger.warning("Job %s (%s) was taken over by another worker", job_id, job.kind)
+        context.discard_result()
+        return False
+    except Exception as exc:
+        db.session.rollback()
+        current_app.logger.exception("Job %s (%s) failed", job_id, job.kind)
+        context.discard_result()
+        _update_job(context.claim, status="failed", message="Failed", error=str(exc) or type(exc).__name__,
+                    finished_at=func.now())
+        return False
+    finally:
+        heartbeat.stop()
+
+    recorded = _update_job(
+        context.claim,
+        status="succeeded",
+        progress=100,
+        message="Done",
+        result=json.dumps(summary) if summary is not None else None,
+        result_name=context.result_name,
+        result_type=context.result_type,
+        finished_at=func.now(),
+    )
+    if not recorded:
+        current_app.logger.warning("Job %s (%s) was taken over by another worker", job_id, job.kind)
+        context.discard_result()
+    return recorded
+
+
+def requeue_stale_jobs(stale_after):
+    """Queue running jobs whose worker stopped heartbeating again, or fail them after MAX_ATTEMPTS.
+
+    Returns (requeued, failed).
+    """
+    cutoff = db.session.query(func.now()).scalar() - stale_after
+    stale = (Job.status == "running") & (Job.heartbeat_at < cutoff)
+    failed = db.session.execute(
+        update(Job)
+        .where(stale, Job.attempts >= MAX_ATTEMPTS)
+        .values(status="failed", message="Failed", error="Worker stopped responding", finished_at=func.now())
+    ).rowcount
+    requeued = db.session.execute(
+        update(Job)
+        .where(stale, Job.attempts < MAX_ATTEMPTS)
+        .values(status="queued", worker=None, message="Requeued after its worker stopped responding")
+    ).rowcount
+    db.session.commit()
+    return requeued, failed
+
+
+def work(app, stop=None):
+    """Claim and run jobs until ``stop`` (a threading.Event) is set.
+
+    Every poll and every job gets a fresh app context, and with it a fresh
+    session, so nothing read for one job lingers into the next.
+    """
+    worker = f"{socket.gethostname()}:{os.getpid()}"
+    poll_interval = app.config.get("JOB_POLL_INTERVAL", 1.0)
+    stale_after = app.config.get("JOB_STALE_AFTER")
+    next_recovery = 0.0
+    while not (stop and stop.is_set()):
+        with app.app_context():
+            if time.monotonic() >= next_recovery:
+                requeue_stale_jobs(stale_after)
+                next_recovery = time.monotonic() + RECOVERY_INTERVAL
+            job_id = claim_next_job(worker)
+        if job_id is not None:
+            with app.app_context():
+                run_job(job_id)
+            continue
+        if stop:
+            stop.wait(poll_interval)
+        else:
+            time.sleep(poll_interval)
@@ -0,0 +1,86 @@
+import base64
+import json
+from datetime import datetime
+
+from models import db
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+def parse_page_size(value, default=DEFAULT_PAGE_SIZE, maximum=MAX_PAGE_SIZE):
+    raw_value = str(value or "").strip()
+    if not raw_value:
+        return default
+
+    try:
+        size = int(raw_value)
+    except ValueError as exc:
+        raise ValueError("Invalid page size") from exc
+
+    if size < 1:
+        raise ValueError("Invalid page size")
+    return min(size, maximum)
+
+
+def encode_cursor(created_at, row_id):
+    # Rows without a created_at sort after every dated row; their cursor carries None.
+    payload = json.dumps([created_at.isoformat() if created_at else None, row_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token):
+    raw_value = str(token or "").strip()
+    if not raw_value:
+        return None
+
+    try:
+        padded = raw_value + "=" * (-len(raw_value) % 4)
+        created_at, row_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return (datetime.fromisoformat(created_at) if created_at is not None else None), int(row_id)
+    except (ValueError, TypeError) as exc:
+        raise ValueError("Invalid cursor") from exc
+
+
+def _cursor_value(created_at):
+    """``created_at`` bound the way the column stores it.
+
+    SQLite keeps DATETIME as 'YYYY-MM-DD HH:MM:SS' text, while a bound
+    datetime renders with '.000000' appended and would compare as a later
+    string, so the seek would never move past the cursor row.
+    """
+    if db.session.get_bind().dialect.name == "sqlite":
+        return db.func.datetime(created_at.isoformat(sep=" "))
+    return created_at
+
+
+def apply_keyset_page(query, created_column, id_column, cursor, limit):
+    """Order newest-first on (created_at, id) and seek past ``cursor``.
+
+    Rows with a NULL created_at come last (MySQL and SQLite both sort NULLs
+    after everything else in descending order), ordered by id. Fetches one
+    extra row so callers can tell whether another page exists without
+    issuing a COUNT.
+    """
+    if cursor:
+        created_at, row_id = cursor
+        if created_at is None:
+            query = query.filter(created_column.is_(None) & (id_column < row_id))
+        else:
+            created_at = _cursor_value(created_at)
+            query = query.filter(
+                (created_column < created_at)
+                | ((created_column == created_at) & (id_column < row_id))
+                | created_column.is_(None)
+            )
+    return query.order_by(created_column.desc(), id_column.desc()).limit(limit + 1)
+
+
+def split_page(rows, limit, created_attr="created_at"):
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    next_cursor = None
+    if has_more and rows:
+        last_row = rows[-1]
+        next_cursor = encode_cursor(getattr(last_row, created_attr), last_row.id)
+    return rows, next_cursor
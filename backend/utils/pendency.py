@@ -0,0 +1,176 @@
+import re
+from collections import Counter
+from datetime import date, timedelta
+
+from models import db
+from models.case import Case, CaseTimeline
+from models.rollup import PendencySnapshot
+
+BACKFILL_YEARS = 10
+BATCH_SIZE = 1000
+STATUS_CHANGE_EVENT = "Case Status Updated"
+STATUS_CHANGE_PATTERN = re.compile(r"^Status changed from (.+) to (.+)\.$")
+
+
+def status_from_label(label):
+    """Invert the "Judgment Reserved" style labels written to the case timeline."""
+    return label.strip().lower().replace(" ", "_")
+
+
+def parse_status_change(description):
+    """(from_status, to_status) for a status-change timeline entry, or None."""
+    match = STATUS_CHANGE_PATTERN.match(description or "")
+    if not match:
+        return None
+    return status_from_label(match.group(1)), status_from_label(match.group(2))
+
+
+def snapshot_key(case_type, courtroom, status):
+    return (case_type, courtroom or "", status or "filed")
+
+
+def _replace_days(start, end, rows):
+    PendencySnapshot.query.filter(PendencySnapshot.date >= start, PendencySnapshot.date <= end).delete(
+        synchronize_session=False
+    )
+    if rows:
+        db.session.bulk_insert_mappings(PendencySnapshot, rows)
+
+
+def write_snapshot(day=None):
+    """Record today's (or ``day``'s) counts per type, court room and status from the live cases table."""
+    day = day or date.today()
+    counts = Counter()
+    for case_type, courtroom, status, count in db.session.query(
+        Case.case_type, Case.court_room_name, Case.status, db.func.count(Case.id)
+    ).group_by(Case.case_type, Case.court_room_name, Case.status):
+        counts[snapshot_key(case_type, courtroom, status)] += count
+    rows = [
+        {"date": day, "case_type": case_type, "courtroom": courtroom, "status": status, "case_count": count}
+        for (case_type, courtroom, status), count in counts.items()
+        if count
+    ]
+    _replace_days(day, day, rows)
+    db.session.commit()
+    return len(rows)
+
+
+def _case_deltas(start, end, batch_size):
+    """Counter of (day, key) -> +/-1 from filing dates and status-change timeline entries.
+
+    Case type and court room are taken as they are now; only status history
+    is recorded on the timeline. Changes before ``start`` are folded into it.
+    """
+    deltas = Counter()
+    last_id = 0
+    while True:
+        cases = (
+            db.session.query(Case.id, Case.filing_date, Case.case_type, Case.court_room_name, Case.status)
+            .filter(Case.id > last_id, Case.filing_date <= end)
+            .order_by(Case.id.asc())
+            .limit(batch_size)
+            .all()
+        )
+        if not cases:
+            break
+
+        changes = {}
+        for case_id, event_date, description in (
+            db.session.query(CaseTimeline.case_id, CaseTimeline.date, CaseTimeline.description)
+            .filter(
+                CaseTimeline.case_id.in_([row.id for row in cases]),
+                CaseTimeline.event == STATUS_CHANGE_EVENT,
+                CaseTimeline.date <= end,
+            )
+            .order_by(CaseTimeline.date.asc(), CaseTimeline.created_at.asc(), CaseTimeline.id.asc())
+        ):
+            change = parse_status_change(description)
+            if change:
+                changes.setdefault(case_id, []).append((event_date, change))
+
+        for case_id, filing_date, case_type, courtroom, status in cases:
+            history = changes.get(case_id, [])
+            current = history[0][1][0] if history else status
+            deltas[(max(filing_date, start), snapshot_key(case_type, courtroom, current))] += 1
+            for event_date, (_, next_status) in history:
+                if next_status == current:
+                    continue
+                day = max(event_date, filing_date, start)
+                deltas[(day, snapshot_key(case_type, courtroom, current))] -= 1
+                deltas[(day, snapshot_key(case_type, courtroom, next_status))] += 1
+                current = next_status
+
+        last_id = cases[-1].id
+
+    return deltas
+
+
+def backfill_snapshots(start=None, end=None, batch_size=BATCH_SIZE):
+    """Rebuild daily snapshots for ``start``..``end`` (default: the last ten years up to yesterday).
+
+    Replays every case's filing date and status changes as per-day deltas and
+    sweeps them forward once, so the cost is one pass over cases and timeline
+    rather than one count per day.
+    """
+    end = end or date.today() - timedelta(days=1)
+    start = start or end - timedelta(days=365 * BACKFILL_YEARS + BACKFILL_YEARS // 4)
+    earliest = db.session.query(db.func.min(Case.filing_date)).scalar()
+    if earliest is None or earliest > end:
+        return 0
+    start = max(start, earliest)
+
+    deltas_by_day = {}
+    for (day, key), delta in _case_deltas(start, end, batch_size).items():
+        if delta:
+            deltas_by_day.setdefault(day, Counter())[key] += delta
+
+    running = Counter()
+    written = 0
+    day = start
+    while day <= end:
+        chunk_start, chunk_end = day, min(day + timedelta(days=30), end)
+        rows = []
+        while day <= chunk_end:
+            running.update(deltas_by_day.get(day, {}))
+            rows.extend(
+                {"date": day, "case_type": case_type, "courtroom": courtroom, "status": status, "case_count": count}
+                for (case_type, courtroom, status), count in running.items()
+                if count > 0
+            )
+            day += timedelta(days=1)
+        _replace_days(chunk_start, chunk_end, rows)
+        db.session.commit()
+        written += len(rows)
+    return written
+
+
+def pending_by_day(start, end, statuses):
+    """{day: cases in ``statuses``} for every snapshotted day in ``start``..``end``.
+
+    Days that were snapshotted with none of ``statuses`` map to 0, so callers
+    can tell them apart from days the job did not run.
+    """
+    rows = db.session.query(
+        PendencySnapshot.date,
+        db.func.sum(db.case((PendencySnapshot.status.in_(statuses), PendencySnapshot.case_count), else_=0)),
+    ).filter(
+        PendencySnapshot.date >= start,
+        PendencySnapshot.date <= end,
+    ).group_by(PendencySnapshot.date)
+    return {day: int(count or 0) for day, count in rows}
+
+
+def snapshots_cover(day):
+    """True when pendency_snapshots holds history for ``day``.
+
+    A backfill starts at the earliest filing date, so days before it count
+    as covered too (nothing was pending yet).
+    """
+    earliest = db.session.query(db.func.min(PendencySnapshot.date)).scalar()
+    if earliest is None:
+        return False
+    if earliest <= day:
+        return True
+    first_filing = db.session.query(db.func.min(Case.filing_date)).scalar()
+    # No cases at all (e.g. after a purge or reseed): nothing was ever pending.
+    return first_filing is None or earliest <= first_filing
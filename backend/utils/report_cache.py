@@ -0,0 +1,176 @@
+import hashlib
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+
+from flask import current_app
+from sqlalchemy import func, select
+
+from models import db
+from models.case import CaseTimeline, Hearing
+from models.document import Document
+from models.user import User
+from utils.etags import SETTLE_TIME
+
+# Part of every cache key; bump it when the report text or the PDF writer
+# changes so reports rendered by the old code are never served again.
+REPORT_FORMAT = 2
+
+
+def case_report_version(case):
+    """Stamp of everything ``case``'s PDF report is built from, or None while a write is settling.
+
+    Covers the case row, its hearings, documents and timeline, and the names
+    the report prints (advocate and document uploaders), in two small
+    queries, so checking for a stale report never loads the case's details.
+    """
+    hearings = select(func.max(Hearing.updated_at), func.count(Hearing.id)).where(Hearing.case_id == case.id)
+    documents = select(func.max(Document.updated_at), func.count(Document.id)).where(Document.case_id == case.id)
+    timeline = select(func.max(CaseTimeline.id), func.count(CaseTimeline.id)).where(CaseTimeline.case_id == case.id)
+    advocate = select(User.name, User.email).where(User.id == case.advocate_id)
+    (
+        latest_hearing, hearing_count, latest_document, document_count,
+        latest_entry, entry_count, advocate_name, advocate_email, now,
+    ) = db.session.execute(
+        select(
+            *(query.with_only_columns(column).scalar_subquery()
+              for query in (hearings, documents, timeline, advocate)
+              for column in query.selected_columns),
+            func.now(),
+        )
+    ).one()
+    if any(latest and latest >= now - SETTLE_TIME for latest in (case.updated_at, latest_hearing, latest_document)):
+        return None
+
+    uploaders = db.session.scalars(
+        select(User.name).join(Document, Document.uploaded_by == User.id)
+        .where(Document.case_id == case.id).distinct().order_by(User.name)
+    ).all()
+    return (
+        REPORT_FORMAT, case.updated_at, latest_hearing, hearing_count, latest_document, document_count,
+        latest_entry, entry_count, advocate_name, advocate_email, tuple(uploaders),
+    )
+
+
+def report_key(case_id, version):
+    return (case_id, hashlib.sha1(repr(version).encode("utf-8")).hexdigest())
+
+
+class ReportCache:
+    """Rendered PDF reports by content key: an in-memory LRU over a spill directory.
+
+    Keys are (case id, digest of the case's version stamp), so a changed case
+    simply misses and nothing needs invalidating. Every report is also
+    written to ``<directory>/<case id>/<digest>.pdf``, where other worker
+    processes (and this one, after the LRU drops it) pick it up; writing a
+    new version of a case removes the old file, so the directory holds at
+    most one report per case.
+    """
+
+    def __init__(self, max_entries=128, max_bytes=64 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def get(self, key, directory=None):
+        with self._lock:
+            payload = self._entries.get(key)
+            if payload is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return payload
+
+        payload = self._read(directory, key) if directory else None
+        with self._lock:
+            if payload is None:
+                self.misses += 1
+                return None
+            self.disk_hits += 1
+            self._remember(key, payload)
+        return payload
+
+    def put(self, key, payload, directory=None):
+        with self._lock:
+            self._remember(key, payload)
+        if directory:
+            self._write(directory, key, payload)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.disk_hits + self.misses
+            return {
+                "hits": self.hits,
+                "diskHits": self.disk_hits,
+                "misses": self.misses,
+                "hitRatio": round((self.hits + self.disk_hits) / lookups, 4) if lookups else 0.0,
+                "entries": len(self._entries),
+                "bytes": self._size,
+            }
+
+    def _remember(self, key, payload):
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._size -= len(previous)
+        if len(payload) > self.max_bytes:
+            return
+        self._entries[key] = payload
+        self._size += len(payload)
+        while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._size -= len(evicted)
+
+    @staticmethod
+    def _read(directory, key):
+        case_id, digest = key
+        try:
+            with open(os.path.join(directory, str(case_id), f"{digest}.pdf"), "rb") as handle:
+                return handle.read()
+        except FileNotFoundError:
+            return None
+
+    @staticmethod
+    def _write(directory, key, payload):
+        case_id, digest = key
+        case_directory = os.path.join(directory, str(case_id))
+        os.makedirs(case_directory, exist_ok=True)
+        # Rename into place so a concurrent reader never sees half a file.
+        handle, temp_path = tempfile.mkstemp(dir=case_directory, suffix=".tmp")
+        with os.fdopen(handle, "wb") as temp_file:
+            temp_file.write(payload)
+        os.replace(temp_path, os.path.join(case_directory, f"{digest}.pdf"))
+
+        for name in os.listdir(case_directory):
+            if name.endswith(".pdf") and name != f"{digest}.pdf":
+                try:
+                    os.remove(os.path.join(case_directory, name))
+                except FileNotFoundError:
+                    pass
+
+
+report_cache = ReportCache()
+
+
+def cached_case_report(case, render):
+    """PDF bytes of ``case``'s report, calling ``render()`` only when the case changed since the last one."""
+    version = case_report_version(case)
+    if version is None:
+        return render()
+
+    directory = current_app.config.get("REPORT_CACHE_DIR")
+    key = report_key(case.id, version)
+    payload = report_cache.get(key, directory)
+    if payload is None:
+        payload = render()
+        report_cache.put(key, payload, directory)
+    return payload
@@ -0,0 +1,118 @@
+import multiprocessing
+import os
+import threading
+import zipfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from flask import current_app
+
+from utils.exporters import PdfWriter, generate_simple_pdf, render_pdf_page_objects
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def report_workers():
+    return current_app.config.get("REPORT_WORKERS") or os.cpu_count() or 1
+
+
+def report_executor():
+    """Process pool shared by every bulk report request in this worker, started on first use.
+
+    Its processes come from a fork server (spawned where that is missing)
+    rather than forking this process: the server and job worker run other
+    threads (event bridge, job heartbeat), and a fork taken while one of them
+    holds a lock, or a pooled database connection, would hand both to the
+    child. The fork server is a clean interpreter with only the exporters
+    preloaded, so workers start quickly and share no database connections.
+    Render functions only turn plain strings into PDF bytes and need no app.
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            if "forkserver" in multiprocessing.get_all_start_methods():
+                context = multiprocessing.get_context("forkserver")
+                context.set_forkserver_preload(["utils.exporters"])
+            else:
+                context = multiprocessing.get_context("spawn")
+            _executor = ProcessPoolExecutor(max_workers=report_workers(), mp_context=context)
+    return _executor
+
+
+def _discard_executor(executor):
+    global _executor
+    with _executor_lock:
+        if _executor is executor:
+            _executor = None
+    executor.shutdown(wait=False, cancel_futures=True)
+
+
+def render_in_order(render, reports):
+    """Yield (name, render(title, lines)) for each (name, title, lines) in ``reports``, in order.
+
+    Keeps two renders per worker in flight, so every core stays busy while
+    the caller streams earlier results, without queueing the whole batch.
+    """
+    executor = report_executor()
+    window = 2 * report_workers()
+    pending = deque()
+    try:
+        for name, title, lines in reports:
+            pending.append((name, executor.submit(render, title, lines)))
+            if len(pending) >= window:
+                name, future = pending.popleft()
+                yield name, future.result()
+        while pending:
+            name, future = pending.popleft()
+            yield name, future.result()
+    except BrokenProcessPool:
+        # A worker died (e.g. killed for memory); start a fresh pool next time.
+        _discard_executor(executor)
+        raise
+    finally:
+        for _, future in pending:
+            future.cancel()
+
+
+class ChunkBuffer:
+    """Write-only byte sink that hands back whatever was written since the last ``drain``."""
+
+    def __init__(self):
+        self._chunks = []
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self):
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def stream_merged_pdf(reports):
+    """Yield one PDF holding every report's pages, a report at a time."""
+    sink = ChunkBuffer()
+    writer = PdfWriter(sink)
+    for _, content_objects in render_in_order(render_pdf_page_objects, reports):
+        for content_object in content_objects:
+            writer.add_page(content_object)
+        yield sink.drain()
+    writer.close()
+    yield sink.drain()
+
+
+def stream_report_zip(reports):
+    """Yield a ZIP archive with one PDF per report, named by each report's name."""
+    sink = ChunkBuffer()
+    # The PDFs are already Flate-compressed; deflating them again buys nothing.
+    with zipfile.ZipFile(sink, "w", compression=zipfile.ZIP_STORED) as archive:
+        for name, payload in render_in_order(generate_simple_pdf, reports):
+            archive.writestr(name, payload)
+            yield sink.drain()
+    yield sink.drain()
@@ -0,0 +1,175 @@
+from collections import Counter
+
+from flask import current_app
+from sqlalchemy import event, inspect
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+from models import db
+from models.case import Case, Hearing
+from models.rollup import CaseRollup, HearingRollup, RollupBuild
+
+ROLLUP_BUILD = "rollups"
+
+
+def case_rollup_key(filing_date, case_type, status, advocate_id):
+    if not filing_date or not case_type:
+        return None
+    return (filing_date.replace(day=1), case_type, status or "filed", advocate_id or 0)
+
+
+def hearing_rollup_key(hearing_date, location):
+    if not hearing_date:
+        return None
+    return (hearing_date, location or "")
+
+
+def _previous_value(obj, attribute):
+    history = inspect(obj).attrs[attribute].history
+    if history.deleted:
+        return history.deleted[0]
+    if history.unchanged:
+        return history.unchanged[0]
+    return getattr(obj, attribute)
+
+
+def _case_key(case, previous=False):
+    read = (lambda name: _previous_value(case, name)) if previous else (lambda name: getattr(case, name))
+    return case_rollup_key(read("filing_date"), read("case_type"), read("status"), read("advocate_id"))
+
+
+def _hearing_key(hearing, previous=False):
+    read = (lambda name: _previous_value(hearing, name)) if previous else (lambda name: getattr(hearing, name))
+    return hearing_rollup_key(read("date"), read("location"))
+
+
+def collect_rollup_deltas(session):
+    """Net rollup changes implied by the pending new, dirty and deleted rows."""
+    case_deltas = Counter()
+    hearing_deltas = Counter()
+    for model, key_for, deltas in ((Case, _case_key, case_deltas), (Hearing, _hearing_key, hearing_deltas)):
+        for obj in session.new:
+            if isinstance(obj, model) and key_for(obj):
+                deltas[key_for(obj)] += 1
+        for obj in session.deleted:
+            if isinstance(obj, model) and key_for(obj, previous=True):
+                deltas[key_for(obj, previous=True)] -= 1
+        for obj in session.dirty:
+            if not isinstance(obj, model) or obj in session.deleted or not session.is_modified(obj):
+                continue
+            before, after = key_for(obj, previous=True), key_for(obj)
+            if before != after:
+                if before:
+                    deltas[before] -= 1
+                if after:
+                    deltas[after] += 1
+    return case_deltas, hearing_deltas
+
+
+def _upsert_increment(connection, model, key_values, count_column, delta):
+    table = model.__table__
+    if connection.dialect.name == "mysql":
+        stmt = mysql_insert(table).values(**key_values, **{count_column: delta})
+        stmt = stmt.on_duplicate_key_update({count_column: table.c[count_column] + stmt.inserted[count_column]})
+    else:
+        stmt = sqlite_insert(table).values(**key_values, **{count_column: delta})
+        stmt = stmt.on_conflict_do_update(
+            index_elements=list(key_values),
+            set_={count_column: table.c[count_column] + stmt.excluded[count_column]},
+        )
+    connection.execute(stmt)
+
+
+def apply_rollup_deltas(connection, case_deltas, hearing_deltas):
+    for (month, case_type, status, advocate_id), delta in case_deltas.items():
+        if delta:
+            _upsert_increment(
+                connection,
+                CaseRollup,
+                {"month": month, "case_type": case_type, "status": status, "advocate_id": advocate_id},
+                "case_count",
+                delta,
+            )
+    for (hearing_date, courtroom), delta in hearing_deltas.items():
+        if delta:
+            _upsert_increment(
+                connection,
+                HearingRollup,
+                {"date": hearing_date, "courtroom": courtroom},
+                "hearing_count",
+                delta,
+            )
+
+
+def _collect_rollups(session, flush_context, instances):
+    # Read keys before the flush so rows about to be deleted can still load.
+    session.info["rollup_deltas"] = collect_rollup_deltas(session)
+
+
+def _apply_rollups(session, flush_context):
+    case_deltas, hearing_deltas = session.info.pop("rollup_deltas", (None, None))
+    if case_deltas or hearing_deltas:
+        apply_rollup_deltas(session.connection(), case_deltas, hearing_deltas)
+
+
+def register_rollup_listeners():
+    """Keep the rollup tables in step with every ORM flush that touches cases or hearings."""
+    if not event.contains(db.session, "before_flush", _collect_rollups):
+        event.listen(db.session, "before_flush", _collect_rollups)
+        event.listen(db.session, "after_flush", _apply_rollups)
+
+
+def rollups_ready():
+    """True once rebuild_rollups() has run against this database.
+
+    Remembered per app after the first hit, so the marker is only looked up
+    until it appears.
+    """
+    if current_app.extensions.get("rollups_ready"):
+        return True
+    ready = db.session.get(RollupBuild, ROLLUP_BUILD) is not None
+    current_app.extensions["rollups_ready"] = ready
+    return ready
+
+
+def rebuild_rollups():
+    """Regenerate both rollup tables from the cases and hearings tables."""
+    CaseRollup.query.delete()
+    HearingRollup.query.delete()
+    RollupBuild.query.filter_by(name=ROLLUP_BUILD).delete()
+
+    case_counts = Counter()
+    rows = db.session.query(
+        Case.filing_date, Case.case_type, Case.status, Case.advocate_id, db.func.count(Case.id)
+    ).group_by(Case.filing_date, Case.case_type, Case.status, Case.advocate_id)
+    for filing_date, case_type, status, advocate_id, count in rows:
+        key = case_rollup_key(filing_date, case_type, status, advocate_id)
+        if key:
+            case_counts[key] += count
+
+    hearing_counts = Counter()
+    rows = db.session.query(Hearing.date, Hearing.location, db.func.count(Hearing.id)).group_by(
+        Hearing.date, Hearing.location
+    )
+    for hearing_date, location, count in rows:
+        key = hearing_rollup_key(hearing_date, location)
+        if key:
+            hearing_counts[key] += count
+
+    db.session.bulk_insert_mappings(
+        CaseRollup,
+        [
+            {"month": month, "case_type": case_type, "status": status, "advocate_id": advocate_id, "case_count": count}
+            for (month, case_type, status, advocate_id), count in case_counts.items()
+        ],
+    )
+    db.session.bulk_insert_mappings(
+        HearingRollup,
+        [
+            {"date": hearing_date, "courtroom": courtroom, "hearing_count": count}
+            for (hearing_date, courtroom), count in hearing_counts.items()
+        ],
+    )
+    db.session.add(RollupBuild(name=ROLLUP_BUILD))
+    db.session.commit()
+    return len(case_counts), len(hearing_counts)
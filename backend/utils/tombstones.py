@@ -0,0 +1,92 @@
+from sqlalchemy import event, inspect
+
+from models import db
+from models.tombstone import Tombstone
+
+
+def _tracked_entities():
+    from models.case import Case, Hearing
+    from models.case_note import CaseNote
+    from models.document import Document
+    from models.notification import Notification
+    from models.task import Task
+
+    return {
+        Case: "cases",
+        Hearing: "hearings",
+        Document: "documents",
+        Task: "tasks",
+        CaseNote: "notes",
+        Notification: "notifications",
+    }
+
+
+def _case_scope(case):
+    if case is None:
+        return {}
+    return {"advocate_id": case.advocate_id, "petitioner_user_id": case.petitioner_user_id}
+
+
+def _scope_for(obj, entity):
+    if entity == "cases":
+        return _case_scope(obj)
+    if entity in ("hearings", "documents"):
+        return _case_scope(obj.case)
+    return {"user_id": obj.user_id}
+
+
+def _previous_value(obj, attribute):
+    history = inspect(obj).attrs[attribute].history
+    return history.deleted[0] if history.deleted else None
+
+
+def _record_tombstones(session, flush_context, instances):
+    entities = _tracked_entities()
+    tombstones = []
+    for obj in session.deleted:
+        entity = entities.get(type(obj))
+        if entity and obj.id is not None:
+            tombstones.append(Tombstone(entity=entity, entity_id=obj.id, **_scope_for(obj, entity)))
+
+    # A reassigned case disappears from the previous advocate's or citizen's
+    # list without being deleted; tell their clients to drop it, and its
+    # hearings and documents, too. Clients are not expected to cascade a case
+    # tombstone to child rows themselves.
+    from models.case import Case, Hearing
+    from models.document import Document
+
+    for obj in session.dirty:
+        if not isinstance(obj, Case) or obj in session.deleted:
+            continue
+        previous_advocate = _previous_value(obj, "advocate_id")
+        previous_petitioner = _previous_value(obj, "petitioner_user_id")
+        if not (previous_advocate or previous_petitioner):
+            continue
+        scope = {
+            "reason": "reassigned",
+            "advocate_id": previous_advocate if previous_advocate != obj.advocate_id else None,
+            "petitioner_user_id": previous_petitioner if previous_petitioner != obj.petitioner_user_id else None,
+        }
+        tombstones.append(Tombstone(entity="cases", entity_id=obj.id, **scope))
+        with session.no_autoflush:
+            for entity, model in (("hearings", Hearing), ("documents", Document)):
+                child_ids = session.query(model.id).filter(model.case_id == obj.id)
+                tombstones.extend(Tombstone(entity=entity, entity_id=child_id, **scope) for (child_id,) in child_ids)
+    session.add_all(tombstones)
+
+
+def register_tombstone_listeners():
+    """Write a tombstone for every ORM delete of a synced row, in the same transaction.
+
+    A case reassignment also tombstones the case's hearings and documents
+    for the previous advocate or citizen.
+    """
+    if not event.contains(db.session, "before_flush", _record_tombstones):
+        event.listen(db.session, "before_flush", _record_tombstones)
+
+
+def purge_tombstones(before):
+    """Drop tombstones older than ``before``; clients that far behind get a full resync."""
+    deleted = Tombstone.query.filter(Tombstone.deleted_at < before).delete(synchronize_session=False)
+    db.session.commit()
+    return deleted
@@ -0,0 +1,109 @@
+"""
+Check that case detail, CSV and PDF endpoints issue a fixed number of
+queries no matter how many documents a case holds.
+Run:  python verify_query_counts.py
+All rows it creates are rolled back at the end.
+"""
+
+from datetime import date
+
+from flask_jwt_extended import create_access_token
+from sqlalchemy import event
+
+from app import create_app
+from models import db
+from models.case import Case, CaseTimeline, Hearing
+from models.document import Document
+from models.user import User
+
+DETAIL_ENDPOINTS = [
+    "/api/cases/{case_id}",
+    "/api/cases/{case_id}/export.csv",
+    "/api/cases/{case_id}/report.pdf",
+]
+
+
+def auth_header(token):
+    return {"Authorization": f"Bearer {token}"}
+
+
+class QueryCounter:
+    def __init__(self, engine):
+        self.engine = engine
+        self.count = 0
+
+    def _on_execute(self, *args, **kwargs):
+        self.count += 1
+
+    def __enter__(self):
+        self.count = 0
+        event.listen(self.engine, "before_cursor_execute", self._on_execute)
+        return self
+
+    def __exit__(self, *exc_info):
+        event.remove(self.engine, "before_cursor_execute", self._on_execute)
+
+
+def add_documents(case_id, count):
+    # A distinct uploader per document, so lazy uploader loads would show up.
+    for index in range(count):
+        uploader = User(name=f"Query Check Uploader {case_id}-{index}", role="advocate")
+        db.session.add(uploader)
+        db.session.flush()
+        db.session.add(
+            Document(
+                case_id=case_id,
+                uploaded_by=uploader.id,
+                title=f"Query check document {index}",
+                file_type="pdf",
+            )
+        )
+    db.session.flush()
+
+
+def main():
+    app = create_app()
+    with app.app_context():
+        client = app.test_client()
+        court = User.query.filter_by(role="court").first()
+        advocate = User.query.filter_by(role="advocate").first()
+        assert court and advocate, "Seed the database before running this check"
+        token = create_access_token(identity=str(court.id))
+
+        case = Case(
+            case_number="QRY-CHECK-0001",
+            title="Query count check",
+            case_type="Civil",
+            petitioner="Query Check Petitioner",
+            respondent="Query Check Respondent",
+            advocate_id=advocate.id,
+            filing_date=date.today(),
+        )
+        db.session.add(case)
+        db.session.flush()
+        db.session.add(Hearing(case_id=case.id, date=date.today(), type="Case Hearing"))
+        db.session.add(CaseTimeline(case_id=case.id, date=date.today(), event="Case Filed"))
+        db.session.flush()
+        case_id = case.id
+
+        try:
+            results = {}
+            for document_count in (1, 25):
+                add_documents(case_id, document_count)
+                for endpoint in DETAIL_ENDPOINTS:
+                    db.session.expunge_all()
+                    with QueryCounter(db.engine) as counter:
+                        response = client.get(endpoint.format(case_id=case_id), headers=auth_header(token))
+                    assert response.status_code == 200, response.get_data(as_text=True)
+                    results.setdefault(endpoint, []).append(counter.count)
+
+            for endpoint, counts in results.items():
+                print(f"{endpoint}: {counts}")
+                assert len(set(counts)) == 1, f"Query count grew with documents for {endpoint}: {counts}"
+            print("QUERY_COUNTS_OK")
+        finally:
+            db.session.rollback()
+
+
+if __name__ == "__main__":
+    main()
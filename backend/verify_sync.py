@@ -0,0 +1,83 @@
+"""
+Check that /api/sync deltas pick up hearing changes made after a sync token,
+and that reassigning a case tombstones its hearings for the previous advocate.
+Run:  python verify_sync.py
+The case it creates (with its hearing) is deleted through the API at the end.
+"""
+
+from flask_jwt_extended import create_access_token
+
+from app import create_app
+from models.user import User
+
+
+def auth_header(token):
+    return {"Authorization": f"Bearer {token}"}
+
+
+def sync(client, headers, since=None):
+    response = client.get("/api/sync", headers=headers, query_string={"since": since} if since else {})
+    assert response.status_code == 200, response.get_data(as_text=True)
+    return response.get_json()
+
+
+def main():
+    app = create_app()
+    with app.app_context():
+        client = app.test_client()
+        court = User.query.filter_by(role="court").first()
+        advocate, other_advocate = User.query.filter_by(role="advocate").order_by(User.id).limit(2).all()
+        assert court and other_advocate, "Seed the database (two advocates) before running this check"
+        court_headers = auth_header(create_access_token(identity=str(court.id)))
+        advocate_headers = auth_header(create_access_token(identity=str(advocate.id)))
+
+        created = client.post(
+            "/api/cases",
+            headers=court_headers,
+            json={
+                "title": "Sync check",
+                "petitioner": "Sync Check Petitioner",
+                "respondent": "Sync Check Respondent",
+                "advocateId": advocate.id,
+            },
+        )
+        assert created.status_code == 201, created.get_json()
+        case_id = created.get_json()["case"]["databaseId"]
+
+        try:
+            hearing = client.post(
+                "/api/hearings",
+                headers=court_headers,
+                json={"caseId": case_id, "date": "2030-01-15", "type": "Case Hearing"},
+            )
+            assert hearing.status_code == 201, hearing.get_json()
+            hearing_id = hearing.get_json()["hearing"]["id"]
+
+            token = sync(client, advocate_headers)["token"]
+            updated = client.put(
+                f"/api/hearings/{hearing_id}",
+                headers=court_headers,
+                json={"notes": "Rescheduled by verify_sync.py"},
+            )
+            assert updated.status_code == 200, updated.get_json()
+
+            delta = sync(client, advocate_headers, token)
+            assert not delta["full"], delta
+            hearing_ids = [row["id"] for row in delta["changes"].get("hearings", [])]
+            assert hearing_id in hearing_ids, f"Hearing {hearing_id} missing from delta: {hearing_ids}"
+            print(f"Hearing change in delta: {hearing_ids}")
+
+            token = delta["token"]
+            reassigned = client.put(f"/api/cases/{case_id}", headers=court_headers, json={"advocateId": other_advocate.id})
+            assert reassigned.status_code == 200, reassigned.get_json()
+            deleted = sync(client, advocate_headers, token)["deleted"]
+            assert case_id in deleted.get("cases", []), f"Case {case_id} not tombstoned: {deleted}"
+            assert hearing_id in deleted.get("hearings", []), f"Hearing {hearing_id} not tombstoned: {deleted}"
+            print(f"Tombstones after reassignment: {deleted}")
+            print("SYNC_OK")
+        finally:
+            client.delete(f"/api/cases/{case_id}", headers=court_headers)
+
+
+if __name__ == "__main__":
+    main()
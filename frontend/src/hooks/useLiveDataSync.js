@@ -1,9 +1,45 @@
 import { useEffect, useRef } from 'react';
-import { DATA_SYNC_EVENT, DATA_SYNC_STORAGE_KEY } from '../services/api';
+import { DATA_SYNC_EVENT, DATA_SYNC_STORAGE_KEY, eventsAPI, syncAPI } from '../services/api';
 
+export const syncRowId = (row) => row.databaseId ?? row.id;
+
+// Applies one entity's /api/sync delta to a list held in state: changed rows
+// replace their old copy, deleted ids are dropped, and changed rows the list
+// did not hold are added when ``accept`` allows it.
+export function applySyncDelta(rows, delta, entity, { accept = () => true, compare } = {}) {
+  const changed = delta?.changes?.[entity] || [];
+  const deleted = new Set((delta?.deleted?.[entity] || []).map(String));
+  if (!changed.length && !deleted.size) return rows;
+
+  const updates = new Map(changed.map((row) => [String(syncRowId(row)), row]));
+  const merged = rows
+    .filter((row) => !deleted.has(String(syncRowId(row))))
+    .map((row) => {
+      const key = String(syncRowId(row));
+      const updated = updates.get(key);
+      updates.delete(key);
+      return updated || row;
+    });
+  const next = [...[...updates.values()].filter(accept), ...merged];
+  return compare ? next.sort(compare) : next;
+}
+
+export const syncDeltaTouches = (delta, entity) =>
+  Boolean(delta?.changes?.[entity]?.length || delta?.deleted?.[entity]?.length);
+
+// Calls ``sync`` on load, on local writes, on focus and on every change the
+// shared event stream reports. The interval only polls while that stream is
+// down, so a connected tab does not refetch on a timer as well.
+//
+// When ``sync`` returns ``{ syncToken }`` (the dashboard bootstrap's token),
+// later calls fetch /api/sync?since= and pass it as ``delta`` for the caller
+// to merge; ``delta`` is absent when a full reload is needed instead.
 export function useLiveDataSync(sync, { enabled = true, intervalMs = 15000, dependencies = [] } = {}) {
   const syncRef = useRef(sync);
   const syncInFlightRef = useRef(false);
+  const syncQueuedRef = useRef(null);
+  const streamOpenRef = useRef(false);
+  const syncTokenRef = useRef(null);
 
   useEffect(() => {
     syncRef.current = sync;
@@ -14,18 +50,44 @@ export function useLiveDataSync(sync, { enabled = true, intervalMs = 15000, depe
       return undefined;
     }
 
-    const runSync = async ({ silent = true } = {}) => {
+    const runSync = async (options = {}) => {
       if (syncInFlightRef.current) {
+        // Run once more when the current sync ends, so a burst of changes
+        // is not lost but also does not queue one request per event.
+        syncQueuedRef.current = { ...syncQueuedRef.current, ...options };
         return;
       }
 
       syncInFlightRef.current = true;
       try {
-        await syncRef.current?.({ silent });
+        let delta;
+        if (options.resync) {
+          // The stream dropped events; the delta could be incomplete too.
+          syncTokenRef.current = null;
+        }
+        if (syncTokenRef.current) {
+          const { data } = await syncAPI.changes(syncTokenRef.current);
+          syncTokenRef.current = data.full ? null : data.token;
+          if (!data.full) {
+            const changed = Object.keys(data.changes || {}).length || Object.keys(data.deleted || {}).length;
+            if (!changed) return;
+            delta = data;
+          }
+        }
+
+        const result = await syncRef.current?.({ silent: true, ...options, delta });
+        if (result?.syncToken) {
+          syncTokenRef.current = result.syncToken;
+        }
       } catch (error) {
         console.error('Live data sync failed:', error);
       } finally {
         syncInFlightRef.current = false;
+        const queued = syncQueuedRef.current;
+        if (queued) {
+          syncQueuedRef.current = null;
+          void runSync(queued);
+        }
       }
     };
 
@@ -47,6 +109,21 @@ export function useLiveDataSync(sync, { enabled = true, intervalMs = 15000, depe
 
     void runSync({ silent: false });
 
+    const unsubscribe = eventsAPI.subscribe({
+      onOpen: () => {
+        streamOpenRef.current = true;
+      },
+      onError: () => {
+        streamOpenRef.current = false;
+      },
+      onChange: (change) => {
+        void runSync({ silent: true, change });
+      },
+      onResync: () => {
+        void runSync({ silent: true, resync: true });
+      },
+    });
+
     window.addEventListener(DATA_SYNC_EVENT, syncSilently);
     window.addEventListener('focus', syncSilently);
     window.addEventListener('storage', handleStorage);
@@ -54,7 +131,7 @@ export function useLiveDataSync(sync, { enabled = true, intervalMs = 15000, depe
 
     const intervalId = intervalMs > 0
       ? window.setInterval(() => {
-          if (document.visibilityState === 'visible') {
+          if (document.visibilityState === 'visible' && !streamOpenRef.current) {
             syncSilently();
           }
         }, intervalMs)
@@ -65,6 +142,9 @@ export function useLiveDataSync(sync, { enabled = true, intervalMs = 15000, depe
       window.removeEventListener('focus', syncSilently);
       window.removeEventListener('storage', handleStorage);
       document.removeEventListener('visibilitychange', handleVisibilityChange);
+      unsubscribe();
+      streamOpenRef.current = false;
+      syncTokenRef.current = null;
 
       if (intervalId) {
         window.clearInterval(intervalId);
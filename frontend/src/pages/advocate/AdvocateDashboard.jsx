@@ -3,7 +3,7 @@ import { motion, AnimatePresence } from 'framer-motion';
 import { FileText, Calendar, Upload, CheckCircle, Clock, AlertTriangle, ChevronRight, Filter, Plus, MoreHorizontal, Search, ScanLine, Bell, Eye } from 'lucide-react';
 import FullCalendar from '@fullcalendar/react';
 import dayGridPlugin from '@fullcalendar/daygrid';
-import { DATA_SYNC_EVENT, casesAPI, tasksAPI, documentsAPI, hearingsAPI, notificationsAPI } from '../../services/api';
+import { DATA_SYNC_EVENT, dashboardAPI, documentsAPI } from '../../services/api';
 import { StatusBadge } from '../../components/shared/StatusBadge';
 import { useTheme } from '../../context/ThemeContext';
 import { QRCodeScanner } from '../../components/shared/QRCodeScanner';
@@ -23,6 +23,7 @@ export function AdvocateDashboard() {
   const navigate = useNavigate();
 
   const [cases, setCases] = useState([]);
+  const [caseCounts, setCaseCounts] = useState({ total: 0, active: 0 });
   const [tasks, setTasks] = useState([]);
   const [evidences, setEvidences] = useState([]);
   const [calendarEvents, setCalendarEvents] = useState([]);
@@ -34,19 +35,14 @@ export function AdvocateDashboard() {
 
     const fetchData = async () => {
       try {
-        const [casesRes, tasksRes, docsRes, calRes, notifRes] = await Promise.all([
-          casesAPI.list(),
-          tasksAPI.list(),
-          documentsAPI.list(),
-          hearingsAPI.calendar(),
-          notificationsAPI.list()
-        ]);
+        const { data } = await dashboardAPI.bootstrap();
         if (!isMounted) return;
-        setCases(casesRes.data.cases || casesRes.data || []);
-        setTasks(tasksRes.data.tasks || tasksRes.data || []);
-        setEvidences(docsRes.data.documents || docsRes.data || []);
-        setCalendarEvents(calRes.data.events || calRes.data || []);
-        setNotifications(notifRes.data.notifications || notifRes.data || []);
+        setCases(data.cases?.items || []);
+        setCaseCounts(data.caseCounts || { total: 0, active: 0 });
+        setTasks(data.tasks || []);
+        setEvidences(data.documents || []);
+        setCalendarEvents(data.calendar || []);
+        setNotifications(data.notifications || []);
       } catch (err) {
         console.error('Error fetching advocate data:', err);
       } finally {
@@ -92,7 +88,7 @@ export function AdvocateDashboard() {
   };
 
   const stats = [
-    { label: 'Active Cases', value: cases.length.toString(), icon: FileText, color: 'bg-orange-500', iconColor: 'text-white', trend: `${cases.filter(c => !['closed', 'dismissed'].includes(c.status)).length} active` },
+    { label: 'Active Cases', value: caseCounts.total.toString(), icon: FileText, color: 'bg-orange-500', iconColor: 'text-white', trend: `${caseCounts.active} active` },
     { label: "Today's Hearings", value: calendarEvents.length.toString(), icon: Calendar, color: 'bg-orange-500', iconColor: 'text-white', trend: 'On track' },
     { label: 'Pending Tasks', value: tasks.filter(t => t.status !== 'completed' && !t.completed).length.toString(), icon: Clock, color: 'bg-orange-500', iconColor: 'text-white', trend: `${tasks.filter(t => t.priority === 'high').length} urgent` },
     { label: 'Evidence', value: evidences.length.toString(), icon: Upload, color: 'bg-orange-500', iconColor: 'text-white', trend: `${evidences.filter(e => !e.verified).length} pending` },
@@ -8,9 +8,12 @@ import { Modal, ConfirmModal } from '../../components/shared/Modal';
 import { QRCodeViewer } from '../../components/shared/QRCodeViewer';
 import { QRCodeScanner } from '../../components/shared/QRCodeScanner';
 import { useToast } from '../../components/shared/Toast';
-import { casesAPI, analyticsAPI, courtroomsAPI } from '../../services/api';
+import { casesAPI, dashboardAPI } from '../../services/api';
 import { triggerBrowserDownload } from '../../utils/fileActions';
-import { CASE_STATUS_OPTIONS, formatDate, getCaseNumber, getCaseRouteId, getCaseType, isHttpUrl, toDateInputValue } from '../../utils/legalData';
+import { CASE_STATUS_OPTIONS, getCaseNumber, getCaseRouteId, getCaseType, isHttpUrl, toDateInputValue } from '../../utils/legalData';
+
+// Matches the dashboard bootstrap's first page (DASHBOARD_CASE_LIMIT).
+const CASE_PAGE_SIZE = 20;
 
 const defaultFormData = {
   title: '',
@@ -41,6 +44,8 @@ export function CourtDashboard() {
   const [formData, setFormData] = useState(defaultFormData);
 
   const [cases, setCases] = useState([]);
+  const [casesNext, setCasesNext] = useState(null);
+  const [loadingMoreCases, setLoadingMoreCases] = useState(false);
   const [courtrooms, setCourtrooms] = useState([]);
   const [qrLinks, setQrLinks] = useState(null);
   const [analyticsData, setAnalyticsData] = useState({ totalCases: 0, pendingCases: 0, todayHearings: 0, casesTrend: [], casesByType: [], dailyHearings: [] });
@@ -53,27 +58,20 @@ export function CourtDashboard() {
       setLoading(true);
     }
     try {
-      const [casesRes, dashRes, trendRes, typeRes, hearingsRes, perfRes, roomsRes] = await Promise.all([
-        casesAPI.list(),
-        analyticsAPI.dashboard(),
-        analyticsAPI.casesTrend(),
-        analyticsAPI.casesByType(),
-        analyticsAPI.dailyHearings(),
-        analyticsAPI.allAdvocates(),
-        courtroomsAPI.list(),
-      ]);
-      const dash = dashRes.data || {};
-      setCases(casesRes.data || []);
-      setCourtrooms(roomsRes.data || []);
+      const { data } = await dashboardAPI.bootstrap();
+      const dash = data.stats || {};
+      setCases(data.cases?.items || []);
+      setCasesNext(data.cases?.next || null);
+      setCourtrooms(data.courtrooms || []);
       setAnalyticsData({
         totalCases: dash.totalCases || 0,
         pendingCases: dash.pendingCases || 0,
         todayHearings: dash.todayHearings || 0,
-        casesTrend: trendRes.data || [],
-        casesByType: typeRes.data || [],
-        dailyHearings: hearingsRes.data || [],
+        casesTrend: data.casesTrend || [],
+        casesByType: data.casesByType || [],
+        dailyHearings: data.dailyHearings || [],
       });
-      setAdvocates(perfRes.data || []);
+      setAdvocates(data.advocates || []);
     } catch (err) {
       console.error('Error fetching court data:', err);
       if (!silent) {
@@ -90,35 +88,30 @@ export function CourtDashboard() {
     loadDashboard();
   }, []);
 
-  const handleExportCSV = () => {
-    const headers = ['Case Number', 'Title', 'Petitioner', 'Respondent', 'Type', 'Status', 'Priority', 'Judge', 'Court Room', 'Next Hearing'];
-    const rows = cases.map(c => [
-      getCaseNumber(c),
-      c.title,
-      c.petitioner,
-      c.respondent,
-      getCaseType(c),
-      c.status,
-      c.priority,
-      c.judge,
-      c.courtRoom || c.court_room_name,
-      formatDate(c.nextHearing || c.next_hearing)
-    ]);
-
-    const csvContent = [
-      headers.join(','),
-      ...rows.map(r => r.map(field => `"${String(field || '').replace(/"/g, '""')}"`).join(','))
-    ].join('\n');
-
-    const blob = new Blob([csvContent], { type: 'text/csv;charset=utf-8;' });
-    const link = document.createElement('a');
-    const url = URL.createObjectURL(blob);
-    link.setAttribute('href', url);
-    link.setAttribute('download', `cases_export_${new Date().toISOString().split('T')[0]}.csv`);
-    link.style.visibility = 'hidden';
-    document.body.appendChild(link);
-    link.click();
-      document.body.removeChild(link);
+  const loadMoreCases = async () => {
+    if (!casesNext || loadingMoreCases) return;
+    setLoadingMoreCases(true);
+    try {
+      const { data } = await casesAPI.list({ limit: CASE_PAGE_SIZE, cursor: casesNext });
+      setCases((currentCases) => [...currentCases, ...(data.items || [])]);
+      setCasesNext(data.next || null);
+    } catch (err) {
+      console.error('Error loading more cases:', err);
+      addToast({ type: 'error', title: 'Unable to load more cases', message: err.message || 'Please try again.' });
+    } finally {
+      setLoadingMoreCases(false);
+    }
+  };
+
+  const handleExportCSV = async () => {
+    // The dashboard only holds the newest page of cases; the server streams all of them.
+    try {
+      const response = await casesAPI.exportAllCsv();
+      triggerBrowserDownload(response.blob, response.filename || `cases_export_${new Date().toISOString().split('T')[0]}.csv`);
+    } catch (err) {
+      console.error('Error exporting cases CSV:', err);
+      addToast({ type: 'error', title: 'Unable to export cases', message: err.message || 'Please try again.' });
+    }
   };
 
   const exportCaseCSV = async (caseItem) => {
@@ -186,7 +179,7 @@ export function CourtDashboard() {
 
   const filteredCases = useMemo(() => {
     const query = searchId.trim().toLowerCase();
-    if (!query) return cases.slice(0, 5);
+    if (!query) return cases;
 
     return cases
       .filter((caseItem) =>
@@ -404,6 +397,13 @@ export function CourtDashboard() {
                 </tbody>
               </table>
             </div>
+            {casesNext && !searchId.trim() && (
+              <div className="flex justify-center mt-4">
+                <button onClick={loadMoreCases} disabled={loadingMoreCases} className="px-4 py-2 text-sm font-semibold text-red-500 hover:text-red-600 disabled:opacity-60">
+                  {loadingMoreCases ? 'Loading...' : 'Load more'}
+                </button>
+              </div>
+            )}
           </motion.div>
         </div>
 
@@ -29,7 +29,11 @@ export function HearingScheduler() {
 
   const fetchData = async () => {
     try {
-      const [casesRes, hearingsRes, roomsRes] = await Promise.all([casesAPI.list(), hearingsAPI.list(), courtroomsAPI.list()]);
+      const [casesRes, hearingsRes, roomsRes] = await Promise.all([
+        casesAPI.list({ fields: 'databaseId,caseNumber,title' }),
+        hearingsAPI.list(),
+        courtroomsAPI.list(),
+      ]);
       const caseRows = casesRes.data || [];
       const hearingRows = hearingsRes.data || [];
       const roomRows = roomsRes.data || [];
@@ -9,30 +9,38 @@ import { StatusBadge } from '../../components/shared/StatusBadge';
 import { useToast } from '../../components/shared/Toast';
 import { extractSharedCaseToken, formatDate, getCaseNumber, getCaseRouteId, isHttpUrl } from '../../utils/legalData';
 
+const CASE_PAGE_SIZE = 50;
+
 export function QRCodeCenter() {
   const navigate = useNavigate();
   const [searchParams] = useSearchParams();
   const { addToast } = useToast();
   const [cases, setCases] = useState([]);
+  const [casesNext, setCasesNext] = useState(null);
+  const [loadingCases, setLoadingCases] = useState(false);
   const [selectedCaseId, setSelectedCaseId] = useState('');
   const [scannerOpen, setScannerOpen] = useState(false);
   const [lookupQuery, setLookupQuery] = useState('');
   const [lookupResult, setLookupResult] = useState(null);
   const [selectedCaseLinks, setSelectedCaseLinks] = useState(null);
 
-  useEffect(() => {
-    const fetchCases = async () => {
-      try {
-        const res = await casesAPI.list();
-        const caseRows = res.data || [];
-        setCases(caseRows);
-        if (caseRows[0]?.databaseId) setSelectedCaseId(String(caseRows[0].databaseId));
-      } catch (err) {
-        console.error('Error fetching cases for QR center:', err);
-        addToast({ type: 'error', title: 'Unable to load QR cases', message: err.message || 'Please try again.' });
-      }
-    };
+  const fetchCases = useCallback(async (cursor = null) => {
+    setLoadingCases(true);
+    try {
+      const res = await casesAPI.list({ fields: 'databaseId,caseNumber,title,filingDate', limit: CASE_PAGE_SIZE, cursor });
+      const caseRows = res.data?.items || [];
+      setCases((currentCases) => (cursor ? [...currentCases, ...caseRows] : caseRows));
+      setCasesNext(res.data?.next || null);
+      if (!cursor && caseRows[0]?.databaseId) setSelectedCaseId(String(caseRows[0].databaseId));
+    } catch (err) {
+      console.error('Error fetching cases for QR center:', err);
+      addToast({ type: 'error', title: 'Unable to load QR cases', message: err.message || 'Please try again.' });
+    } finally {
+      setLoadingCases(false);
+    }
+  }, [addToast]);
 
+  useEffect(() => {
     fetchCases();
   }, []);
 
@@ -119,6 +127,11 @@ export function QRCodeCenter() {
               </option>
             ))}
           </select>
+          {casesNext && (
+            <button onClick={() => fetchCases(casesNext)} disabled={loadingCases} className="mt-2 text-sm font-semibold text-red-500 hover:text-red-600 disabled:opacity-60">
+              {loadingCases ? 'Loading...' : 'Load more cases'}
+            </button>
+          )}
 
           {selectedCase && (
             <div className="mt-6 flex flex-col items-center">
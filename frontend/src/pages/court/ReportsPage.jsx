@@ -2,7 +2,8 @@ import { useEffect, useMemo, useState } from 'react';
 import { motion } from 'framer-motion';
 import { BarChart3, Download, FileText, Gavel, PieChart, TrendingUp, Users } from 'lucide-react';
 import { Area, AreaChart, Bar, BarChart, CartesianGrid, Cell, Legend, Pie, PieChart as RechartsPie, ResponsiveContainer, Tooltip, XAxis, YAxis } from 'recharts';
-import { analyticsAPI, casesAPI } from '../../services/api';
+import { analyticsAPI, casesAPI, jobsAPI } from '../../services/api';
+import { triggerBrowserDownload } from '../../utils/fileActions';
 
 export function ReportsPage() {
   const [reportData, setReportData] = useState({
@@ -12,18 +13,18 @@ export function ReportsPage() {
     hearings: [],
     advocates: [],
   });
-  const [cases, setCases] = useState([]);
+  const [causeListStatus, setCauseListStatus] = useState('');
+  const [causeListError, setCauseListError] = useState('');
 
   useEffect(() => {
     const fetchData = async () => {
       try {
-        const [dashboardRes, trendRes, typeRes, hearingRes, advocateRes, casesRes] = await Promise.all([
+        const [dashboardRes, trendRes, typeRes, hearingRes, advocateRes] = await Promise.all([
           analyticsAPI.dashboard(),
           analyticsAPI.casesTrend(),
           analyticsAPI.casesByType(),
           analyticsAPI.dailyHearings(),
           analyticsAPI.allAdvocates(),
-          casesAPI.list(),
         ]);
 
         setReportData({
@@ -33,7 +34,6 @@ export function ReportsPage() {
           hearings: hearingRes.data || [],
           advocates: advocateRes.data || [],
         });
-        setCases(casesRes.data || []);
       } catch (err) {
         console.error('Error fetching reports data:', err);
       }
@@ -52,11 +52,11 @@ export function ReportsPage() {
     ];
   }, [reportData.advocates.length, reportData.dashboard]);
 
+  // Per-type totals come from the cases-by-type aggregate rather than the case list.
   const summaryRows = useMemo(() => {
     return reportData.types.map((typeItem) => {
-      const matchingCases = cases.filter((item) => item.caseType === typeItem.name);
-      const filed = matchingCases.length;
-      const disposed = matchingCases.filter((item) => ['closed', 'dismissed'].includes(item.status)).length;
+      const filed = typeItem.value || 0;
+      const disposed = typeItem.disposed || 0;
       const pending = filed - disposed;
       const rate = filed ? `${Math.round((disposed / filed) * 100)}%` : '0%';
       return {
@@ -67,7 +67,7 @@ export function ReportsPage() {
         rate,
       };
     });
-  }, [cases, reportData.types]);
+  }, [reportData.types]);
 
   const exportReport = () => {
     const rows = summaryRows.map((row) => `${row.type},${row.filed},${row.disposed},${row.pending},${row.rate}`);
@@ -81,6 +81,37 @@ export function ReportsPage() {
     document.body.removeChild(link);
   };
 
+  const exportAllCases = async () => {
+    try {
+      const response = await casesAPI.exportAllCsv();
+      triggerBrowserDownload(response.blob, response.filename || `cases_${new Date().toISOString().slice(0, 10)}.csv`);
+    } catch (err) {
+      console.error('Error exporting cases CSV:', err);
+    }
+  };
+
+  const exportCauseList = async () => {
+    const tomorrow = new Date();
+    tomorrow.setDate(tomorrow.getDate() + 1);
+    const hearingDate = tomorrow.toISOString().slice(0, 10);
+    setCauseListError('');
+    setCauseListStatus('Queued');
+    try {
+      // A full day's list can run to hundreds of reports, so it is rendered by a background job.
+      const { data } = await jobsAPI.create('case_reports', { filter: { hearingDate }, format: 'pdf' });
+      await jobsAPI.wait(data.job.id, {
+        onProgress: (job) => setCauseListStatus(job.status === 'running' ? `${job.message} (${job.progress}%)` : job.message),
+      });
+      const response = await jobsAPI.result(data.job.id);
+      triggerBrowserDownload(response.blob, response.filename || `cause-list-${hearingDate}.pdf`);
+    } catch (err) {
+      console.error('Error exporting cause list reports:', err);
+      setCauseListError(`Cause list export failed: ${err.message}`);
+    } finally {
+      setCauseListStatus('');
+    }
+  };
+
   return (
     <div className="space-y-6">
       <div className="flex items-center justify-between">
@@ -88,12 +119,28 @@ export function ReportsPage() {
           <motion.h1 initial={{ opacity: 0, y: -10 }} animate={{ opacity: 1, y: 0 }} className="text-3xl font-bold text-[#1a1a2e] dark:text-white mb-1">Reports & Analytics</motion.h1>
           <p className="text-[#6b6b80]">Court-level performance insights powered by the live analytics endpoints.</p>
         </div>
-        <motion.button whileHover={{ scale: 1.02 }} whileTap={{ scale: 0.98 }} onClick={exportReport} className="flex items-center gap-2 px-5 py-3 bg-red-500 hover:bg-red-600 text-white font-bold rounded-xl shadow-lg shadow-red-500/25 transition-all">
-          <Download className="w-5 h-5" />
-          Export
-        </motion.button>
+        <div className="flex items-center gap-3">
+          <motion.button whileHover={{ scale: 1.02 }} whileTap={{ scale: 0.98 }} onClick={exportAllCases} className="flex items-center gap-2 px-5 py-3 bg-white dark:bg-[#232338] border-2 border-[#e5e4df] dark:border-[#2d2d45] text-[#1a1a2e] dark:text-white font-bold rounded-xl transition-all">
+            <Download className="w-5 h-5" />
+            All Cases
+          </motion.button>
+          <motion.button whileHover={{ scale: 1.02 }} whileTap={{ scale: 0.98 }} onClick={exportCauseList} disabled={Boolean(causeListStatus)} className="flex items-center gap-2 px-5 py-3 bg-white dark:bg-[#232338] border-2 border-[#e5e4df] dark:border-[#2d2d45] text-[#1a1a2e] dark:text-white font-bold rounded-xl transition-all">
+            <Download className="w-5 h-5" />
+            {causeListStatus || "Tomorrow's Cause List"}
+          </motion.button>
+          <motion.button whileHover={{ scale: 1.02 }} whileTap={{ scale: 0.98 }} onClick={exportReport} className="flex items-center gap-2 px-5 py-3 bg-red-500 hover:bg-red-600 text-white font-bold rounded-xl shadow-lg shadow-red-500/25 transition-all">
+            <Download className="w-5 h-5" />
+            Export
+          </motion.button>
+        </div>
       </div>
 
+      {causeListError && (
+        <motion.div initial={{ opacity: 0, y: -10 }} animate={{ opacity: 1, y: 0 }}
+          className="p-4 bg-red-500/10 border-2 border-red-500/20 rounded-xl text-red-600 dark:text-red-400 text-sm font-medium"
+        >{causeListError}</motion.div>
+      )}
+
       <div className="grid grid-cols-2 lg:grid-cols-4 gap-4">
         {stats.map((stat, index) => (
           <motion.div key={stat.label} initial={{ opacity: 0, y: 20 }} animate={{ opacity: 1, y: 0 }} transition={{ delay: index * 0.08 }} className="p-5 rounded-2xl bg-white/80 dark:bg-[#232338] border-2 border-[#e5e4df] dark:border-[#2d2d45] shadow-sm">
@@ -1,7 +1,8 @@
-import { useEffect, useMemo, useState } from 'react';
+import { useMemo, useState } from 'react';
 import { motion, AnimatePresence } from 'framer-motion';
 import { Search, FileText, Calendar, Clock, Bell, ChevronRight, QrCode, AlertCircle, CheckCircle, Timer, TrendingUp, ScanLine } from 'lucide-react';
-import { DATA_SYNC_EVENT, casesAPI, hearingsAPI, notificationsAPI } from '../../services/api';
+import { dashboardAPI } from '../../services/api';
+import { applySyncDelta, syncDeltaTouches, useLiveDataSync } from '../../hooks/useLiveDataSync';
 import { StatusBadge } from '../../components/shared/StatusBadge';
 import { Modal } from '../../components/shared/Modal';
 import { QRCodeViewer } from '../../components/shared/QRCodeViewer';
@@ -12,40 +13,64 @@ import { useAuth } from '../../context/AuthContext';
 import { useNavigate } from 'react-router-dom';
 import { formatTime, getCaseNumber, getCaseRouteId } from '../../utils/legalData';
 
+// Cases in the bootstrap's first page (DASHBOARD_CASE_LIMIT on the server).
+const DASHBOARD_CASE_LIMIT = 20;
+
+const byLatestHearing = (left, right) =>
+  String(right.date || '').localeCompare(String(left.date || '')) || String(right.startTime || '').localeCompare(String(left.startTime || ''));
+const byLatestNotification = (left, right) => String(right.timestamp || '').localeCompare(String(left.timestamp || ''));
+
 export function PublicDashboard() {
   const [searchId, setSearchId] = useState('');
   const [selectedCase, setSelectedCase] = useState(null);
   const [showQR, setShowQR] = useState(false);
   const [showScanner, setShowScanner] = useState(false);
   const [userCases, setUserCases] = useState([]);
+  const [caseCounts, setCaseCounts] = useState({ total: 0, active: 0 });
   const [hearings, setHearings] = useState([]);
   const [notifications, setNotifications] = useState([]);
   const [loading, setLoading] = useState(true);
   const { user } = useAuth();
   const navigate = useNavigate();
 
-  useEffect(() => {
-    const fetchData = async () => {
-      try {
-        const [casesRes, hearingsRes, notifRes] = await Promise.all([
-          casesAPI.list(),
-          hearingsAPI.list(),
-          notificationsAPI.list()
-        ]);
-        setUserCases(casesRes.data.cases || casesRes.data || []);
-        setHearings(hearingsRes.data || []);
-        setNotifications(notifRes.data.notifications || notifRes.data || []);
-      } catch (err) {
-        console.error('Error fetching dashboard data:', err);
-      } finally {
+  const loadDashboard = async ({ silent = true, delta } = {}) => {
+    if (delta) {
+      // Merge the rows /api/sync reports instead of reloading every section.
+      setUserCases((current) => {
+        // The list is the newest page; older cases that change stay off it.
+        const oldestShown = Math.min(...current.map((item) => item.databaseId));
+        return applySyncDelta(current, delta, 'cases', {
+          accept: (item) => current.length < DASHBOARD_CASE_LIMIT || item.databaseId > oldestShown,
+          compare: (left, right) => right.databaseId - left.databaseId,
+        });
+      });
+      setHearings((current) => applySyncDelta(current, delta, 'hearings', { compare: byLatestHearing }));
+      setNotifications((current) => applySyncDelta(current, delta, 'notifications', { compare: byLatestNotification }));
+      if (syncDeltaTouches(delta, 'cases')) {
+        const { data } = await dashboardAPI.bootstrap(['caseCounts']);
+        setCaseCounts(data.caseCounts || { total: 0, active: 0 });
+      }
+      return undefined;
+    }
+
+    try {
+      const { data } = await dashboardAPI.bootstrap();
+      setUserCases(data.cases?.items || []);
+      setCaseCounts(data.caseCounts || { total: 0, active: 0 });
+      setHearings(data.hearings || []);
+      setNotifications(data.notifications || []);
+      return { syncToken: data.syncToken };
+    } catch (err) {
+      console.error('Error fetching dashboard data:', err);
+      return undefined;
+    } finally {
+      if (!silent) {
         setLoading(false);
       }
-    };
-    fetchData();
+    }
+  };
 
-    window.addEventListener(DATA_SYNC_EVENT, fetchData);
-    return () => window.removeEventListener(DATA_SYNC_EVENT, fetchData);
-  }, []);
+  useLiveDataSync(loadDashboard);
 
   const nextUpcomingHearing = useMemo(() => {
     const now = Date.now();
@@ -84,7 +109,7 @@ export function PublicDashboard() {
   };
 
   const stats = [
-    { label: 'Active Cases', value: userCases.length.toString(), icon: FileText, color: 'bg-[#1a1a2e]', iconColor: 'text-[#b4f461]', change: `${userCases.filter(c => !['closed', 'dismissed'].includes(c.status)).length} active` },
+    { label: 'Active Cases', value: caseCounts.total.toString(), icon: FileText, color: 'bg-[#1a1a2e]', iconColor: 'text-[#b4f461]', change: `${caseCounts.active} active` },
     { label: 'Next Hearing', value: nextHearingDate ? new Date(nextHearingDate).toLocaleDateString('en-GB', { day: 'numeric', month: 'short' }) : 'None', icon: Calendar, color: 'bg-[#1a1a2e]', iconColor: 'text-[#b4f461]', change: nextUpcomingHearing?.location || nextHearingCase?.courtRoom || 'No upcoming' },
     { label: 'Documents', value: userCases.reduce((sum, c) => sum + (c.documents?.length || 0), 0).toString(), icon: Clock, color: 'bg-[#1a1a2e]', iconColor: 'text-[#b4f461]', change: 'Total files' },
     { label: 'Notifications', value: notifications.length.toString(), icon: Bell, color: 'bg-[#1a1a2e]', iconColor: 'text-[#b4f461]', change: `${notifications.filter(n => !n.read).length} unread` },
@@ -143,7 +143,15 @@ export const casesAPI = {
   get: async (id) => ({ data: await request(`/cases/${id}`) }),
   reportLinks: async (id) => ({ data: await request(`/cases/${id}/report-links`) }),
   exportCsv: async (id) => requestBlob(`/cases/${id}/export.csv`),
+  exportAllCsv: async (params = {}) => requestBlob(withQuery('/cases/export.csv', params)),
   exportPdf: async (id) => requestBlob(`/cases/${id}/report.pdf`),
+  // payload: { caseIds: [...] } or { filter: { status, type, priority, advocateId, hearingDate } }, plus format 'pdf' | 'zip'
+  bulkReports: async (payload) =>
+    requestBlob('/cases/reports', {
+      method: 'POST',
+      headers: { 'Content-Type': 'application/json' },
+      body: JSON.stringify(payload),
+    }),
   create: async (payload) => {
     const data = await request('/cases', { method: 'POST', body: JSON.stringify(payload) });
     emitDataSync('cases');
@@ -298,6 +306,65 @@ export const analyticsAPI = {
   allAdvocates: async () => ({ data: await request('/analytics/all-advocates') }),
 };
 
+// Dashboard
+export const dashboardAPI = {
+  bootstrap: async (sections = []) =>
+    ({ data: await request(withQuery('/dashboard/bootstrap', { sections: sections.join(',') })) }),
+};
+
+export const syncAPI = {
+  changes: async (since) => ({ data: await request(withQuery('/sync', { since })) }),
+};
+
+// One EventSource per tab, shared by every subscriber; it closes when the
+// last one leaves and reopens with the new token after login or logout.
+const streamListeners = new Set();
+let streamSource = null;
+
+const notifyStream = (handler, payload) => {
+  streamListeners.forEach((listener) => listener[handler]?.(payload));
+};
+
+function openEventStream() {
+  const token = localStorage.getItem('token');
+  if (!token || typeof EventSource === 'undefined') return null;
+
+  // EventSource cannot send headers, so the token goes in the query string.
+  const source = new EventSource(withQuery(`${API_BASE}/events`, { jwt: token }));
+  source.addEventListener('open', () => notifyStream('onOpen'));
+  source.addEventListener('error', () => notifyStream('onError'));
+  source.addEventListener('change', (event) => notifyStream('onChange', JSON.parse(event.data)));
+  source.addEventListener('resync', () => notifyStream('onResync'));
+  return source;
+}
+
+function closeEventStream() {
+  streamSource?.close();
+  streamSource = null;
+}
+
+if (typeof window !== 'undefined') {
+  window.addEventListener(AUTH_CHANGE_EVENT, () => {
+    closeEventStream();
+    notifyStream('onError');
+    if (streamListeners.size) streamSource = openEventStream();
+  });
+}
+
+export const eventsAPI = {
+  // Returns an unsubscribe function. onOpen/onError report whether the stream
+  // is currently delivering changes.
+  subscribe: (listener) => {
+    streamListeners.add(listener);
+    if (!streamSource) streamSource = openEventStream();
+    if (streamSource?.readyState === EventSource.OPEN) listener.onOpen?.();
+    return () => {
+      streamListeners.delete(listener);
+      if (!streamListeners.size) closeEventStream();
+    };
+  },
+};
+
 // Court rooms
 export const courtroomsAPI = {
   list: async (params = {}) => ({ data: await request(withQuery('/courtrooms', params)) }),
@@ -308,3 +375,41 @@ export const courtroomsAPI = {
     return { data };
   },
 };
+
+// Background jobs
+const JOB_POLL_INTERVAL_MS = 1500;
+// A job nobody has started by then most likely has no run_jobs.py worker to pick it up.
+const JOB_QUEUED_TIMEOUT_MS = 30 * 1000;
+const JOB_TIMEOUT_MS = 10 * 60 * 1000;
+
+export const jobsAPI = {
+  list: async () => ({ data: await request('/jobs') }),
+  kinds: async () => ({ data: await request('/jobs/kinds') }),
+  get: async (id) => ({ data: await request(`/jobs/${id}`) }),
+  // kind: 'case_reports' | 'cases_csv' | 'send_email' | 'rebuild_rollups' | 'backfill_pendency'
+  create: async (kind, params = {}) =>
+    ({ data: await request('/jobs', { method: 'POST', body: JSON.stringify({ kind, params }) }) }),
+  result: async (id) => requestBlob(`/jobs/${id}/result`),
+  // Polls until the job succeeds; throws if it fails, is never started, or runs past the deadline.
+  // onProgress gets the job after each poll.
+  wait: async (id, { onProgress, queuedTimeoutMs = JOB_QUEUED_TIMEOUT_MS, timeoutMs = JOB_TIMEOUT_MS } = {}) => {
+    const startedAt = Date.now();
+    for (;;) {
+      const job = await request(`/jobs/${id}`);
+      onProgress?.(job);
+      if (job.status === 'succeeded') return job;
+      if (job.status === 'failed') {
+        throw new Error(job.error || 'Job failed');
+      }
+
+      const elapsed = Date.now() - startedAt;
+      if (job.status === 'queued' && elapsed > queuedTimeoutMs) {
+        throw new Error('No background worker picked up this job. Is run_jobs.py running?');
+      }
+      if (elapsed > timeoutMs) {
+        throw new Error('The job is taking too long. Check the job list later for its result.');
+      }
+      await new Promise((resolve) => setTimeout(resolve, JOB_POLL_INTERVAL_MS));
+    }
+  },
+};